@@ -0,0 +1,24 @@
+"""Benchmarks of simulators."""
+
+from gefest.tools.estimators.simulators.sound_wave.sound_interface import SoundSimulator
+
+from .common import POLYGONS, make_domain, make_population
+
+
+class SoundSimulatorEstimate:
+    """Times sound propagation simulation over simulation duration."""
+
+    params = [POLYGONS, [20, 100]]
+    param_names = ['n_polygons', 'duration']
+    number = 1
+    warmup_time = 0.1
+
+    def setup(self, n_polygons, duration):
+        """Creates simulator and structure."""
+        domain = make_domain(n_polygons)
+        self.structure = make_population(domain, 1)[0]
+        self.simulator = SoundSimulator(domain, duration)
+
+    def time_estimate(self, n_polygons, duration):
+        """Simulates one structure."""
+        self.simulator.estimate(self.structure)
@@ -0,0 +1,57 @@
+"""Benchmark of full genetic algorithm generation."""
+
+import tempfile
+
+from gefest.core.configs.optimization_params import OptimizationParams
+from gefest.core.utils.rng import set_seed
+from gefest.tools.optimizers.GA.GA import BaseGA
+
+from .common import SEED
+
+
+class CircleGeneration:
+    """Times one ``BaseGA`` generation of synthetic circle case."""
+
+    params = [[20, 50]]
+    param_names = ['pop_size']
+    number = 1
+
+    def setup(self, pop_size):
+        """Creates optimizer with evaluated initial population."""
+        from cases.synthetic.circle.single_objective import AreaLengthRatio, domain_cfg
+
+        set_seed(SEED)
+        self.log_dir = tempfile.TemporaryDirectory()
+        opt_params = OptimizationParams(
+            domain=domain_cfg,
+            n_steps=1,
+            pop_size=pop_size,
+            mutations=['rotate_poly', 'resize_poly', 'add_point', 'drop_point', 'pos_change_point'],
+            mutation_each_prob=[0.125, 0.125, 0.15, 0.35, 0.25],
+            crossovers=['polygon_level', 'structure_level'],
+            crossover_each_prob=[0.0, 1.0],
+            selector='tournament_selection',
+            postprocess_rules=[
+                'not_out_of_bounds',
+                'valid_polygon_geom',
+                'not_self_intersects',
+                'not_too_close_polygons',
+                'not_too_close_points',
+            ],
+            objectives=[AreaLengthRatio(domain_cfg)],
+            extra=5,
+            n_jobs=0,
+            estimation_n_jobs=0,
+            log_dir=self.log_dir.name,
+            golem_genetic_scheme_type='steady_state',
+            rng=SEED,
+        )
+        self.optimizer = BaseGA(opt_params)
+
+    def teardown(self, pop_size):
+        """Removes logs."""
+        self.log_dir.cleanup()
+
+    def time_generation(self, pop_size):
+        """Runs one generation."""
+        self.optimizer.optimize()
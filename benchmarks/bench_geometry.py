@@ -0,0 +1,20 @@
+"""Benchmarks of random structures generation."""
+
+from gefest.core.geometry.utils import get_random_structure
+
+from .common import POINTS, POLYGONS, make_domain
+
+
+class RandomStructure:
+    """Times ``get_random_structure`` over polygons and points numbers."""
+
+    params = [POLYGONS, POINTS]
+    param_names = ['n_polygons', 'n_points']
+
+    def setup(self, n_polygons, n_points):
+        """Creates domain."""
+        self.domain = make_domain(n_polygons, n_points)
+
+    def time_get_random_structure(self, n_polygons, n_points):
+        """Generates one structure."""
+        get_random_structure(self.domain)
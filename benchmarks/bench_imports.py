@@ -0,0 +1,54 @@
+"""Benchmarks of import time and parallel workers startup.
+
+Each call runs fresh interpreter, so timings include interpreter startup
+and imports not cached by previous benchmarks.
+"""
+
+import subprocess
+import sys
+
+WORKER_SPAWN = """
+import math
+from gefest.core.utils.parallel_manager import BaseParallelDispatcher
+
+dispatcher = BaseParallelDispatcher(2, 0, backend='{backend}')
+dispatcher.exec_parallel(math.sqrt, [(idx,) for idx in range(4)], flatten=False)
+dispatcher.close()
+"""
+
+
+def run_python(code: str) -> None:
+    """Runs code in new interpreter."""
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+class ImportModule:
+    """Times import of configuration, CLI runner and lazily loaded packages."""
+
+    params = [
+        [
+            'gefest.core.configs.optimization_params',
+            'gefest.core.configs.utils',
+            'gefest.tools.run_experiment',
+            'gefest.tools.estimators',
+            'gefest.tools.optimizers',
+        ],
+    ]
+    param_names = ['module']
+    number = 1
+
+    def time_import(self, module):
+        """Imports module."""
+        run_python(f'import {module}')
+
+
+class WorkerSpawn:
+    """Times startup of process workers with the first task."""
+
+    params = [['loky', 'multiprocessing']]
+    param_names = ['backend']
+    number = 1
+
+    def time_first_task(self, backend):
+        """Creates dispatcher and runs tasks in its workers."""
+        run_python(WORKER_SPAWN.format(backend=backend))
@@ -0,0 +1,72 @@
+"""Benchmarks of populations logging."""
+
+import tempfile
+
+from gefest.core.utils.functions import parse_structs
+from gefest.core.utils.loaders import iter_structs, load_packed
+from gefest.core.utils.logger import LogDispatcher
+
+from .common import POINTS, make_domain, make_population
+
+
+class LogPopulation:
+    """Times ``LogDispatcher.log_pop`` over population size, points number and format."""
+
+    params = [[50, 200], POINTS, ['json', 'npz']]
+    param_names = ['pop_size', 'n_points', 'log_format']
+
+    def setup(self, pop_size, n_points, log_format):
+        """Generates population and log directory."""
+        pop = make_population(make_domain(4, n_points), 10)
+        self.pop = [pop[idx % len(pop)] for idx in range(pop_size)]
+        self.log_dir = tempfile.TemporaryDirectory()
+        self.log_dispatcher = LogDispatcher(self.log_dir.name, 'bench', log_format)
+        self.sync_log_dispatcher = LogDispatcher(self.log_dir.name, 'sync', log_format, False)
+
+    def teardown(self, pop_size, n_points, log_format):
+        """Removes logs."""
+        self.log_dispatcher.close()
+        self.log_dir.cleanup()
+
+    def time_log_pop(self, pop_size, n_points, log_format):
+        """Queues population for background writing, the time optimizer waits."""
+        self.log_dispatcher.log_pop(self.pop, '1')
+
+    def time_log_pop_sync(self, pop_size, n_points, log_format):
+        """Serializes and writes population."""
+        self.sync_log_dispatcher.log_pop(self.pop, '1')
+
+
+class LoadPopulation:
+    """Times loading of json lines population log over loaders."""
+
+    params = [[200, 1000], POINTS]
+    param_names = ['pop_size', 'n_points']
+
+    def setup(self, pop_size, n_points):
+        """Writes population log."""
+        pop = make_population(make_domain(4, n_points), 10)
+        self.log_dir = tempfile.TemporaryDirectory()
+        log_dispatcher = LogDispatcher(self.log_dir.name, 'bench', background=False)
+        log_dispatcher.log_pop([pop[idx % len(pop)] for idx in range(pop_size)], '1')
+        self.path = f'{log_dispatcher.run_dir}/00001.log'
+
+    def teardown(self, pop_size, n_points):
+        """Removes logs."""
+        self.log_dir.cleanup()
+
+    def time_parse_structs(self, pop_size, n_points):
+        """Validates each structure."""
+        parse_structs(self.path)
+
+    def time_iter_structs_trusted(self, pop_size, n_points):
+        """Restores structures without validation."""
+        list(iter_structs(self.path, trusted=True))
+
+    def time_load_packed(self, pop_size, n_points):
+        """Decodes structures into arrays."""
+        load_packed(self.path)
+
+    def time_top_k(self, pop_size, n_points):
+        """Decodes ten best structures."""
+        list(iter_structs(self.path, trusted=True, top_k=10))
@@ -0,0 +1,94 @@
+"""Benchmarks of reproduction operators and postprocessing."""
+
+from gefest.core.opt.operators.crossovers import CrossoverTypes
+from gefest.core.opt.operators.mutations import MutationTypes
+from gefest.core.opt.postproc.resolve_errors import Postrocessor
+from gefest.core.opt.postproc.rules import Rules
+from gefest.core.opt.postproc.rules_base import PolygonRule
+
+from .common import POINTS, POLYGONS, RULE_NAMES, RULES, make_domain, make_population
+
+POP_SIZE = 20
+
+
+class Mutations:
+    """Times each mutation operator over population."""
+
+    params = [[m.name for m in MutationTypes], POLYGONS, POINTS]
+    param_names = ['mutation', 'n_polygons', 'n_points']
+
+    def setup(self, mutation, n_polygons, n_points):
+        """Generates population."""
+        self.domain = make_domain(n_polygons, n_points)
+        self.pop = make_population(self.domain, POP_SIZE)
+        self.operator = MutationTypes[mutation].value
+
+    def time_mutation(self, mutation, n_polygons, n_points):
+        """Mutates each individual."""
+        for ind in self.pop:
+            self.operator(ind.clone(), self.domain, 0)
+
+
+class Crossovers:
+    """Times each crossover operator over pairs of population."""
+
+    params = [[c.name for c in CrossoverTypes], POLYGONS, POINTS]
+    param_names = ['crossover', 'n_polygons', 'n_points']
+
+    def setup(self, crossover, n_polygons, n_points):
+        """Generates population."""
+        self.domain = make_domain(n_polygons, n_points)
+        self.pop = make_population(self.domain, POP_SIZE)
+        self.operator = CrossoverTypes[crossover].value
+
+    def time_crossover(self, crossover, n_polygons, n_points):
+        """Crosses neighbour individuals."""
+        for first, second in zip(self.pop, self.pop[1:]):
+            self.operator(first.clone(), second.clone(), self.domain)
+
+
+class PostprocessRules:
+    """Times validation and correction of each postprocessing rule."""
+
+    params = [RULE_NAMES, POLYGONS, POINTS]
+    param_names = ['rule', 'n_polygons', 'n_points']
+
+    def setup(self, rule, n_polygons, n_points):
+        """Generates population."""
+        self.domain = make_domain(n_polygons, n_points)
+        self.pop = make_population(self.domain, POP_SIZE)
+        self.rule = Rules[rule].value
+        self.polygon_rule = isinstance(self.rule, PolygonRule)
+
+    def time_validate(self, rule, n_polygons, n_points):
+        """Validates each individual."""
+        for ind in self.pop:
+            if self.polygon_rule:
+                self.rule.validate(ind, 0, self.domain)
+            else:
+                self.rule.validate(ind, self.domain)
+
+    def time_correct(self, rule, n_polygons, n_points):
+        """Corrects each individual."""
+        for ind in self.pop:
+            if self.polygon_rule:
+                self.rule.correct(ind.clone(), 0, self.domain)
+            else:
+                self.rule.correct(ind.clone(), self.domain)
+
+
+class Postprocess:
+    """Times ``Postrocessor.postprocess_structure`` with default rules."""
+
+    params = [POLYGONS, POINTS]
+    param_names = ['n_polygons', 'n_points']
+
+    def setup(self, n_polygons, n_points):
+        """Generates population."""
+        self.domain = make_domain(n_polygons, n_points)
+        self.pop = make_population(self.domain, POP_SIZE)
+
+    def time_postprocess_structure(self, n_polygons, n_points):
+        """Postprocesses each individual."""
+        for ind in self.pop:
+            Postrocessor.postprocess_structure(ind, RULES, self.domain)
@@ -0,0 +1,34 @@
+"""Benchmarks of multiobjective selections."""
+
+from gefest.core.opt.operators.multiobjective_selections import MOEAD, SPEA2
+from gefest.core.opt.operators.selections import tournament_selection
+from gefest.core.utils.rng import get_rng, set_seed
+
+from .common import SEED, make_domain, make_population
+
+
+class MultiObjectiveSelection:
+    """Times SPEA2 and MOEAD selection of half of population."""
+
+    params = [['spea2', 'moead'], [50, 200, 1000]]
+    param_names = ['selector', 'pop_size']
+
+    def setup(self, selector, pop_size):
+        """Generates population with random two objective fitness."""
+        pop = make_population(make_domain(), 10)
+        set_seed(SEED)
+        self.pop = [pop[idx % len(pop)].clone() for idx in range(pop_size)]
+        for ind, fitness in zip(self.pop, get_rng().random((pop_size, 2))):
+            ind.fitness = fitness.tolist()
+
+        selector_cls = {'spea2': SPEA2, 'moead': MOEAD}[selector]
+        self.selector = selector_cls(
+            single_demention_selection=tournament_selection,
+            init_pop=self.pop,
+            moead_n_neighbors=5,
+            steps=100,
+        )
+
+    def time_select(self, selector, pop_size):
+        """Selects half of population."""
+        self.selector(list(self.pop), len(self.pop) // 2)
@@ -0,0 +1,66 @@
+"""Shared fixtures of GEFEST benchmarks.
+
+All benchmarks generate their inputs with fixed seed,
+so timings of different runs are comparable.
+"""
+
+from gefest.core.geometry import Structure
+from gefest.core.geometry.domain import Domain
+from gefest.core.geometry.utils import get_random_structure
+from gefest.core.opt.postproc.resolve_errors import Postrocessor
+from gefest.core.opt.postproc.rules import Rules
+from gefest.core.utils.rng import set_seed
+
+SEED = 42
+
+POLYGONS = [1, 4, 8]
+"""Scale sweep over number of polygons in structure."""
+
+POINTS = [8, 16, 32]
+"""Scale sweep over number of points in polygon."""
+
+RULE_NAMES = [
+    'not_out_of_bounds',
+    'valid_polygon_geom',
+    'not_self_intersects',
+    'not_too_close_polygons',
+    'not_too_close_points',
+]
+"""Rules applicable without prohibited area."""
+
+RULES = [Rules[name].value for name in RULE_NAMES]
+
+
+def make_domain(n_polygons: int = 1, n_points: int = 16) -> Domain:
+    """Creates square domain with fixed number of polygons and points."""
+    return Domain(
+        allowed_area=[
+            [0, 0],
+            [0, 100],
+            [100, 100],
+            [100, 0],
+            [0, 0],
+        ],
+        name='main',
+        min_poly_num=n_polygons,
+        max_poly_num=n_polygons,
+        min_points_num=n_points,
+        max_points_num=n_points,
+        polygon_side=0.0001,
+        min_dist_from_boundary=0.0001,
+        geometry_is_convex=True,
+        geometry_is_closed=True,
+        geometry='2D',
+    )
+
+
+def make_population(domain: Domain, size: int, seed: int = SEED) -> list[Structure]:
+    """Generates valid random structures."""
+    set_seed(seed)
+    pop = []
+    while len(pop) < size:
+        ind = Postrocessor.postprocess_structure(get_random_structure(domain), RULES, domain)
+        if ind is not None and ind.polygons:
+            pop.append(ind)
+
+    return pop
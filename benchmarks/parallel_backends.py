@@ -0,0 +1,93 @@
+"""Compares process and thread backends of reproduction operations.
+
+Times sampling, crossover and mutation steps of synthetic circle
+and sound waves cases for each parallel backend. Estimation is not timed,
+it does not depend on reproduction backend.
+
+Usage:
+    python -m benchmarks.parallel_backends --n-jobs 4 --steps 5 --pop-size 50
+"""
+
+import argparse
+import importlib
+import json
+import time
+
+from gefest.core.configs.optimization_params import OptimizationParams
+from gefest.core.opt import strategies
+from gefest.core.utils.parallel_manager import BaseParallelDispatcher, ParallelBackends
+from gefest.core.utils.rng import set_seed
+from gefest.tools.samplers.standard.standard import StandardSampler
+
+CASES = {
+    'circle': 'cases.synthetic.circle.single_objective',
+    'sound_waves': 'cases.sound_waves.configuration.config_parallel',
+}
+
+
+def with_backend(
+    opt_params: OptimizationParams,
+    backend: ParallelBackends,
+    n_jobs: int,
+    seed: int,
+) -> OptimizationParams:
+    """Replaces run dispatcher of already created configuration."""
+    opt_params.n_jobs = n_jobs
+    opt_params.parallel_backend = backend
+    opt_params.parallel_dispatcher = BaseParallelDispatcher(n_jobs, seed, backend=backend)
+    opt_params.sampler = StandardSampler(opt_params)
+    return opt_params
+
+
+def time_reproduction(opt_params: OptimizationParams, steps: int, pop_size: int) -> dict:
+    """Returns seconds spent in sampling and each generation reproduction."""
+    crossover = getattr(strategies, opt_params.crossover_strategy)(opt_params=opt_params)
+    mutation = getattr(strategies, opt_params.mutation_strategy)(opt_params=opt_params)
+
+    start = time.perf_counter()
+    pop = opt_params.sampler(pop_size)
+    sampling = time.perf_counter() - start
+
+    generations = []
+    for _ in range(steps):
+        start = time.perf_counter()
+        pop = mutation(crossover(pop))[:pop_size]
+        generations.append(time.perf_counter() - start)
+
+    opt_params.parallel_dispatcher.close()
+    return {'sampling': sampling, 'generations': generations}
+
+
+def main() -> None:
+    """Runs benchmark and prints results as json."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--cases', nargs='+', default=list(CASES), choices=list(CASES))
+    parser.add_argument('--backends', nargs='+', default=[b.name for b in ParallelBackends])
+    parser.add_argument('--n-jobs', type=int, default=-1)
+    parser.add_argument('--steps', type=int, default=3)
+    parser.add_argument('--pop-size', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=str, default=None, help='Path to save json results.')
+    args = parser.parse_args()
+
+    results = {}
+    for case in args.cases:
+        opt_params = importlib.import_module(CASES[case]).opt_params
+        for backend in args.backends:
+            set_seed(args.seed)
+            with_backend(opt_params, ParallelBackends[backend], args.n_jobs, args.seed)
+            timings = time_reproduction(opt_params, args.steps, args.pop_size)
+            results[f'{case}/{backend}'] = timings
+            print(
+                f'{case:12} {backend:16}'
+                f' sampling {timings["sampling"]:8.3f}s'
+                f' generation {sum(timings["generations"]) / args.steps:8.3f}s',
+            )
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
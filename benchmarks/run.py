@@ -0,0 +1,143 @@
+"""Runs GEFEST benchmarks and compares timings with saved baseline.
+
+Benchmarks follow asv conventions, so the suite can also be run with asv:
+``bench_*.py`` modules contain classes with ``params``, ``param_names``,
+``setup``, ``teardown`` and ``time_*`` methods. Each benchmark is called
+for every combination of parameters, random generator is reseeded before
+each repeat. Benchmarks with ``warmup_time`` are called untimed
+for that number of seconds first, e.g. to compile numba functions.
+Minimal time of one call over repeats is reported.
+
+Usage:
+    python -m benchmarks.run --save baseline.json
+    python -m benchmarks.run --compare baseline.json --filter Mutations
+"""
+
+import argparse
+import datetime
+import importlib
+import inspect
+import itertools
+import json
+import platform
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Iterator
+
+from loguru import logger
+
+from gefest.core.utils.rng import set_seed
+
+from .common import SEED
+
+
+def discover(pattern: str = '') -> Iterator[tuple[str, type, str]]:
+    """Yields module name, benchmark class and method name of matching benchmarks."""
+    for path in sorted(Path(__file__).parent.glob('bench_*.py')):
+        module = importlib.import_module(f'{__package__}.{path.stem}')
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__:
+                continue
+
+            for method in sorted(name for name in dir(cls) if name.startswith('time_')):
+                if re.search(pattern, f'{path.stem}.{cls.__name__}.{method}'):
+                    yield path.stem, cls, method
+
+
+def param_sets(cls: type) -> list[tuple]:
+    """Returns all combinations of benchmark parameters."""
+    params = getattr(cls, 'params', [])
+    return list(itertools.product(*params)) if params else [()]
+
+
+def time_call(cls: type, method: str, params: tuple, repeat: int, number: int) -> float:
+    """Returns minimal time of one benchmark call in seconds."""
+    bench = cls()
+    set_seed(SEED)
+    if hasattr(bench, 'setup'):
+        bench.setup(*params)
+
+    func: Callable = getattr(bench, method)
+    number = getattr(cls, 'number', number)
+    timings = []
+    try:
+        warmup_end = time.perf_counter() + getattr(cls, 'warmup_time', 0)
+        while time.perf_counter() < warmup_end:
+            func(*params)
+
+        for _ in range(repeat):
+            set_seed(SEED)
+            start = time.perf_counter()
+            for _ in range(number):
+                func(*params)
+
+            timings.append((time.perf_counter() - start) / number)
+    finally:
+        if hasattr(bench, 'teardown'):
+            bench.teardown(*params)
+
+    return min(timings)
+
+
+def benchmark_key(module: str, cls: type, method: str, params: tuple) -> str:
+    """Returns benchmark name with its parameters."""
+    names = getattr(cls, 'param_names', [])
+    args = ', '.join(f'{name}={value}' for name, value in zip(names, params))
+    return f'{module}.{cls.__name__}.{method}({args})'
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[tuple[str, float]]:
+    """Returns benchmarks slower than baseline more than threshold times."""
+    return [
+        (key, value / baseline[key])
+        for key, value in results.items()
+        if key in baseline and value > threshold * baseline[key]
+    ]
+
+
+def main() -> None:
+    """Runs benchmarks, saves and compares results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--filter', type=str, default='', help='Regex over benchmark names.')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--number', type=int, default=3, help='Calls per repeat.')
+    parser.add_argument('--save', type=str, default=None, help='Path to save json results.')
+    parser.add_argument('--compare', type=str, default=None, help='Path to json baseline.')
+    parser.add_argument('--threshold', type=float, default=1.25)
+    args = parser.parse_args()
+    logger.remove()
+
+    results = {}
+    for module, cls, method in discover(args.filter):
+        for params in param_sets(cls):
+            key = benchmark_key(module, cls, method, params)
+            results[key] = time_call(cls, method, params, args.repeat, args.number)
+            print(f'{results[key] * 1e3:12.3f} ms  {key}')
+
+    if args.save:
+        meta = {
+            'date': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'processor': platform.processor(),
+            'seed': SEED,
+        }
+        with open(args.save, 'w') as file:
+            json.dump({'meta': meta, 'results': results}, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)['results']
+
+        regressions = compare(results, baseline, args.threshold)
+        for key, ratio in regressions:
+            print(f'REGRESSION x{ratio:.2f}  {key}')
+
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -131,7 +131,7 @@ opt_params = OptimizationParams(
         SoundFieldFitness(
             domain_cfg,
             SoundSimulator(domain_cfg, 200),
-            str(Path(__file__).parent) + '\\figures\\bottom_square.txt',
+            str(Path(__file__).parent / 'figures' / 'bottom_square.txt'),
             -1,
         ),
     ],
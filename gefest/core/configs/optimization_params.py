@@ -2,15 +2,12 @@ from enum import Enum
 from functools import partial
 from typing import Any, Callable, Optional, Union
 
-from golem.core.optimisers.adaptive.operator_agent import MutationAgentTypeEnum
-from golem.core.optimisers.genetic.operators.inheritance import GeneticSchemeTypesEnum
-from golem.core.optimisers.genetic.operators.selection import SelectionTypesEnum
-from pydantic import BaseModel, ConfigDict, model_validator
+import numpy as np
+from pydantic import BaseModel, ConfigDict, PrivateAttr, model_validator
 
 from gefest.core.configs.tuner_params import TunerParams
 from gefest.core.geometry.datastructs.structure import Structure
 from gefest.core.geometry.domain import Domain
-from gefest.core.opt.adapters.structure import StructureAdapter
 from gefest.core.opt.objective.objective import Objective
 from gefest.core.opt.operators.crossovers import CrossoverTypes, panmixis
 from gefest.core.opt.operators.multiobjective_selections import (
@@ -20,7 +17,10 @@ from gefest.core.opt.operators.mutations import MutationTypes
 from gefest.core.opt.operators.selections import SelectionTypes
 from gefest.core.opt.postproc.resolve_errors import Postrocessor
 from gefest.core.opt.postproc.rules import PolygonRule, Rules, StructureRule
-from gefest.core.utils.logger import LogDispatcher
+from gefest.core.utils.lazy import LazyObject
+from gefest.core.utils.logger import LogDispatcher, PopulationWriters
+from gefest.core.utils.parallel_manager import BaseParallelDispatcher, ParallelBackends
+from gefest.core.utils.rng import set_seed
 from gefest.tools.optimizers import OptimizerTypes
 from gefest.tools.samplers.standard.standard import StandardSampler
 
@@ -54,12 +54,46 @@ ValidMultiObjectiveSelection = Enum(
     type=str,
 )
 
+ValidParallelBackend = Enum(
+    'ValidParallelBackend',
+    ((value, value) for value in [r.name for r in ParallelBackends]),
+    type=str,
+)
+
+ValidLogFormat = Enum(
+    'ValidLogFormat',
+    ((value, value) for value in [r.name for r in PopulationWriters]),
+    type=str,
+)
+
 ValidOptimizer = Enum(
     'ValidOptimizer',
     ((value, value) for value in [r.name for r in OptimizerTypes]),
     type=str,
 )
 
+# Names of GOLEM enums members, GOLEM is not imported unless its optimizer or tuner is used.
+ValidGolemGeneticScheme = Enum(
+    'ValidGolemGeneticScheme',
+    ((value, value) for value in ['steady_state', 'generational', 'parameter_free']),
+    type=str,
+)
+
+ValidGolemMutationAgent = Enum(
+    'ValidGolemMutationAgent',
+    (
+        (value, value)
+        for value in ['default', 'random', 'bandit', 'contextual_bandit', 'neural_bandit']
+    ),
+    type=str,
+)
+
+ValidGolemSelection = Enum(
+    'ValidGolemSelection',
+    ((value, value) for value in ['tournament', 'spea2']),
+    type=str,
+)
+
 
 class OptimizationParams(BaseModel):
     """GEFEST configuration dataclass.
@@ -144,6 +178,19 @@ class OptimizationParams(BaseModel):
     or even slow down the execution of the program.
     """
 
+    estimation_batch_size: Optional[int] = None
+    """Max number of structures evaluated with one ``evaluate_batch`` call of objective.
+        None to pass all structures to be evaluated on optimization step at once,
+        or split them into about four batches per core for parallel estimation.
+    """
+
+    cache_estimations: bool = False
+    """If True, objectives sharing estimator instance get its output for structure
+        from one estimation, see ``gefest.core.opt.objective.objective_eval.EstimatorCache``.
+        Enable only for deterministic estimators, whose outputs are not modified
+        in place by objectives.
+    """
+
     n_jobs: Optional[int] = -1
     """Nuber of cores to use in parallel execution of reproduction operations in GEFEST.
         n_jobs = -1 to use all cores,
@@ -152,6 +199,22 @@ class OptimizationParams(BaseModel):
         use 0 for debug GEFEST only.
     """
 
+    parallel_backend: Union[ParallelBackends, ValidParallelBackend] = 'loky'
+    """Backend for parallel execution of reproduction operations.
+        'loky' and 'multiprocessing' run tasks in worker processes,
+        'threads' runs them in threads of the main process.
+    """
+
+    parallel_dispatcher: Callable = BaseParallelDispatcher
+    """Parallel dispatcher shared by sampler and strategies during the whole run."""
+
+    rng: Optional[int] = None
+    """Seed for random generators.
+        Selection, mutations, crossovers, sampler and parallel workers get
+        independent generator streams spawned from it, so runs with equal seed
+        produce equal populations. None for unseeded run.
+    """
+
     early_stopping_timeout: int = 60
     """GOLEM argument.
     For details see https://thegolem.readthedocs.io/en/latest/api/parameters.html
@@ -163,8 +226,10 @@ class OptimizationParams(BaseModel):
         https://thegolem.readthedocs.io/en/latest/api/parameters.html
     """
 
-    golem_adapter: Callable = StructureAdapter
-    """Adapter for convertation GEFEST Structure into GOLEM OptGraph."""
+    golem_adapter: Callable = LazyObject('gefest.core.opt.adapters.structure.StructureAdapter')
+    """Adapter for convertation GEFEST Structure into GOLEM OptGraph.
+        Initialized only if GOLEM optimizer or tuner is used.
+    """
 
     tuner_cfg: Optional[TunerParams] = None
     """Configuration for GOLEM tuner wrap."""
@@ -178,22 +243,60 @@ class OptimizationParams(BaseModel):
     log_dispatcher: Callable = LogDispatcher
     """GEFEST logger."""
 
+    log_format: ValidLogFormat = 'json'
+    """Populations log format.
+        'json' to save json lines ``.log`` files readable with ``parse_structs``,
+        'npz' to save populations as NumPy arrays,
+        'history' to save each unique structure once with generations membership and lineage,
+        see ``gefest.core.utils.history``.
+    """
+
+    log_in_background: bool = True
+    """If True, populations logs are written in background thread."""
+
+    telemetry_callback: Optional[Callable[[dict], Any]] = None
+    """Called with telemetry dict after each generation of GEFEST GA,
+        the same data is written into ``telemetry.jsonl`` of run logs.
+    """
+
+    checkpoint_every: int = 0
+    """Save optimizer state every n generations and after the last one, 0 to disable.
+        Supported by GEFEST GA optimizer, configuration of other optimizers with it is invalid.
+    """
+
+    checkpoint_path: Optional[str] = None
+    """Checkpoint file path, ``checkpoint.pkl`` in run logs directory by default."""
+
+    resume_from: Optional[str] = None
+    """Path to checkpoint to continue optimization from.
+        Run must be configured as the interrupted one. Supported by GEFEST GA optimizer,
+        configuration of other optimizers with it is invalid.
+        Logging continues in run directory of the interrupted run.
+    """
+
+    warm_start_from: Optional[str] = None
+    """Directory of previous run logs to take initial population from.
+        ``pop_size`` best structures of its last population, valid in the current domain,
+        are used. Their fitness is reused if the run had the same objectives,
+        see ``gefest.core.opt.warm_start``.
+    """
+
     golem_keep_histoy: bool = False
     """Enables/disables GOLEM experiment historry serialization."""
 
-    golem_genetic_scheme_type: GeneticSchemeTypesEnum = 'steady_state'
+    golem_genetic_scheme_type: ValidGolemGeneticScheme = 'steady_state'
     """GOLEM configuration argument `genetic_scheme_type`.
         For details see:
             https://thegolem.readthedocs.io/en/latest/api/parameters.html
     """
 
-    golem_adaptive_mutation_type: MutationAgentTypeEnum = 'default'
+    golem_adaptive_mutation_type: ValidGolemMutationAgent = 'default'
     """GOLEM configuration argument `adaptive_mutation_type`.
         For details see:
             https://thegolem.readthedocs.io/en/latest/api/parameters.html
     """
 
-    golem_selection_type: SelectionTypesEnum = 'spea2'
+    golem_selection_type: ValidGolemSelection = 'spea2'
     """GOLEM configuration argument `selection_type`.
         For details see:
             https://thegolem.readthedocs.io/en/latest/api/parameters.html
@@ -202,11 +305,54 @@ class OptimizationParams(BaseModel):
     golem_surrogate_each_n_gen: int = 5
     """Frequency of usage surrogate model in `golem_surrogate` optimizer"""
 
+    _seed_sequence: np.random.SeedSequence = PrivateAttr(default=None)
+
+    def _init_rng(self) -> None:
+        """Creates root seed sequence and seeds process wide generator if seed is set."""
+        self._seed_sequence = np.random.SeedSequence(self.rng)
+        if self.rng is not None:
+            set_seed(self.spawn_seed())
+
+    def spawn_seed(self) -> np.random.SeedSequence:
+        """Returns seed of new independent random generator stream."""
+        return self._seed_sequence.spawn(1)[0]
+
+    def _init_parallel(self) -> None:
+        """Creates parallel dispatcher reused by all operations of run."""
+        if isinstance(self.parallel_backend, str):
+            self.parallel_backend = getattr(ParallelBackends, self.parallel_backend)
+
+        self.parallel_dispatcher = self.parallel_dispatcher(
+            self.n_jobs,
+            self.spawn_seed(),
+            backend=self.parallel_backend,
+        )
+
+    def _check_checkpoints(self) -> None:
+        """Checks that optimizer supports checkpoints if they are configured."""
+        if self.optimizer is OptimizerTypes.gefest_ga.value.load():
+            return
+
+        if self.resume_from or self.checkpoint_every:
+            raise ValueError(
+                'Checkpoints and resume_from are supported by gefest_ga optimizer only, '
+                f'got {self.optimizer.__name__}.',
+            )
+
+    def _init_golem_adapter(self) -> None:
+        """Creates GOLEM adapter if run uses GOLEM, so GOLEM is not imported otherwise."""
+        uses_golem = self.optimizer is not OptimizerTypes.gefest_ga.value.load()
+        if uses_golem or self.tuner_cfg is not None:
+            self.golem_adapter = self.golem_adapter(self.domain)
+
     @model_validator(mode='after')
     def create_classes_instances(self):
         """Selects and initializes specified modules."""
+        self._init_rng()
         if isinstance(self.optimizer, str):
-            self.optimizer = getattr(OptimizerTypes, self.optimizer).value
+            self.optimizer = getattr(OptimizerTypes, self.optimizer).value.load()
+
+        self._check_checkpoints()
 
         if isinstance(self.postprocess_rules[0], str):
             self.postprocess_rules = [getattr(Rules, name).value for name in self.postprocess_rules]
@@ -217,9 +363,6 @@ class OptimizationParams(BaseModel):
         if isinstance(self.crossovers[0], str):
             self.crossovers = [getattr(CrossoverTypes, name).value.func for name in self.crossovers]
 
-        if isinstance(self.golem_genetic_scheme_type, str):
-            self.selector = getattr(GeneticSchemeTypesEnum, self.golem_genetic_scheme_type.value)
-
         if isinstance(self.selector, str):
             self.selector = getattr(SelectionTypes, self.selector)
 
@@ -243,9 +386,15 @@ class OptimizationParams(BaseModel):
             rules=self.postprocess_rules,
             attempts=self.postprocess_attempts,
         )
+        self._init_parallel()
         self.sampler = self.sampler(opt_params=self)
-        self.golem_adapter = self.golem_adapter(self.domain)
-        self.log_dispatcher = self.log_dispatcher(self.log_dir, self.run_name)
+        self._init_golem_adapter()
+        self.log_dispatcher = self.log_dispatcher(
+            self.log_dir,
+            self.run_name,
+            log_format=getattr(self.log_format, 'value', self.log_format),
+            background=self.log_in_background,
+        )
 
         return self
 
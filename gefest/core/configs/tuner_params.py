@@ -2,8 +2,7 @@ import inspect
 from ctypes import Structure
 from typing import Callable, Union
 
-from hyperopt import hp
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from gefest.tools.tuners import utils
 
@@ -29,8 +28,8 @@ class TunerParams(BaseModel):
     tune_n_best: int = 1
     """Top tune_n_best structures from provided population to tune."""
 
-    hyperopt_dist: Union[Callable, str] = hp.uniform
-    """Random distribution function."""
+    hyperopt_dist: Union[Callable, str] = Field('uniform', validate_default=True)
+    """Random distribution function or name of ``hyperopt.hp`` function."""
 
     verbose: bool = True
     """GOLEM console info."""
@@ -63,6 +62,8 @@ class TunerParams(BaseModel):
     @classmethod
     def hyperopt_fun_validate(cls, value):
         """Checks if hyperopt distribution function exists."""
+        from hyperopt import hp
+
         if isinstance(value, str):
             r_ = inspect.getmembers(hp, inspect.isfunction)
             fun_names = [i[0] for i in r_]
@@ -1,4 +1,5 @@
 from .datastructs.point import Point
 from .datastructs.polygon import Polygon, PolyID
+from .datastructs.population import Population
 from .datastructs.structure import Structure
 from .utils import get_random_poly, get_random_structure
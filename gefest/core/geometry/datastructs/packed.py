@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from typing import Optional, Sequence, Union
+from uuid import UUID
+
+import numpy as np
+
+from .point import Point
+from .polygon import Polygon, PolyID
+from .structure import Structure
+
+ID_DTYPE = '<U36'
+"""NumPy dtype of packed structures and polygons ids."""
+
+_POLY_IDS = {poly_id.value: poly_id for poly_id in PolyID}
+
+
+def restore(cls: type, **fields):
+    """Creates dataclass instance from already validated fields, as unpickling does."""
+    obj = cls.__new__(cls)
+    obj.__dict__.update(fields)
+    return obj
+
+
+def points_from_coords(coords: np.ndarray) -> list[Point]:
+    """Creates points from coordinates array of shape ``(n_points, 2)`` without validation."""
+    return [restore(Point, x=x, y=y) for x, y in coords.tolist()]
+
+
+def encode_id(id_: Optional[Union[UUID, PolyID]]) -> str:
+    """Converts structure or polygon id into string."""
+    if id_ is None:
+        return ''
+
+    return id_.value if isinstance(id_, PolyID) else str(id_)
+
+
+def decode_id(value: str) -> Optional[Union[UUID, PolyID]]:
+    """Restores structure or polygon id from string."""
+    if not value:
+        return None
+
+    return _POLY_IDS[value] if value in _POLY_IDS else UUID(value)
+
+
+class PackedPopulation:
+    """Structure-of-arrays representation of population.
+
+    Points of all polygons are stored in one coordinates array,
+    polygons and structures are defined by offsets arrays:
+    points of i-th polygon are ``coords[poly_offsets[i]:poly_offsets[i + 1]]``,
+    polygons of j-th structure are ``struct_offsets[j]...struct_offsets[j + 1]``.
+    Fitness is padded with ``nan`` up to the longest one.
+    Extra characteristics are not packed.
+    Unpacking skips pydantic validation, values are restored as on unpickling.
+
+    Args:
+        coords (np.ndarray): Points coordinates, shape ``(n_points, 2)``.
+        poly_offsets (np.ndarray): Polygons offsets, shape ``(n_polygons + 1,)``.
+        struct_offsets (np.ndarray): Structures offsets, shape ``(n_structures + 1,)``.
+        poly_ids (np.ndarray): Polygons ids as strings, shape ``(n_polygons,)``.
+        struct_ids (np.ndarray): Structures ids as strings, shape ``(n_structures,)``.
+        fitness (np.ndarray): Fitness matrix, shape ``(n_structures, n_objectives)``.
+        fitness_len (np.ndarray): Fitness length of each structure, shape ``(n_structures,)``.
+
+    """
+
+    fields = (
+        'coords',
+        'poly_offsets',
+        'struct_offsets',
+        'poly_ids',
+        'struct_ids',
+        'fitness',
+        'fitness_len',
+    )
+
+    def __init__(
+        self,
+        coords: np.ndarray,
+        poly_offsets: np.ndarray,
+        struct_offsets: np.ndarray,
+        poly_ids: np.ndarray,
+        struct_ids: np.ndarray,
+        fitness: np.ndarray,
+        fitness_len: np.ndarray,
+    ) -> None:
+        self.coords = coords
+        self.poly_offsets = poly_offsets
+        self.struct_offsets = struct_offsets
+        self.poly_ids = poly_ids
+        self.struct_ids = struct_ids
+        self.fitness = fitness
+        self.fitness_len = fitness_len
+
+    @classmethod
+    def pack(cls, structures: Sequence[Structure]) -> PackedPopulation:
+        """Packs structures into arrays."""
+        polygons = [poly for struct in structures for poly in struct.polygons]
+        coords = np.array(
+            [(pt.x, pt.y) for poly in polygons for pt in poly.points],
+            dtype=float,
+        ).reshape(-1, 2)
+        poly_offsets = np.zeros(len(polygons) + 1, dtype=np.int64)
+        np.cumsum([len(poly.points) for poly in polygons], out=poly_offsets[1:])
+        struct_offsets = np.zeros(len(structures) + 1, dtype=np.int64)
+        np.cumsum([len(struct.polygons) for struct in structures], out=struct_offsets[1:])
+
+        fitness_len = np.array([len(struct.fitness) for struct in structures], dtype=np.int64)
+        fitness = np.full((len(structures), fitness_len.max(initial=0)), np.nan)
+        for idx, struct in enumerate(structures):
+            fitness[idx, : fitness_len[idx]] = struct.fitness
+
+        return cls(
+            coords=coords,
+            poly_offsets=poly_offsets,
+            struct_offsets=struct_offsets,
+            poly_ids=np.array([encode_id(poly.id_) for poly in polygons], dtype=ID_DTYPE),
+            struct_ids=np.array([encode_id(s.id_) for s in structures], dtype=ID_DTYPE),
+            fitness=fitness,
+            fitness_len=fitness_len,
+        )
+
+    def __len__(self) -> int:
+        return len(self.struct_offsets) - 1
+
+    def arrays(self) -> dict[str, np.ndarray]:
+        """Returns packed arrays by their names."""
+        return {name: getattr(self, name) for name in self.fields}
+
+    def polygon_indices(self, idx: int) -> range:
+        """Returns global indices of polygons of idx-th structure."""
+        return range(int(self.struct_offsets[idx]), int(self.struct_offsets[idx + 1]))
+
+    def polygon(self, poly_idx: int) -> Polygon:
+        """Unpacks polygon by its global index."""
+        coords = self.coords[self.poly_offsets[poly_idx] : self.poly_offsets[poly_idx + 1]]
+        return restore(
+            Polygon,
+            points=points_from_coords(coords),
+            id_=decode_id(str(self.poly_ids[poly_idx])),
+        )
+
+    def structure(self, idx: int) -> Structure:
+        """Unpacks structure with its polygons and fitness."""
+        return restore(
+            Structure,
+            polygons=tuple(self.polygon(poly_idx) for poly_idx in self.polygon_indices(idx)),
+            fitness=self.fitness[idx, : self.fitness_len[idx]].tolist(),
+            extra_characteristics={},
+            id_=decode_id(str(self.struct_ids[idx])),
+        )
+
+    def unpack(self) -> list[Structure]:
+        """Unpacks all structures."""
+        return [self.structure(idx) for idx in range(len(self))]
@@ -1,3 +1,4 @@
+import copy
 from enum import Enum
 from typing import Optional, Union
 from uuid import UUID, uuid4
@@ -42,3 +43,13 @@ class Polygon:
 
     def __contains__(self, item):
         return item in self.points
+
+    def copy(self) -> 'Polygon':
+        """Returns independent copy of polygon.
+
+        Points are copied as well, so the result can be safely modified in place.
+        Intended to be called by operators right before writing into shared polygon.
+        """
+        new_poly = copy.copy(self)
+        new_poly.points = [copy.copy(pt) for pt in self.points]
+        return new_poly
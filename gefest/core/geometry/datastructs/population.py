@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from typing import Iterable, Sequence, Union
+
+import numpy as np
+
+from .structure import Structure
+
+
+class Population(list):
+    """List of structures with population fitness matrix.
+
+    Fitness of all individuals is available as contiguous array of shape
+    ``(n_individuals, n_objectives)``. The array is built lazily and dropped
+    on every change of the list. Fitness of individuals must be changed
+    with ``set_fitness``, which writes it both into structure and array,
+    direct changes of ``Structure.fitness`` are not tracked.
+    Individuals without fitness are represented with ``nan`` rows.
+
+    Population is a ``list`` subclass, so it can be passed anywhere
+    ``list[Structure]`` is expected.
+
+    Args:
+        individuals (Iterable[Structure]): Population individuals.
+
+    """
+
+    def __init__(self, individuals: Iterable[Structure] = ()) -> None:
+        super().__init__(individuals)
+        self._fitness = None
+
+    @classmethod
+    def wrap(cls, pop: Union[Population, Sequence[Structure]]) -> Population:
+        """Returns ``pop`` itself if it is Population, new Population otherwise."""
+        return pop if isinstance(pop, cls) else cls(pop)
+
+    @property
+    def fitness(self) -> np.ndarray:
+        """Fitness matrix of shape ``(n_individuals, n_objectives)``."""
+        if self._fitness is None:
+            self._fitness = self._build_fitness()
+
+        return self._fitness
+
+    def _build_fitness(self) -> np.ndarray:
+        lengths = [len(ind.fitness) for ind in self]
+        n_obj = max(lengths, default=0)
+        if all(length == n_obj for length in lengths):
+            return np.array([ind.fitness for ind in self], dtype=float).reshape(len(self), n_obj)
+
+        fitness = np.full((len(self), n_obj), np.nan)
+        for idx, ind in enumerate(self):
+            fitness[idx, : len(ind.fitness)] = ind.fitness
+
+        return fitness
+
+    def _invalidate(self) -> None:
+        self._fitness = None
+
+    def set_fitness(self, idx: int, fitness: list[float]) -> None:
+        """Sets fitness of individual and updates fitness matrix."""
+        self[idx].fitness = list(fitness)
+        if self._fitness is not None and len(fitness) == self._fitness.shape[1]:
+            self._fitness[idx] = fitness
+        else:
+            self._invalidate()
+
+    def argsort(self) -> np.ndarray:
+        """Returns indices which sort population by fitness lexicographically.
+
+        Sorting is stable, the order is the same as ``sorted(pop, key=lambda x: x.fitness)``
+        for populations with equal fitness length.
+        """
+        fitness = self.fitness
+        if fitness.shape[1] == 0:
+            return np.arange(len(self))
+
+        return np.lexsort(fitness.T[::-1])
+
+    def top_k(self, k: int) -> np.ndarray:
+        """Returns sorted indices of ``k`` individuals with the lowest fitness.
+
+        For single objective populations only ``k`` best values are sorted.
+        """
+        if k >= len(self) or self.fitness.shape[1] != 1:
+            return self.argsort()[:k]
+
+        values = self.fitness[:, 0]
+        best = np.argpartition(values, k - 1)[:k] if k > 0 else np.empty(0, dtype=int)
+        return best[np.argsort(values[best], kind='stable')]
+
+    def take(self, idxs: Iterable[int]) -> Population:
+        """Returns new population of selected individuals with sliced fitness matrix."""
+        idxs = np.asarray(idxs, dtype=int).reshape(-1)
+        new = Population(self[idx] for idx in idxs)
+        if self._fitness is not None:
+            new._fitness = self._fitness[idxs]
+
+        return new
+
+    def copy(self) -> Population:
+        """Returns shallow copy of population with its own fitness matrix."""
+        return self.take(range(len(self)))
+
+    __copy__ = copy
+
+    def sorted(self) -> Population:
+        """Returns new population sorted by fitness."""
+        return self.take(self.argsort())
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self.take(range(len(self))[key])
+
+        return super().__getitem__(key)
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self._invalidate()
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._invalidate()
+
+    def __iadd__(self, other):
+        self._invalidate()
+        return super().__iadd__(other)
+
+    def __imul__(self, other):
+        self._invalidate()
+        return super().__imul__(other)
+
+    def append(self, ind: Structure) -> None:
+        """Appends individual to population."""
+        super().append(ind)
+        self._invalidate()
+
+    def extend(self, individuals: Iterable[Structure]) -> None:
+        """Extends population with individuals."""
+        super().extend(individuals)
+        self._invalidate()
+
+    def insert(self, idx: int, ind: Structure) -> None:
+        """Inserts individual before index."""
+        super().insert(idx, ind)
+        self._invalidate()
+
+    def pop(self, idx: int = -1) -> Structure:
+        """Removes and returns individual at index."""
+        self._invalidate()
+        return super().pop(idx)
+
+    def remove(self, ind: Structure) -> None:
+        """Removes first occurrence of individual."""
+        super().remove(ind)
+        self._invalidate()
+
+    def clear(self) -> None:
+        """Removes all individuals."""
+        super().clear()
+        self._invalidate()
+
+    def sort(self, *args, **kwargs) -> None:
+        """Sorts population in place, see ``list.sort``."""
+        super().sort(*args, **kwargs)
+        self._invalidate()
+
+    def reverse(self) -> None:
+        """Reverses population in place."""
+        super().reverse()
+        self._invalidate()
@@ -1,6 +1,9 @@
+import copy
+import hashlib
 from typing import Union
 from uuid import UUID, uuid4
 
+import numpy as np
 from pydantic import Field
 from pydantic.dataclasses import dataclass
 
@@ -10,7 +13,12 @@ from .polygon import Polygon
 
 @dataclass
 class Structure:
-    """Structure dataclass."""
+    """Structure dataclass.
+
+    Polygons are considered immutable: :meth:`clone` shares them between copies,
+    so any in-place modification must be done on ``Polygon.copy()`` result,
+    which then should be assigned back into structure (copy-on-write).
+    """
 
     polygons: tuple[Polygon, ...] = Field(default_factory=tuple)
     fitness: list[float] = Field(default_factory=list)
@@ -57,3 +65,24 @@ class Structure:
         polygons = list(self.polygons)
         polygons.remove(value)
         self.polygons = tuple(polygons)
+
+    def clone(self) -> 'Structure':
+        """Returns copy of structure, which shares polygons with the original one.
+
+        Fitness and extra characteristics are copied, so they can be changed independently.
+        Replacing, adding or removing polygons does not affect the original structure.
+        """
+        new_structure = copy.copy(self)
+        new_structure.fitness = list(self.fitness)
+        new_structure.extra_characteristics = dict(self.extra_characteristics)
+        return new_structure
+
+    def geometry_hash(self) -> str:
+        """Returns hash of polygons coordinates, equal for structures with equal geometry."""
+        digest = hashlib.blake2b(digest_size=16)
+        for poly in self.polygons:
+            digest.update(len(poly.points).to_bytes(8, 'little'))
+            coords = np.array([(pt.x, pt.y) for pt in poly.points], dtype=np.float64)
+            digest.update(coords.tobytes())
+
+        return digest.hexdigest()
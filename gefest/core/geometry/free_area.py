@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from gefest.core.geometry.domain import Domain
+
+import numpy as np
+import shapely
+from scipy.ndimage import distance_transform_edt
+from shapely.ops import unary_union
+
+from gefest.core.geometry import Point, Polygon, Structure
+from gefest.core.utils.rng import get_rng
+
+
+class FreeArea:
+    """Free space of the domain, which is updated incrementally while structure is built.
+
+    Prohibited area is substracted once on init, each added polygon
+    substracts only its own buffered convex hull.
+    Largest empty circles are found with distance transform over rasterized free area,
+    exact distances are calculated only for a few best grid points.
+    The raster is recalculated only after area changes.
+
+    Args:
+        domain (Domain): Task domain.
+        structure (Optional[Structure]): Polygons which are already placed into domain.
+        resolution (int): Number of grid cells along the longest side of free area bounds.
+
+    """
+
+    def __init__(
+        self,
+        domain: Domain,
+        structure: Optional[Structure] = None,
+        resolution: int = 64,
+    ) -> None:
+        self.domain = domain
+        self.resolution = resolution
+        geom = domain.geometry
+        area = geom._poly_to_shapely_poly(domain.bound_poly).buffer(
+            -domain.min_dist_from_boundary,
+            1,
+        )
+        prohibs = geom.get_prohibited_geom(
+            domain.prohibited_area,
+            buffer_size=domain.dist_between_polygons,
+        )
+        if not prohibs.is_empty:
+            area = area.difference(
+                unary_union([g.buffer(domain.min_dist_from_boundary) for g in prohibs.geoms]),
+            )
+
+        self.area = area
+        self._grid = None
+        if structure is not None:
+            for poly in structure.polygons:
+                self.add(poly)
+
+    def add(self, poly: Polygon) -> None:
+        """Marks area around polygon as occupied."""
+        occupied = self.domain.geometry._poly_to_shapely_line(poly).convex_hull.buffer(
+            self.domain.dist_between_polygons,
+            1,
+        )
+        self.area = self.area.difference(occupied)
+        self._grid = None
+
+    def _distance_field(self) -> tuple[np.ndarray, np.ndarray, float]:
+        """Returns grid points inside free area, approximate distances to border and grid step."""
+        if self._grid is None:
+            if self.area.is_empty:
+                self._grid = (np.empty((0, 2)), np.empty(0), 0.0)
+                return self._grid
+
+            minx, miny, maxx, maxy = self.area.bounds
+            step = max(maxx - minx, maxy - miny) / self.resolution
+            x, y = np.meshgrid(
+                np.arange(minx + step / 2, maxx, step),
+                np.arange(miny + step / 2, maxy, step),
+            )
+            shapely.prepare(self.area)
+            inside = shapely.contains_xy(self.area, x, y)
+            distances = distance_transform_edt(np.pad(inside, 1))[1:-1, 1:-1] * step
+            centers = np.stack((x[inside], y[inside]), axis=1)
+            self._grid = (centers, distances[inside], step)
+
+        return self._grid
+
+    def _exact_distances(self, centers: np.ndarray) -> np.ndarray:
+        return shapely.distance(shapely.points(centers), self.area.boundary)
+
+    def max_empty_radius(self, n_checks: int = 16) -> float:
+        """Returns approximate radius of the largest circle inside free area.
+
+        Distance transform is used to choose best grid points,
+        then the exact distance to the border is calculated only for them.
+        """
+        centers, distances, _ = self._distance_field()
+        if len(distances) == 0:
+            return 0.0
+
+        best = np.argpartition(-distances, min(n_checks, len(distances) - 1))[:n_checks]
+        exact = self._exact_distances(centers[best])
+        return float(exact.max())
+
+    def get_random_center(self, radius: float, n_checks: int = 16) -> Optional[Point]:
+        """Returns random center of circle with given radius which fits into free area.
+
+        Returns:
+            Optional[Point]: Circle center, None if there is no enough space.
+        """
+        centers, distances, step = self._distance_field()
+        if len(distances) == 0:
+            return None
+
+        max_shift = step * np.sqrt(2) / 2
+        candidates = np.flatnonzero(distances >= radius)
+        if len(candidates) == 0:
+            candidates = np.argpartition(-distances, min(n_checks, len(distances) - 1))[:n_checks]
+
+        candidates = get_rng().permutation(candidates)[:n_checks]
+        exact = self._exact_distances(centers[candidates])
+        for shift, min_dist in ((True, radius + max_shift), (False, radius)):
+            valid = np.flatnonzero(exact >= min_dist)
+            if len(valid) > 0:
+                center = centers[candidates[valid[0]]]
+                if shift:
+                    center = center + get_rng().uniform(-step / 2, step / 2, 2)
+
+                return Point(float(center[0]), float(center[1]))
+
+        return None
@@ -0,0 +1,194 @@
+"""Vectorized random polygons generators.
+
+All generators produce batch of polygons as coordinates array
+of shape ``(n_polygons, num_points, 2)``. Each polygon fits the bounding box
+``(0.0, 0.0) ... (1.0, 1.0)`` and has counterclockwise points order,
+so it can be scaled and translated to the required location.
+Last point is not equal to the first one.
+"""
+
+from enum import Enum
+from functools import partial
+
+import numpy as np
+
+from gefest.core.utils.rng import get_rng
+
+
+def _random_permutations(n_rows: int, length: int) -> np.ndarray:
+    """Returns independent random permutation of ``range(length)`` for each row."""
+    return np.argsort(get_rng().random((n_rows, length)), axis=1)
+
+
+def _fit_to_bbox(coords: np.ndarray) -> np.ndarray:
+    """Scales each polygon in batch to the unit bounding box."""
+    mins = coords.min(axis=1, keepdims=True)
+    ptp = coords.max(axis=1, keepdims=True) - mins
+    ptp[ptp == 0] = 1.0
+    return (coords - mins) / ptp
+
+
+def _sort_by_centroid_angle(points: np.ndarray) -> np.ndarray:
+    """Orders points of each polygon in batch by polar angle around their centroid."""
+    centered = points - points.mean(axis=1, keepdims=True)
+    order = np.argsort(np.arctan2(centered[:, :, 1], centered[:, :, 0]), axis=1)
+    return np.take_along_axis(points, order[:, :, None], axis=1)
+
+
+def _chains_vectors(values: np.ndarray) -> np.ndarray:
+    """Splits sorted random values into two chains and returns their edges projections.
+
+    Vectorized step of Valtr algorithm.
+    Both chains start at min and end at max value, inner values are divided in half.
+    """
+    n_rows, num_points = values.shape
+    values = np.sort(values, axis=1)
+    inner = _random_permutations(n_rows, num_points - 2) + 1
+    half = (num_points - 2) // 2
+    first = np.sort(inner[:, :half], axis=1)
+    second = np.sort(inner[:, half:], axis=1)
+    first_chain = np.concatenate(
+        (values[:, :1], np.take_along_axis(values, first, axis=1), values[:, -1:]),
+        axis=1,
+    )
+    second_chain = np.concatenate(
+        (values[:, :1], np.take_along_axis(values, second, axis=1), values[:, -1:]),
+        axis=1,
+    )
+    return np.concatenate((np.diff(first_chain, axis=1), -np.diff(second_chain, axis=1)), axis=1)
+
+
+def random_convex_polygons(n_polygons: int, num_points: int) -> np.ndarray:
+    """Generates batch of random convex polygons.
+
+    Vectorized version of Valtr algorithm, see https://stackoverflow.com/a/47358689.
+
+    Args:
+        n_polygons (int): Number of polygons to generate.
+        num_points (int): Number of points in each polygon, must be greater than 2.
+
+    Returns:
+        np.ndarray: Coordinates array of shape ``(n_polygons, num_points, 2)``.
+    """
+    if num_points < 3:
+        raise ValueError(f'Polygon must have at least 3 points, got {num_points}.')
+
+    vx = _chains_vectors(get_rng().random((n_polygons, num_points)))
+    vy = _chains_vectors(get_rng().random((n_polygons, num_points)))
+    vy = np.take_along_axis(vy, _random_permutations(n_polygons, num_points), axis=1)
+
+    order = np.argsort(np.arctan2(vy, vx), axis=1)
+    vectors = np.stack(
+        (np.take_along_axis(vx, order, axis=1), np.take_along_axis(vy, order, axis=1)),
+        axis=2,
+    )
+    coords = np.cumsum(vectors, axis=1)
+    return _fit_to_bbox(coords)
+
+
+def random_star_shaped_polygons(n_polygons: int, num_points: int) -> np.ndarray:
+    """Generates batch of random star-shaped polygons.
+
+    Uniformly distributed points are connected in order of their polar angle
+    around the points centroid. The centroid lies inside the convex hull of points,
+    so there is no angular gap greater than pi, the polygon has no self intersections
+    and the whole polygon is visible from the centroid.
+
+    Args:
+        n_polygons (int): Number of polygons to generate.
+        num_points (int): Number of points in each polygon, must be greater than 2.
+
+    Returns:
+        np.ndarray: Coordinates array of shape ``(n_polygons, num_points, 2)``.
+    """
+    if num_points < 3:
+        raise ValueError(f'Polygon must have at least 3 points, got {num_points}.')
+
+    points = get_rng().random((n_polygons, num_points, 2))
+    return _fit_to_bbox(_sort_by_centroid_angle(points))
+
+
+def _edges_crossings(points: np.ndarray) -> np.ndarray:
+    """Returns mask of properly crossing edges pairs ``(i, j)``, ``i < j``, for each polygon.
+
+    Edge ``i`` connects points ``i`` and ``i + 1``, the last one closes the polygon.
+    Adjacent edges share a point, so they never cross properly.
+    """
+    start = points[:, :, None, :]
+    end = np.roll(points, -1, axis=1)[:, :, None, :]
+    other_start = points[:, None, :, :]
+    other_end = np.roll(points, -1, axis=1)[:, None, :, :]
+
+    def orientation(a, b, c):
+        ab, ac = b - a, c - a
+        return ab[..., 0] * ac[..., 1] - ab[..., 1] * ac[..., 0]
+
+    crossings = (
+        orientation(start, end, other_start) * orientation(start, end, other_end) < 0
+    ) & (orientation(other_start, other_end, start) * orientation(other_start, other_end, end) < 0)
+    return np.triu(crossings, k=1)
+
+
+def _untangle(points: np.ndarray) -> np.ndarray:
+    """Removes self intersections of each polygon in batch with 2-opt moves.
+
+    Each iteration picks random pair of crossing edges ``(i, j)`` in every tangled polygon
+    and reverses points ``i + 1 ... j``. The move strictly shortens perimeter,
+    so the process ends with simple polygons.
+    """
+    points = points.copy()
+    num_points = points.shape[1]
+    positions = np.arange(num_points)
+    active = np.arange(len(points))
+    while active.size:
+        crossings = _edges_crossings(points[active])
+        tangled = crossings.any(axis=(1, 2))
+        active, crossings = active[tangled], crossings[tangled]
+        if not active.size:
+            break
+
+        scores = get_rng().random(crossings.shape) * crossings
+        first, last = np.unravel_index(
+            scores.reshape(len(active), -1).argmax(axis=1),
+            (num_points, num_points),
+        )
+        inside = (positions > first[:, None]) & (positions <= last[:, None])
+        order = np.where(inside, first[:, None] + 1 + last[:, None] - positions, positions)
+        points[active] = np.take_along_axis(points[active], order[:, :, None], axis=1)
+
+    return points
+
+
+def random_simple_polygons(n_polygons: int, num_points: int) -> np.ndarray:
+    """Generates batch of random simple polygons.
+
+    Uniformly distributed points are connected in random order, then crossing edges
+    are removed by 2-opt moves. Unlike star-shaped polygons, the result may have
+    no point from which the whole polygon is visible.
+
+    Args:
+        n_polygons (int): Number of polygons to generate.
+        num_points (int): Number of points in each polygon, must be greater than 2.
+
+    Returns:
+        np.ndarray: Coordinates array of shape ``(n_polygons, num_points, 2)``.
+    """
+    if num_points < 3:
+        raise ValueError(f'Polygon must have at least 3 points, got {num_points}.')
+
+    points = _untangle(get_rng().random((n_polygons, num_points, 2)))
+    shifted = np.roll(points, -1, axis=1)
+    doubled_area = np.sum(
+        points[:, :, 0] * shifted[:, :, 1] - shifted[:, :, 0] * points[:, :, 1],
+        axis=1,
+    )
+    points[doubled_area < 0] = points[doubled_area < 0, ::-1]
+    return _fit_to_bbox(points)
+
+
+class PolygonGeneratorTypes(Enum):
+    """Enumerates all random polygons generators."""
+
+    convex = partial(random_convex_polygons)
+    star_shaped = partial(random_star_shaped_polygons)
+    simple = partial(random_simple_polygons)
@@ -1,8 +1,9 @@
+from functools import lru_cache
 from typing import Union
 from uuid import uuid4
 
 import numpy as np
-from golem.utilities.data_structures import ensure_wrapped_in_sequence
+import shapely
 from loguru import logger
 from shapely import affinity, get_parts
 from shapely.affinity import scale
@@ -19,10 +20,39 @@ from shapely.geometry import box, mapping
 from shapely.ops import nearest_points, split
 
 from gefest.core.geometry import Point, Polygon, Structure
+from gefest.core.utils.functions import ensure_wrapped_in_sequence
+from gefest.core.utils.rng import get_rng
 
 from .geometry import Geometry
 
 
+@lru_cache(maxsize=256)
+def _triangulate(fig) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Splits shapely geometry into triangles for uniform points sampling.
+
+    Delaunay triangles which lie in the geometry only partially are clipped by it
+    and triangulated again. Results are cached, as the same areas are often sampled many times.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Triangles vertices of shape ``(n, 3, 2)``,
+            triangles areas and mask of triangles which still may cross geometry border,
+            so points sampled from them must be checked.
+    """
+    shapely.prepare(fig)
+    triangles = get_parts(shapely.delaunay_triangles(fig))
+    inside = shapely.covered_by(triangles, fig)
+    to_check = np.zeros(inside.sum(), dtype=bool)
+    if not inside.all():
+        clipped = get_parts(shapely.intersection(triangles[~inside], fig))
+        clipped = clipped[shapely.area(clipped) > 0]
+        sub_triangles = get_parts(shapely.delaunay_triangles(clipped))
+        triangles = np.concatenate((triangles[inside], sub_triangles))
+        to_check = np.concatenate((to_check, ~shapely.covered_by(sub_triangles, fig)))
+
+    vertices = shapely.get_coordinates(triangles).reshape(-1, 4, 2)[:, :3]
+    return vertices, shapely.area(triangles), to_check
+
+
 class Geometry2D(Geometry):
     """Overriding the geometry base class for 2D structures.
 
@@ -367,47 +397,63 @@ class Geometry2D(Geometry):
         """Checks if poly is simple."""
         return self._poly_to_shapely_poly(poly).is_simple
 
-    def get_random_point_in_shapey_geom(self, fig):
-        """Returns random point from polygon of arbitrary shape shapely geometry."""
-        if fig.is_empty:
-            raise ValueError('Unable to pick a point from an empty polygon.')
+    def get_random_points_in_shapely_geom(self, fig, n_points: int = 1) -> np.ndarray:
+        """Returns uniformly distributed random points from shapely geometry of arbitrary shape.
 
-        if isinstance(fig, MultiPolygon):
-            bds = []
-            for bound in list(fig.geoms):
-                bds.extend(list(bound.exterior.coords))
+        Geometry is triangulated once (triangulation is cached), then triangles
+        are choosen with probabilities proportional to their areas and points are sampled
+        uniformly inside them. Only points from triangles that cross the border are validated.
 
-            minx, miny, maxx, maxy = LineString(bds).bounds
+        Args:
+            fig: Shapely polygonal geometry.
+            n_points (int): Number of points to sample.
 
-        else:
-            minx, miny, maxx, maxy = fig.bounds
+        Returns:
+            np.ndarray: Points coordinates array of shape ``(n_points, 2)``.
+        """
+        if fig.is_empty or fig.area == 0:
+            raise ValueError('Unable to pick a point from an empty polygon.')
+
+        vertices, areas, to_check = _triangulate(fig)
+        probs = areas / areas.sum()
+        points = np.empty((0, 2))
+        while len(points) < n_points:
+            n_left = n_points - len(points)
+            idxs = get_rng().choice(len(areas), size=n_left, p=probs)
+            weights = get_rng().random((n_left, 2))
+            flip = weights.sum(axis=1) > 1
+            weights[flip] = 1 - weights[flip]
+            origin = vertices[idxs, 0]
+            sampled = (
+                origin
+                + weights[:, :1] * (vertices[idxs, 1] - origin)
+                + weights[:, 1:] * (vertices[idxs, 2] - origin)
+            )
+            valid = ~to_check[idxs]
+            if not valid.all():
+                valid[~valid] = shapely.contains_xy(fig, sampled[~valid])
 
-        x = np.random.uniform(minx, maxx, 1)
-        y = np.random.uniform(miny, maxy, 1)
-        while not fig.contains(ShapelyPoint(x, y)):
-            x = np.random.uniform(minx, maxx, 1)
-            y = np.random.uniform(miny, maxy, 1)
+            points = np.concatenate((points, sampled[valid]))
 
-        return Point(x, y)
+        return points
+
+    def get_random_point_in_shapey_geom(self, fig) -> Point:
+        """Returns random point from polygon of arbitrary shape shapely geometry."""
+        x, y = self.get_random_points_in_shapely_geom(fig, 1)[0]
+        return Point(float(x), float(y))
 
     def get_random_point_in_poly(self, poly) -> Union[Point, None]:
-        """Returns random point from polygon of arbitrary shape."""
-        minx, miny, maxx, maxy = poly.bounds
-        if any(b != b for b in poly.bounds):
+        """Returns random point from polygon of arbitrary shape.
+
+        Returns None if polygon has zero area.
+        """
+        if poly.is_empty:
             raise ValueError('Unable to pick a point from empty an polygon.')
 
-        #  also can be used polar cords generator within circumscribed circle
-        x = np.random.uniform(minx, maxx, 1)
-        y = np.random.uniform(miny, maxy, 1)
-        point = None
-        for _ in range(100):
-            x = np.random.uniform(minx, maxx, 1)
-            y = np.random.uniform(miny, maxy, 1)
-            if poly.contains(ShapelyPoint(x, y)):
-                point = Point(x, y)
-                break
+        if poly.area == 0:
+            return None
 
-        return point
+        return self.get_random_point_in_shapey_geom(poly)
 
     def get_centroid(self, poly: Polygon) -> Point:
         """Getting a point that is the center of mass of the polygon.
@@ -420,7 +466,7 @@ class Geometry2D(Geometry):
         """
         points = poly.points
         if len(points) < 3:
-            points.append(points[0])
+            points = [*points, points[0]]
 
         geom_poly = ShapelyPolygon([self._pt_to_shapely_pt(pt) for pt in points])
         geom_point = geom_poly.centroid
@@ -5,15 +5,10 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from gefest.core.geometry.domain import Domain
 
-from random import randint
 from typing import Optional
 
 import numpy as np
-from polygenerator import (
-    random_convex_polygon,
-    random_polygon,
-    random_star_shaped_polygon,
-)
+import shapely
 from shapely.affinity import scale
 from shapely.geometry import (
     GeometryCollection,
@@ -22,9 +17,13 @@ from shapely.geometry import (
     MultiPolygon,
 )
 from shapely.geometry import Point as SPoint
+from shapely.ops import unary_union
 
 from gefest.core.geometry import Point, Polygon, Structure
+from gefest.core.geometry.free_area import FreeArea
+from gefest.core.geometry.generators import PolygonGeneratorTypes
 from gefest.core.geometry.geometry_2d import Geometry2D
+from gefest.core.utils.rng import get_rng
 
 
 def random_polar(origin: Point, radius_scale: float) -> Point:
@@ -33,28 +32,55 @@ def random_polar(origin: Point, radius_scale: float) -> Point:
     The distribution density is shifted to the center.
     https://habrastorage.org/r/w1560/webt/sn/xx/ow/snxxowuhnuqnr8dp4sadmyswqu0.png
     """
-    theta = np.random.random() * 2 * np.pi
-    r = np.random.random() * radius_scale
+    theta = get_rng().random() * 2 * np.pi
+    r = get_rng().random() * radius_scale
     return Point((r * np.cos(theta)) + origin.x, (r * np.sin(theta)) + origin.y)
 
 
+def random_polar_batch(origin: Point, radius_scale: float, n_points: int) -> np.ndarray:
+    """Vectorized version of :func:`random_polar`.
+
+    Returns:
+        np.ndarray: Points coordinates array of shape ``(n_points, 2)``.
+    """
+    theta = get_rng().random(n_points) * 2 * np.pi
+    r = get_rng().random(n_points) * radius_scale
+    return np.stack(((r * np.cos(theta)) + origin.x, (r * np.sin(theta)) + origin.y), axis=1)
+
+
 def get_random_structure(domain: Domain, **kwargs) -> Structure:
     """Generates random structure."""
     structure = Structure(polygons=())
-    num_pols = randint(domain.min_poly_num, domain.max_poly_num)
+    num_pols = int(get_rng().integers(domain.min_poly_num, domain.max_poly_num + 1))
+    free_area = FreeArea(domain)
 
     for _ in range(num_pols):
-        polygon = get_random_poly(parent_structure=structure, domain=domain)
+        polygon = get_random_poly(parent_structure=structure, domain=domain, free_area=free_area)
         if polygon is not None and len(polygon.points) > 1:
             structure.append(polygon)
+            free_area.add(polygon)
         else:
             continue
 
     return structure
 
 
-def get_random_poly(parent_structure: Optional[Structure], domain: Domain) -> Optional[Polygon]:
-    """Generates random polygon."""
+def get_random_poly(
+    parent_structure: Optional[Structure],
+    domain: Domain,
+    free_area: Optional[FreeArea] = None,
+) -> Optional[Polygon]:
+    """Generates random polygon.
+
+    Args:
+        parent_structure (Optional[Structure]): Structure to place new polygon in.
+        domain (Domain): Task domain.
+        free_area (Optional[FreeArea]): Precalculated free area of parent structure.
+            If not provided, it will be created from scratch.
+
+    Returns:
+        Optional[Polygon]: New polygon or None if there is no free space.
+    """
     geometry = domain.geometry
     try:
         """
@@ -65,7 +91,7 @@ def get_random_poly(parent_structure: Optional[Structure], domain: Domain) -> Op
         After setting the neighborhood, polygons are created around the centroid inside it.
         This approach is less demanding on postprocessing than random creation
         """
-        occupied_area = _create_area(domain, parent_structure, geometry)
+        occupied_area = _create_area(domain, parent_structure, geometry, free_area)
         if occupied_area is None:
             # If it was not possible to find the occupied area then returns None
             return None
@@ -86,91 +112,64 @@ def get_random_poly(parent_structure: Optional[Structure], domain: Domain) -> Op
 
 
 def create_poly(centroid: Point, sigma: int, domain: Domain, geometry: Geometry2D) -> Polygon:
-    """Generates random polygon using poltgenerator lib.
+    """Generates random polygon with vectorized generators from ``geometry.generators``.
 
-    For details see: https://github.com/bast/polygenerator
+    Convex generator is used for convex geometry, otherwise generator is choosen randomly.
     """
-    num_points = randint(
-        domain.min_points_num,
-        domain.max_points_num,
+    num_points = int(
+        get_rng().integers(
+            domain.min_points_num,
+            domain.max_points_num + 1,
+        ),
     )
     if domain.geometry.is_convex:  # convex closed/unclosed
-        generator = random_convex_polygon
+        generator = PolygonGeneratorTypes.convex.value
 
     else:  # non_convex, unclosed
-        generator = np.random.choice(
-            [
-                random_convex_polygon,
-                random_star_shaped_polygon,
-                random_polygon,
-            ],
-        )
+        generators = [gen.value for gen in PolygonGeneratorTypes]
+        generator = generators[get_rng().integers(len(generators))]
 
-    new_poly = generator(num_points)
+    new_poly = generator(1, num_points)[0]
     if not geometry.is_closed:
-        start = np.random.choice(range(num_points), 1)[0]
-        new_poly = [new_poly[((start + i) % len(new_poly))] for i in range(num_points)]
+        start = get_rng().integers(num_points)
+        new_poly = np.roll(new_poly, -start, axis=0)
 
     scale_factor = 2 * (sigma / (1 ** 0.5))
-    c, s = centroid, scale_factor
-    new_poly = Polygon(
-        [
-            Point(
-                ((p[0] - 0.5) * s) + c.x,
-                ((p[1] - 0.5) * s) + c.y,
-            )
-            for p in new_poly
-        ],
-    )
+    coords = (new_poly - 0.5) * scale_factor + (centroid.x, centroid.y)
+    new_poly = Polygon([Point(x, y) for x, y in coords.tolist()])
     if domain.geometry.is_closed:
         new_poly.points.append(new_poly[0])
 
     return new_poly
 
 
-def _get_sigma_max(poly, init_max):
-    sigma_max = init_max
-    left_bound = 0
-    right_bound = init_max
-    for _ in range(100):
-        if poly.buffer(-sigma_max, 1).is_empty:
-            right_bound = sigma_max
-            sigma_max -= (right_bound - left_bound) / 2
-        else:
-            left_bound = sigma_max
-            sigma_max += (right_bound - left_bound) / 2
-
-        if sigma_max < 0.02:
-            break
-
-    return sigma_max
-
+def _create_area(
+    domain: Domain,
+    structure: Optional[Structure],
+    geometry: Geometry2D,
+    free_area: Optional[FreeArea] = None,
+) -> Optional[tuple[Point, float]]:
+    """Finds free area for new polygon.
+
+    Returns:
+        Optional[tuple[Point, float]]: Center and radius of empty circle,
+            None if there is no enough free space.
+    """
+    if free_area is None:
+        free_area = FreeArea(domain, structure)
 
-def _create_area(domain: Domain, structure: Structure, geometry: Geometry2D) -> (Point, float):
-    """Finds free area for new polygon."""
-    geom = domain.geometry
-    area = geom._poly_to_shapely_poly(domain.bound_poly).buffer(-(domain.min_dist_from_boundary), 1)
-    prohibs = geom.get_prohibited_geom(
-        domain.prohibited_area,
-        buffer_size=domain.dist_between_polygons,
+    sigma_max = 0.95 * min(
+        free_area.max_empty_radius(),
+        (min(domain.max_x, domain.max_y) / 2) * 1.01,
     )
-    for g in prohibs.geoms:
-        area = area.difference(
-            g.buffer(
-                domain.min_dist_from_boundary,
-            ),
-        )
-
-    for poly in structure.polygons:
-        area = area.difference(
-            geom._poly_to_shapely_poly(poly).convex_hull.buffer(domain.dist_between_polygons, 1),
-        ).intersection(area)
-
-    sigma_max = 0.95 * _get_sigma_max(area, (min(domain.max_x, domain.max_y) / 2) * 1.01)
     sigma_min = max(domain.max_x - domain.min_x, domain.max_y - domain.min_y) * 0.05
 
-    sigma = np.random.uniform(sigma_min, sigma_max)
-    centroid = geom.get_random_point_in_shapey_geom(area.buffer(-sigma, 1))
+    # Free radius may be less than min size if there is little space left,
+    # bounds are ordered as np.random.uniform did not require ordered ones.
+    sigma = get_rng().uniform(min(sigma_min, sigma_max), max(sigma_min, sigma_max))
+    centroid = free_area.get_random_center(sigma)
+    if centroid is None:
+        return None
 
     return centroid, sigma * 0.99
 
@@ -180,8 +179,26 @@ def get_selfintersection_safe_point(
     domain: Domain,
     point_left_idx: int,
     point_right_idx: int,
-) -> Polygon:
-    """Finds a new point for the polygon that does not generate self-intersections."""
+    n_attempts: int = 200,
+    batch_size: int = 50,
+) -> tuple[Optional[Point], MultiLineString]:
+    """Finds a new point for the polygon that does not generate self-intersections.
+
+    Candidate points are generated and checked in batches with vectorized shapely predicates
+    against prepared polygon border, allowed area border and prohibited area union.
+
+    Args:
+        poly (Polygon): Polygon to insert the new point in.
+        domain (Domain): Task domain.
+        point_left_idx (int): Index of the left neighbour of new point.
+        point_right_idx (int): Index of the right neighbour of new point.
+        n_attempts (int): Max number of candidate points to check.
+        batch_size (int): Number of candidate points checked at once.
+
+    Returns:
+        tuple[Optional[Point], MultiLineString]: First valid candidate or None,
+            and the polygon border used for the check.
+    """
     geom = domain.geometry
 
     if geom.is_closed:
@@ -206,36 +223,41 @@ def get_selfintersection_safe_point(
     l_ = poly[point_left_idx % len(poly)]
     r_ = poly[point_right_idx % len(poly)]
 
-    origin = Point((l_.x + r_.x) / 2, (l_.y + l_.y) / 2)
+    origin = Point((l_.x + r_.x) / 2, (l_.y + r_.y) / 2)
     scalefactor = (
         (LineString(((l_.x, l_.y), (r_.x, r_.y))).length / 2)
         if len(poly) > 2
         else geom.get_length(poly) * 1.5
     )
-    points = []
-    p_area = geom.get_prohibited_geom(
-        domain.prohibited_area,
-        buffer_size=domain.dist_between_polygons,
+    p_area = unary_union(
+        geom.get_prohibited_geom(
+            domain.prohibited_area,
+            buffer_size=domain.dist_between_polygons,
+        ),
     )
-    for _ in range(200):
-        point = random_polar(origin, scalefactor)
-        points.append(point)
-        new_segment = scale(
-            LineString(((l_.x, l_.y), (point.x, point.y), (r_.x, r_.y))),
-            0.99,
-            0.99,
-        )
-
-        if all(
+    allowed_border = geom._poly_to_shapely_line(domain.allowed_area)
+    obstacles = [g for g in (border, allowed_border, p_area) if not g.is_empty]
+    shapely.prepare(obstacles)
+
+    point = None
+    for _ in range(n_attempts // batch_size):
+        candidates = random_polar_batch(origin, scalefactor, batch_size)
+        segments = np.stack(
             (
-                not new_segment.intersects(border),
-                not new_segment.intersects(geom._poly_to_shapely_line(domain.allowed_area)),
-                not any(g.intersects(new_segment) for g in p_area.geoms),
+                np.broadcast_to((l_.x, l_.y), candidates.shape),
+                candidates,
+                np.broadcast_to((r_.x, r_.y), candidates.shape),
             ),
-        ):
+            axis=1,
+        )
+        # same as shapely.affinity.scale relative to the bounding box center
+        centers = (segments.min(axis=1, keepdims=True) + segments.max(axis=1, keepdims=True)) / 2
+        segments = shapely.linestrings(centers + (segments - centers) * 0.99)
+        valid = ~np.any([shapely.intersects(segments, obstacle) for obstacle in obstacles], axis=0)
+        if valid.any():
+            x, y = candidates[np.argmax(valid)]
+            point = Point(float(x), float(y))
             break
-    else:
-        point = None
 
     return point, border
 
@@ -61,7 +61,7 @@ def map_into_gpa(
         multi_objective=False,
         genetic_scheme_type=getattr(
             GeneticSchemeTypesEnum,
-            opt_params.golem_genetic_scheme_type.name,
+            opt_params.golem_genetic_scheme_type,
         ),
         mutation_types=[
             OperationWrap(
@@ -1,5 +1,7 @@
 from abc import ABCMeta, abstractmethod
-from typing import Optional
+from typing import Callable, Optional, Union
+
+import numpy as np
 
 from gefest.core.geometry import Structure
 from gefest.core.geometry.domain import Domain
@@ -29,6 +31,18 @@ class Objective(metaclass=ABCMeta):
         """Calls evaluate method."""
         return self._evaluate(ind)
 
+    def evaluate_batch(self, inds: list[Structure]) -> np.ndarray:
+        """Evaluates objective for several structures at once.
+
+        Override to process batch with one call of backend, e.g. single neural network
+        forward pass or ``Estimator.estimate_batch``. Calls objective for each structure
+        by default.
+
+        Returns:
+            np.ndarray: Objective value for each structure.
+        """
+        return np.array([self(ind) for ind in inds])
+
     @abstractmethod
     def _evaluate(
         self,
@@ -36,3 +50,29 @@ class Objective(metaclass=ABCMeta):
     ) -> float:
         """Must implement logic spicific objectiv evaluation."""
         ...
+
+
+def _qualname(obj: object) -> str:
+    if not hasattr(obj, '__qualname__'):
+        obj = type(obj)
+
+    return f'{obj.__module__}.{obj.__qualname__}'
+
+
+def objectives_identity(objectives: list[Union[Objective, Callable]]) -> list[str]:
+    """Returns names of objectives classes or functions with classes of their estimators.
+
+    Fitness evaluated in another run can be reused if identities of runs objectives are equal.
+    """
+    identity = []
+    for obj in objectives:
+        if isinstance(obj, Objective):
+            name = _qualname(obj)
+            if obj.estimator is not None:
+                name = f'{name}[{_qualname(obj.estimator)}]'
+        else:
+            name = _qualname(getattr(obj, 'func', obj))
+
+        identity.append(name)
+
+    return identity
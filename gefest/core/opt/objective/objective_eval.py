@@ -1,60 +1,225 @@
-from typing import Union
+import copy
+from typing import Any, Callable, Optional, Union
 
-from golem.utilities.data_structures import ensure_wrapped_in_sequence
+import numpy as np
 
+from gefest.core.geometry.datastructs.population import Population
 from gefest.core.geometry.datastructs.structure import Structure
 from gefest.core.opt.objective.objective import Objective
 from gefest.core.utils import where
+from gefest.core.utils.functions import ensure_wrapped_in_sequence
 from gefest.core.utils.parallel_manager import BaseParallelDispatcher
+from gefest.core.utils.telemetry import Telemetry
+from gefest.tools.estimators.estimator import Estimator
+
+
+class EstimatorCache:
+    """Memoizes estimator outputs by structures geometry.
+
+    Objectives with the same estimator share one cache, so each structure
+    is estimated once however many objectives use the estimator.
+    Other attributes are taken from the wrapped estimator.
+
+    Args:
+        estimator (Union[Estimator, Callable]): Estimator to wrap.
+
+    """
+
+    def __init__(self, estimator: Union[Estimator, Callable]) -> None:
+        self.estimator = estimator
+        self._results: dict[str, Any] = {}
+
+    def __call__(self, struct: Structure) -> Any:
+        """Returns cached estimation or estimates structure."""
+        key = struct.geometry_hash()
+        if key not in self._results:
+            self._results[key] = self.estimator(struct)
+
+        return self._results[key]
+
+    def estimate(self, struct: Structure) -> Any:
+        """Returns cached estimation or estimates structure."""
+        return self(struct)
+
+    def estimate_batch(self, structs: list[Structure]) -> list[Any]:
+        """Estimates structures missing in cache with one batch call."""
+        keys = [struct.geometry_hash() for struct in structs]
+        missing = {}
+        for key, struct in zip(keys, structs):
+            if key not in self._results:
+                missing.setdefault(key, struct)
+
+        if missing:
+            estimate_batch = getattr(self.estimator, 'estimate_batch', None)
+            if estimate_batch is None:
+                values = [self.estimator(struct) for struct in missing.values()]
+            else:
+                values = estimate_batch(list(missing.values()))
+
+            self._results.update(zip(missing, values))
+
+        return [self._results[key] for key in keys]
+
+    def __getattr__(self, name: str) -> Any:
+        if name == 'estimator':
+            raise AttributeError(name)
+
+        return getattr(self.estimator, name)
+
+
+def with_shared_estimators(
+    objectives: list[Union[Objective, Callable]],
+) -> list[Union[Objective, Callable]]:
+    """Returns objectives which share estimations of the same estimator.
+
+    Objectives with estimator are replaced with their shallow copies using
+    ``EstimatorCache`` of the estimator, so original objectives are not modified
+    and can be evaluated concurrently. Estimators must be deterministic
+    and their outputs must not be modified in place by objectives.
+    """
+    caches: dict[int, EstimatorCache] = {}
+    shared = []
+    for objective in objectives:
+        estimator = getattr(objective, 'estimator', None)
+        if estimator is None:
+            shared.append(objective)
+            continue
+
+        if id(estimator) not in caches:
+            caches[id(estimator)] = EstimatorCache(estimator)
+
+        objective = copy.copy(objective)
+        objective.estimator = caches[id(estimator)]
+        shared.append(objective)
+
+    return shared
+
+
+def evaluate_objective(objective: Union[Objective, Callable], inds: list[Structure]) -> list[Any]:
+    """Evaluates objective for batch of structures.
+
+    Uses ``evaluate_batch`` of objective if it is provided,
+    otherwise calls objective for each structure.
+    """
+    evaluate_batch = getattr(objective, 'evaluate_batch', None)
+    if evaluate_batch is None:
+        return [objective(ind) for ind in inds]
+
+    values = evaluate_batch(inds)
+    if len(values) != len(inds):
+        raise ValueError(
+            f'{objective} returned {len(values)} values for batch of {len(inds)} structures.',
+        )
+
+    return np.asarray(values).tolist()
 
 
 class ObjectivesEvaluator:
-    """Implements objecives evaluation procedure."""
+    """Implements objecives evaluation procedure.
+
+    Args:
+        objectives (list[Objective]): Objectives to evaluate.
+        n_jobs (Optional[int]): Number of parallel workers, 0 or 1 to evaluate sequentially.
+        seed (Optional[int]): Root seed of workers random generators.
+        batch_size (Optional[int]): Max number of structures passed to ``evaluate_batch``
+            of objectives at once. None to evaluate all structures of population
+            in one batch, or in about four batches per worker for parallel evaluation.
+        cache_estimations (bool): If True, estimator outputs are memoized by structure
+            geometry within batch, so objectives sharing estimator run it once
+            per structure. Only for deterministic estimators. Defaults to False.
+
+    """
 
     def __init__(
         self,
         objectives: list[Objective],
         n_jobs=None,
+        seed=None,
+        batch_size: Optional[int] = None,
+        cache_estimations: bool = False,
     ) -> None:
         self.objectives = objectives
+        self.batch_size = batch_size
+        self.cache_estimations = cache_estimations
+        self.telemetry = Telemetry()
         if n_jobs in (0, 1):
             self._pm = None
         else:
-            self._pm = BaseParallelDispatcher(n_jobs)
+            self._pm = BaseParallelDispatcher(n_jobs, seed)
 
     def __call__(
         self,
         pop: Union[list[Structure], Structure],
         **kwargs,
-    ) -> list[Structure]:
+    ) -> Population:
         """Calls objectives evaluation."""
-        pop = ensure_wrapped_in_sequence(pop)
+        pop = Population.wrap(ensure_wrapped_in_sequence(pop))
 
         return self.set_pop_objectives(pop=pop)
 
+    def close(self) -> None:
+        """Stops workers of estimation, they will be started again on the next call."""
+        if self._pm:
+            self._pm.close()
+
+    def _batches(self, idxs: list[int]) -> list[list[int]]:
+        """Splits indices of individuals into batches."""
+        batch_size = self.batch_size
+        if batch_size is None:
+            n_batches = 4 * self._pm.n_jobs if self._pm else 1
+            batch_size = max(1, -(-len(idxs) // n_batches))
+
+        return [idxs[start : start + batch_size] for start in range(0, len(idxs), batch_size)]
+
     def set_pop_objectives(
         self,
-        pop: list[Structure],
-    ) -> list[Structure]:
-        """Evaluates objectives for whole population."""
+        pop: Population,
+    ) -> Population:
+        """Evaluates objectives for whole population.
+
+        Returns:
+            Population: Population sorted by fitness.
+        """
+        pop = Population.wrap(pop)
         idxs_to_eval = where(pop, lambda ind: len(ind.fitness) == 0)
-        individuals_to_eval = [pop[idx] for idx in idxs_to_eval]
-        if self._pm:
-            evaluated_individuals = self._pm.exec_parallel(
-                func=self.eval_objectives,
-                arguments=[(ind, self.objectives) for ind in individuals_to_eval],
-                use=True,
-                flatten=False,
-            )
-            for idx, evaluated_ind in zip(idxs_to_eval, evaluated_individuals):
-                pop[idx] = evaluated_ind
-        else:
-            for idx in where(pop, lambda ind: len(ind.fitness) == 0):
-                pop[idx] = self.eval_objectives(pop[idx], self.objectives)
+        batches = self._batches(idxs_to_eval)
+        self.telemetry.count('evaluated', len(idxs_to_eval))
+        self.telemetry.count('reused', len(pop) - len(idxs_to_eval))
+        with self.telemetry.stage('evaluation'):
+            if self._pm:
+                evaluated_individuals = self._pm.exec_parallel(
+                    func=self._eval_batch_task,
+                    arguments=[
+                        (self.objectives, *[pop[idx] for idx in batch]) for batch in batches
+                    ],
+                    use=True,
+                    flatten=True,
+                )
+                for idx, evaluated_ind in zip(idxs_to_eval, evaluated_individuals):
+                    pop[idx] = evaluated_ind
+            else:
+                for batch in batches:
+                    evaluated = self.eval_batch([pop[idx] for idx in batch], self.objectives)
+                    for idx, ind in zip(batch, evaluated):
+                        pop.set_fitness(idx, ind.fitness)
+
+        return pop.sorted()
+
+    def _eval_batch_task(self, objectives, *inds: Structure) -> list[Structure]:
+        """Worker task, structures are separate arguments to be passed in shared memory."""
+        return self.eval_batch(list(inds), objectives)
+
+    def eval_batch(self, inds: list[Structure], objectives) -> list[Structure]:
+        """Evaluates objectives for batch of structures."""
+        if self.cache_estimations:
+            objectives = with_shared_estimators(objectives)
+
+        values = [evaluate_objective(obj, inds) for obj in objectives]
+        for idx, ind in enumerate(inds):
+            ind.fitness = [obj_values[idx] for obj_values in values]
 
-        return sorted(pop, key=lambda x: x.fitness)
+        return inds
 
     def eval_objectives(self, ind: Structure, objectives) -> Structure:
         """Evaluates objectives."""
-        ind.fitness = [obj(ind) for obj in objectives]
-        return ind
+        return self.eval_batch([ind], objectives)[0]
@@ -1,16 +1,15 @@
-import copy
-import random
 from enum import Enum
 from functools import partial
 from itertools import product
 from typing import Callable
 
-import numpy as np
 from loguru import logger
 
 from gefest.core.geometry import Point, Polygon, Structure
 from gefest.core.geometry.domain import Domain
 from gefest.core.utils import where
+from gefest.core.utils.history import add_lineage, strip_lineage
+from gefest.core.utils.rng import get_rng
 
 
 def crossover_structures(
@@ -20,6 +19,7 @@ def crossover_structures(
     operations: list[Callable],
     operation_chance: float,
     operations_probs: list[int],
+    record_lineage: bool = False,
     **kwargs,
 ) -> tuple[Structure]:
     """Applys random crossover from given list for pair of structures.
@@ -31,19 +31,21 @@ def crossover_structures(
         operations (list[Callable]): List of crossovers operations to choose.
         operation_chance (float): Chance of crossover.
         operations_probs (list[int]): Probablilites of each crossover operation.
+        record_lineage (bool): If True, crossover is recorded into children lineage.
+            Defaults to False.
 
     Returns:
         tuple[Structure]: Сhildren.
     """
-    s1, s2 = copy.deepcopy(structure1), copy.deepcopy(structure2)
-    chosen_crossover = np.random.choice(
-        a=operations,
-        size=1,
-        p=operations_probs,
-    )
-    new_structure = chosen_crossover[0](s1, s2, domain)
+    s1, s2 = structure1.clone(), structure2.clone()
+    chosen_crossover = operations[get_rng().choice(len(operations), p=operations_probs)]
+    new_structure = chosen_crossover(s1, s2, domain)
     if not new_structure:
-        logger.warning(f'None out: {chosen_crossover[0].__name__}')
+        logger.warning(f'None out: {chosen_crossover.__name__}')
+    elif record_lineage:
+        for child in new_structure:
+            strip_lineage((child,))
+            add_lineage(child, chosen_crossover, (structure1, structure2))
 
     return new_structure
 
@@ -51,7 +53,7 @@ def crossover_structures(
 # pairs for crossover selection
 def panmixis(pop: list[Structure]) -> list[tuple[Structure, Structure]]:
     """Default pair selection strategy."""
-    np.random.shuffle(list(pop))
+    get_rng().shuffle(list(pop))
     return [(pop[idx], pop[idx + 1]) for idx in range(len(pop) - 1)]
 
 
@@ -63,10 +65,9 @@ def structure_level_crossover(
     **kwargs,
 ):
     """Exchanges points of two polygons."""
-    s1, s2 = copy.deepcopy(s1), copy.deepcopy(s2)
     polygons1 = s1.polygons
     polygons2 = s2.polygons
-    crossover_point = np.random.randint(
+    crossover_point = get_rng().integers(
         0,
         len(polygons1) + 1,
     )
@@ -80,8 +81,8 @@ def structure_level_crossover(
     if not isinstance(part_2, tuple):
         part_2 = part_2
 
-    result = list(copy.deepcopy(part_1))
-    result.extend(copy.deepcopy(part_2))
+    result = list(part_1)
+    result.extend(part_2)
 
     new_structure = Structure(polygons=result)
 
@@ -96,7 +97,7 @@ def polygon_level_crossover(
 ):
     """Exchanges points of two nearest polygons in structure."""
     geom = domain.geometry
-    s1, s2 = copy.deepcopy(s1), copy.deepcopy(s2)
+    s1, s2 = s1.clone(), s2.clone()
     intersected = False
     split_angle = 0
     pairs_dists = [
@@ -121,7 +122,7 @@ def polygon_level_crossover(
     poly_2 = pairs_dists[0][0][1]
     if intersected:
         # now not adaptive angle #
-        split_angle = (np.random.rand() * 2 - 1) * (70)
+        split_angle = (get_rng().random() * 2 - 1) * (70)
     elif pairs_dists[0][1] > domain.dist_between_polygons:
         return (s1,)
 
@@ -137,7 +138,7 @@ def polygon_level_crossover(
     new_parts = (*parts_1[0], *parts_2[1]) if c1.y > c2.y else (*parts_1[1], *parts_2[0])
     new_poly = geom.get_convex(Polygon(points=[Point(*p) for p in list(set(new_parts))]))
     if len(new_poly) > domain.max_points_num:
-        random_elements = random.choice(new_poly.points)
+        random_elements = new_poly.points[get_rng().integers(len(new_poly.points))]
         new_poly.points = list(filter(lambda x: x != random_elements, new_poly.points))
 
     idx_ = where(s1.polygons, lambda p: p == poly_1)[0]
@@ -1,32 +1,240 @@
 from enum import Enum
+from functools import lru_cache
+from itertools import combinations
+from math import comb
 
 import numpy as np
+from scipy.spatial import cKDTree
 from scipy.spatial.distance import cdist
 
+from gefest.core.geometry.datastructs.population import Population
 from gefest.core.geometry.datastructs.structure import Structure
+from gefest.core.utils.rng import get_rng
+
+
+def _fitness_matrix(pop: list[Structure]) -> np.ndarray:
+    """Returns population fitness as array of shape ``(n_individuals, n_objectives)``."""
+    return Population.wrap(pop).fitness
+
+
+def dominance_matrix(fitness: np.ndarray) -> np.ndarray:
+    """Calculates pairwise dominance for population.
+
+    Args:
+        fitness (np.ndarray): Fitness array of shape ``(n_individuals, n_objectives)``.
+
+    Returns:
+        np.ndarray: Boolean matrix, ``[i, j]`` is True if i-th individual
+            is not worse than j-th by all fitness components. Diagonal is False.
+    """
+    dominance = np.all(fitness[:, None, :] <= fitness[None, :, :], axis=2)
+    np.fill_diagonal(dominance, False)
+    return dominance
+
+
+def _ranks(values: np.ndarray) -> np.ndarray:
+    """Returns dense ranks of values starting from 1, equal values share rank."""
+    return np.unique(values, return_inverse=True)[1].reshape(-1) + 1
+
+
+def _dominance_sums_2d(fitness: np.ndarray, weights: np.ndarray, dominated: bool) -> np.ndarray:
+    """Sums weights of individuals which are dominated by or dominate each individual.
+
+    Two objectives only. Sweep over the first objective with Fenwick tree over
+    the second objective ranks, O(N log N). Individual itself is excluded from the sum.
+    """
+    first, second = fitness[:, 0], fitness[:, 1]
+    sign = -1 if dominated else 1
+    ranks = _ranks(sign * second)
+    tree = np.zeros(ranks.max() + 1, dtype=weights.dtype)
+    sums = np.zeros(len(fitness), dtype=weights.dtype)
+    order = np.argsort(sign * first, kind='stable')
+    group_start = 0
+    while group_start < len(order):
+        group_end = group_start
+        while group_end < len(order) and first[order[group_end]] == first[order[group_start]]:
+            group_end += 1
+
+        group = order[group_start:group_end]
+        for idx in group:
+            pos = ranks[idx]
+            while pos < len(tree):
+                tree[pos] += weights[idx]
+                pos += pos & -pos
+
+        for idx in group:
+            pos, total = ranks[idx], 0
+            while pos > 0:
+                total += tree[pos]
+                pos -= pos & -pos
+
+            sums[idx] = total - weights[idx]
+
+        group_start = group_end
+
+    return sums
+
+
+def non_dominated_sort(fitness: np.ndarray) -> np.ndarray:
+    """Splits population into Pareto fronts, all objectives are minimized.
+
+    Args:
+        fitness (np.ndarray): Fitness array of shape ``(n_individuals, n_objectives)``.
+
+    Returns:
+        np.ndarray: Front index of each individual, 0 for non-dominated ones.
+    """
+    not_worse = dominance_matrix(fitness)
+    strictly = not_worse & np.any(fitness[:, None, :] < fitness[None, :, :], axis=2)
+    dominated_by = strictly.sum(axis=0)
+    ranks = np.full(len(fitness), -1)
+    front_idx = 0
+    front = np.flatnonzero(dominated_by == 0)
+    while len(front) > 0:
+        ranks[front] = front_idx
+        dominated_by = dominated_by - strictly[front].sum(axis=0)
+        dominated_by[ranks >= 0] = -1
+        front = np.flatnonzero(dominated_by == 0)
+        front_idx += 1
+
+    return ranks
+
+
+def crowding_distance(fitness: np.ndarray) -> np.ndarray:
+    """Calculates NSGA-II crowding distance inside one front.
+
+    Boundary individuals by each objective get infinite distance.
+
+    Args:
+        fitness (np.ndarray): Fitness array of front, shape ``(n_individuals, n_objectives)``.
+
+    Returns:
+        np.ndarray: Crowding distance of each individual.
+    """
+    n_individuals = len(fitness)
+    if n_individuals <= 2:
+        return np.full(n_individuals, np.inf)
+
+    order = np.argsort(fitness, axis=0, kind='stable')
+    sorted_fitness = np.take_along_axis(fitness, order, axis=0)
+    span = sorted_fitness[-1] - sorted_fitness[0]
+    span[span == 0] = 1.0
+    gaps = np.full((n_individuals, fitness.shape[1]), np.inf)
+    gaps[1:-1] = (sorted_fitness[2:] - sorted_fitness[:-2]) / span
+    distances = np.zeros((n_individuals, fitness.shape[1]))
+    np.put_along_axis(distances, order, gaps, axis=0)
+    return distances.sum(axis=1)
+
+
+def das_dennis_directions(n_partitions: int, n_obj: int) -> np.ndarray:
+    """Generates uniformly spaced reference directions on unit simplex.
+
+    Das and Dennis systematic approach, each coordinate is a multiple of ``1 / n_partitions``.
+
+    Args:
+        n_partitions (int): Number of divisions along each objective axis.
+        n_obj (int): Number of objectives.
+
+    Returns:
+        np.ndarray: Directions array of shape ``(C(n_partitions + n_obj - 1, n_obj - 1), n_obj)``.
+    """
+    if n_obj == 1:
+        return np.ones((1, 1))
+
+    n_slots = n_partitions + n_obj - 1
+    bars = np.array(list(combinations(range(n_slots), n_obj - 1))).reshape(-1, n_obj - 1)
+    bounds = np.column_stack((np.full(len(bars), -1), bars, np.full(len(bars), n_slots)))
+    return (np.diff(bounds, axis=1) - 1) / n_partitions
+
+
+def _n_partitions_for(n_directions: int, n_obj: int) -> int:
+    """Returns smallest number of partitions which gives at least ``n_directions`` directions."""
+    n_partitions = 1
+    while comb(n_partitions + n_obj - 1, n_obj - 1) < n_directions:
+        n_partitions += 1
+
+    return n_partitions
+
+
+def _riesz_subset(candidates: np.ndarray, n_directions: int) -> np.ndarray:
+    """Greedily selects subset of directions with minimal Riesz s-energy.
+
+    Simplex vertices are taken first, then each step adds candidate
+    with the lowest energy ``sum(1 / d ** s)`` to already selected directions.
+    """
+    s = candidates.shape[1]
+    vertices = np.flatnonzero(candidates.max(axis=1) == 1)
+    selected = list(vertices[:n_directions])
+    energy = np.zeros(len(candidates))
+    for idx in selected:
+        energy += 1 / np.maximum(np.linalg.norm(candidates - candidates[idx], axis=1), 1e-12) ** s
+
+    energy[selected] = np.inf
+    while len(selected) < n_directions:
+        idx = int(np.argmin(energy))
+        selected.append(idx)
+        energy += 1 / np.maximum(np.linalg.norm(candidates - candidates[idx], axis=1), 1e-12) ** s
+        energy[selected] = np.inf
+
+    return candidates[np.sort(selected)]
+
+
+@lru_cache(maxsize=64)
+def reference_directions(n_directions: int, n_obj: int) -> np.ndarray:
+    """Returns ``n_directions`` uniformly spread reference directions on unit simplex.
+
+    Das-Dennis lattice is used when its size matches exactly,
+    otherwise the denser lattice is thinned by Riesz s-energy selection.
+    Results are cached, returned array is read-only.
+
+    Args:
+        n_directions (int): Number of directions, usually population size.
+        n_obj (int): Number of objectives.
+
+    Returns:
+        np.ndarray: Directions array of shape ``(n_directions, n_obj)``.
+    """
+    if n_directions == 1:
+        directions = np.full((1, n_obj), 1 / n_obj)
+    else:
+        directions = das_dennis_directions(_n_partitions_for(n_directions, n_obj), n_obj)
+        if len(directions) > n_directions:
+            directions = _riesz_subset(directions, n_directions)
+
+    directions.setflags(write=False)
+    return directions
 
 
 class SPEA2:
-    """SPEA2 selection strategy."""
+    """SPEA2 selection strategy.
+
+    Fitness components are evaluated over population fitness matrix with NumPy.
+    For two objectives problems with population larger than ``fast_path_size``
+    strength and raw fitness are computed with O(N log N) sweep
+    and density with k-d tree instead of pairwise matrices.
+    """
 
-    def __init__(self, single_demention_selection, init_pop, steps, **kwargs):
+    fast_path_size = 512
+
+    def __init__(self, single_demention_selection, init_pop, steps, k=0, **kwargs):
         self.steps = steps
         self.step_cntr = 0
         self.arch_size = int(len(init_pop) / 2)  # Archive size
         self.archive = []  # Archive population
         self.n_criteria = 2  # Number of criteria
+        self.k = k  # Neighbour index for density estimation
         self.single_demention_selection = single_demention_selection
 
-    def __call__(self, pop, pop_size, *args, **kwargs) -> None:
+    def __call__(self, pop, pop_size, *args, **kwargs) -> Population:
         """Calulates SPEA2 fitness function."""
-        pop = pop + self.archive
-        raw = self.raw(pop)
-        density = self.density(pop)
+        pop = Population([*pop, *self.archive]) if self.archive else Population.wrap(pop)
+        fitness = pop.fitness
+        spea2_fitness = self._raw(fitness) + self._density(fitness)
         for idx, _ in enumerate(pop):
-            pop[idx].extra_characteristics['SEPA2_fitness'] = raw[idx] + density[idx]
+            pop[idx].extra_characteristics['SEPA2_fitness'] = float(spea2_fitness[idx])
 
         if self.step_cntr == self.steps:
-            pop = self.archive
+            pop = Population(self.archive)
         else:
             pop = self.single_demention_selection(pop, pop_size)
 
@@ -51,72 +259,60 @@ class SPEA2:
             )
         )
 
-    def strength(self, pop) -> list[int]:
-        """Calculates strength for each individ in pop and arch.
+    def _use_fast_path(self, fitness: np.ndarray) -> bool:
+        return fitness.shape[1] == 2 and len(fitness) >= self.fast_path_size
 
-        Returns:
-            list[int]: strength of each individ
-        """
-        strength = []
+    def _strength(self, fitness: np.ndarray) -> np.ndarray:
+        if self._use_fast_path(fitness):
+            return _dominance_sums_2d(fitness, np.ones(len(fitness), dtype=int), dominated=True)
 
-        for i in range(len(pop)):
-            count = 0
-            for j in range(len(pop)):
-                if j == i:
-                    continue
+        return dominance_matrix(fitness).sum(axis=1)
 
-                if self.dominate(pop[i], pop[j]):
-                    count += 1
+    def _raw(self, fitness: np.ndarray) -> np.ndarray:
+        if self._use_fast_path(fitness):
+            strength = self._strength(fitness)
+            return _dominance_sums_2d(fitness, strength, dominated=False)
 
-            strength.append(count)
+        dominance = dominance_matrix(fitness)
+        return dominance.T @ dominance.sum(axis=1)
 
-        return strength
+    def _density(self, fitness: np.ndarray) -> np.ndarray:
+        if len(fitness) < 2:
+            return np.full(len(fitness), 0.5)
 
-    def raw(self, pop) -> list[int]:
-        """Calculates raw for pop and arch.
+        k = min(self.k, len(fitness) - 2)
+        if self._use_fast_path(fitness):
+            distances = cKDTree(fitness).query(fitness, k=k + 2)[0][:, k + 1]
+        else:
+            distances = cdist(fitness, fitness)
+            np.fill_diagonal(distances, np.inf)
+            distances = np.partition(distances, k, axis=1)[:, k]
 
-        Returns:
-            list[int]: Raw of each individ.
-        """
-        raw = []
-        strength = self.strength(pop)
+        return 1 / (distances + 2)
 
-        for i in range(len(pop)):
-            count = 0
-            for j in range(len(pop)):
-                if j == i:
-                    continue
+    def strength(self, pop) -> np.ndarray:
+        """Calculates strength for each individ in pop and arch.
 
-                if self.dominate(pop[j], pop[i]):
-                    count += strength[j]
+        Returns:
+            np.ndarray: strength of each individ
+        """
+        return self._strength(_fitness_matrix(pop))
 
-            raw.append(count)
+    def raw(self, pop) -> np.ndarray:
+        """Calculates raw for pop and arch.
 
-        return raw
+        Returns:
+            np.ndarray: Raw of each individ.
+        """
+        return self._raw(_fitness_matrix(pop))
 
-    def density(self, pop) -> list[float]:
+    def density(self, pop) -> np.ndarray:
         """Calculates density.
 
         Returns:
-            list[float]: Density of each individ in pop and arch.
+            np.ndarray: Density of each individ in pop and arch.
         """
-        density = []
-        k = 0
-
-        for i in range(len(pop)):
-            distance = []
-            first_point = np.array(pop[i].fitness)
-            for j in range(len(pop)):
-                if j == i:
-                    continue
-
-                second_point = np.array(pop[j].fitness)
-                distance.append(np.linalg.norm(first_point - second_point))
-
-            sorted_dist = np.sort(distance)
-            density.append(1 / (sorted_dist[k] + 2))
-
-        return density
+        return self._density(_fitness_matrix(pop))
 
     def environmental_selection(self, pop) -> None:
         """Updates archive population via environmental selection procedure."""
@@ -140,84 +336,187 @@ class SPEA2:
             )[: self.arch_size]
 
 
+class NSGA2:
+    """NSGA-II selection strategy.
+
+    Survivors are taken front by front after fast non-dominated sort,
+    the last front which does not fit entirely is truncated by crowding distance.
+    Front index and crowding distance are stored into ``extra_characteristics``
+    as ``nsga_rank`` and ``nsga_crowding``, fitness values stay unchanged.
+
+    For details see: https://ieeexplore.ieee.org/document/996017
+    """
+
+    def __init__(self, single_demention_selection, init_pop, *args, **kwargs):
+        self.single_demention_selection = single_demention_selection
+
+    def __call__(self, pop, pop_size, **kwargs):
+        """Selects best individuals."""
+        pop = Population.wrap(pop)
+        fitness = pop.fitness
+        ranks = non_dominated_sort(fitness)
+        crowding = np.zeros(len(pop))
+        for rank in range(ranks.max() + 1):
+            front = np.flatnonzero(ranks == rank)
+            crowding[front] = crowding_distance(fitness[front])
+
+        for idx, ind in enumerate(pop):
+            ind.extra_characteristics['nsga_rank'] = int(ranks[idx])
+            ind.extra_characteristics['nsga_crowding'] = float(crowding[idx])
+
+        order = np.lexsort((-crowding, ranks))
+        return pop.take(order[:pop_size])
+
+
+class NSGA3:
+    """NSGA-III selection strategy.
+
+    Survivors are taken front by front after fast non-dominated sort,
+    the last front which does not fit entirely is resolved by niching
+    over Das-Dennis reference directions in normalized objective space.
+    Front index, associated direction and distance to it are stored into
+    ``extra_characteristics`` as ``nsga_rank``, ``nsga_ref_dir`` and ``nsga_ref_dist``,
+    fitness values stay unchanged.
+
+    For details see: https://ieeexplore.ieee.org/document/6600851
+    """
+
+    def __init__(self, single_demention_selection, init_pop, *args, n_partitions=None, **kwargs):
+        self.single_demention_selection = single_demention_selection
+        n_obj = len(init_pop[0].fitness) if init_pop and init_pop[0].fitness else 2
+        self.n_partitions = n_partitions or _n_partitions_for(len(init_pop), n_obj)
+        self.ref_dirs = das_dennis_directions(self.n_partitions, n_obj)
+
+    def __call__(self, pop, pop_size, **kwargs):
+        """Selects best individuals."""
+        pop = Population.wrap(pop)
+        fitness = pop.fitness
+        if fitness.shape[1] != self.ref_dirs.shape[1]:
+            self.ref_dirs = das_dennis_directions(self.n_partitions, fitness.shape[1])
+
+        ranks = non_dominated_sort(fitness)
+        sorted_ranks = np.sort(ranks)
+        last_rank = sorted_ranks[min(pop_size, len(pop)) - 1]
+        candidates = np.flatnonzero(ranks <= last_rank)
+        niche, distance = self._associate(self._normalize(fitness[candidates]))
+
+        for idx, ind in enumerate(pop):
+            ind.extra_characteristics['nsga_rank'] = int(ranks[idx])
+
+        for pos, idx in enumerate(candidates):
+            pop[idx].extra_characteristics['nsga_ref_dir'] = int(niche[pos])
+            pop[idx].extra_characteristics['nsga_ref_dist'] = float(distance[pos])
+
+        in_last = ranks[candidates] == last_rank
+        selected = list(candidates[~in_last])
+        n_remaining = min(pop_size, len(pop)) - len(selected)
+        if n_remaining > 0:
+            chosen = self._niching(n_remaining, niche, distance, in_last)
+            selected.extend(candidates[chosen])
+
+        return pop.take(selected)
+
+    @staticmethod
+    def _normalize(fitness: np.ndarray) -> np.ndarray:
+        """Translates fitness to ideal point and scales by hyperplane intercepts."""
+        n_obj = fitness.shape[1]
+        translated = fitness - fitness.min(axis=0)
+        weights = np.eye(n_obj)
+        weights[weights == 0] = 1e6
+        asf = np.max(translated[:, None, :] * weights[None, :, :], axis=2)
+        extreme = translated[np.argmin(asf, axis=0)]
+        try:
+            intercepts = 1 / np.linalg.solve(extreme, np.ones(n_obj))
+            if not np.all(np.isfinite(intercepts)) or np.any(intercepts <= 1e-10):
+                raise np.linalg.LinAlgError
+        except np.linalg.LinAlgError:
+            intercepts = translated.max(axis=0)
+
+        intercepts[intercepts <= 1e-10] = 1.0
+        return translated / intercepts
+
+    def _associate(self, normalized: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Returns nearest reference direction and perpendicular distance to it."""
+        units = self.ref_dirs / np.linalg.norm(self.ref_dirs, axis=1, keepdims=True)
+        projections = normalized @ units.T
+        squared = np.sum(normalized**2, axis=1, keepdims=True) - projections**2
+        distances = np.sqrt(np.clip(squared, 0, None))
+        niche = np.argmin(distances, axis=1)
+        return niche, distances[np.arange(len(normalized)), niche]
+
+    def _niching(
+        self,
+        n_remaining: int,
+        niche: np.ndarray,
+        distance: np.ndarray,
+        in_last: np.ndarray,
+    ) -> list[int]:
+        """Chooses individuals from the last front to fill least crowded niches."""
+        niche_count = np.bincount(niche[~in_last], minlength=len(self.ref_dirs))
+        available = in_last.copy()
+        active = np.ones(len(self.ref_dirs), dtype=bool)
+        active[np.setdiff1d(np.arange(len(self.ref_dirs)), niche[available])] = False
+        chosen = []
+        while len(chosen) < n_remaining:
+            counts = np.where(active, niche_count, np.iinfo(niche_count.dtype).max)
+            min_dirs = np.flatnonzero(counts == counts.min())
+            direction = get_rng().choice(min_dirs)
+            members = np.flatnonzero(available & (niche == direction))
+            if niche_count[direction] == 0:
+                member = members[np.argmin(distance[members])]
+            else:
+                member = get_rng().choice(members)
+
+            chosen.append(member)
+            available[member] = False
+            niche_count[direction] += 1
+            if not np.any(available & (niche == direction)):
+                active[direction] = False
+
+        return chosen
+
+
 class MOEAD:
     """MOEA/D selection strategy.
 
+    Each individual is scalarized with Tchebycheff function over its own
+    reference direction, then single objective selection is applied.
+    Directions are built for the current population size and cached per size.
+    The scalarized value is stored into ``extra_characteristics`` as ``moead_fitness``,
+    fitness values stay unchanged. Ideal point is updated every generation.
+
     For details see: https://ieeexplore.ieee.org/document/4358754?arnumber=4358754
     """
 
     def __init__(self, single_demention_selection, init_pop, moead_n_neighbors, *args, **kwargs):
-        self.ref_dirs, self.ideal, self.neighbors = self._setup(init_pop, moead_n_neighbors)
+        self.n_neighbors = moead_n_neighbors
+        self.ideal = _fitness_matrix(init_pop).min(axis=0)
         self.single_demention_selection = single_demention_selection
 
     def __call__(self, pop, pop_size, **kwargs):
         """Selects best individuals."""
-        pop = self._set_moead_fitness(pop)
-        selected = self.single_demention_selection(pop, pop_size)
-        return selected
-
-    def _setup(self, pop, n_neighbors=2):
-        ref_dirs = self._get_uniform_weight(pop, len(pop[0].fitness))
-        ideal = np.min([ind.fitness for ind in pop], axis=0)
-        neighbors = np.argsort(cdist(ref_dirs, ref_dirs), axis=1, kind='quicksort')[
-            :,
-            :n_neighbors,
-        ]
-        return ref_dirs, ideal, neighbors
-
-    def _set_moead_fitness(self, pop):
-        for j, ind in enumerate(pop):
-            max_fun = -1.0e30
-            for n in range(len(ind.fitness)):
-                diff = abs(ind.fitness[n] - self.ideal[n])
-                if self.ref_dirs[j][n] == 0:
-                    feval = 0.0001 * diff
-                else:
-                    feval = diff * self.ref_dirs[j][n]
-
-                if feval > max_fun:
-                    max_fun = feval
-
-            ind.fitness = [max_fun + len(self.neighbors[j])]
-
-        return pop
-
-    def _get_uniform_weight(self, pop, n_obj):
-        """Sets precomputed weights.
-
-        Precomputed weights from
-        Zhang, Multiobjective Optimization Problems With Complicated Pareto Sets, MOEA/D and NSGA-II
-        """
-        assert n_obj == 2 or n_obj == 3, 'MOEAD can handle only 2 or 3 objectives problems'
-        m = len(pop)
-        if n_obj == 2:
-            ref_dirs = [[None for _ in range(n_obj)] for i in range(m)]
-            for n in range(m):
-                a = 1.0 * float(n) / (m - 1)
-                ref_dirs[n][0] = a
-                ref_dirs[n][1] = 1 - a
-        elif n_obj == 3:
-            """
-            Ported from Java code written by Wudong Liu
-                    (Source: http://dces.essex.ac.uk/staff/qzhang/moead/moead-java-source.zip)
-            """
-            m = len(pop)
-
-            ref_dirs = []
-            for i in range(m):
-                for j in range(m):
-                    if i + j <= m:
-                        k = m - i - j
-                        weight_scalars = [None] * 3
-                        weight_scalars[0] = float(i) / (m)
-                        weight_scalars[1] = float(j) / (m)
-                        weight_scalars[2] = float(k) / (m)
-                        ref_dirs.append(weight_scalars)
-            # Trim number of weights to fit population size
-            ref_dirs = sorted((x for x in ref_dirs), key=lambda x: sum(x), reverse=True)
-            ref_dirs = ref_dirs[:m]
-
-        return ref_dirs
+        pop = Population.wrap(pop)
+        scalarized = self._set_moead_fitness(pop)
+        proxies = Population(ind.clone() for ind in pop)
+        for idx, value in enumerate(scalarized):
+            proxies.set_fitness(idx, [float(value)])
+
+        positions = {id(proxy): idx for idx, proxy in enumerate(proxies)}
+        selected = self.single_demention_selection(proxies, pop_size)
+        return pop.take([positions[id(proxy)] for proxy in selected])
+
+    def _set_moead_fitness(self, pop) -> np.ndarray:
+        """Updates ideal point and calculates Tchebycheff scalarization for population."""
+        fitness = _fitness_matrix(pop)
+        self.ideal = np.minimum(self.ideal, fitness.min(axis=0))
+        weights = reference_directions(len(pop), fitness.shape[1])
+        weights = np.where(weights == 0, 0.0001, weights)
+        scalarized = np.max(np.abs(fitness - self.ideal) * weights, axis=1)
+        scalarized += min(self.n_neighbors, len(pop))
+        for ind, value in zip(pop, scalarized):
+            ind.extra_characteristics['moead_fitness'] = float(value)
+
+        return scalarized
 
 
 class MultiObjectiveSelectionTypes(Enum):
@@ -225,3 +524,5 @@ class MultiObjectiveSelectionTypes(Enum):
 
     moead = MOEAD
     spea2 = SPEA2
+    nsga2 = NSGA2
+    nsga3 = NSGA3
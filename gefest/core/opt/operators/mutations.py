@@ -1,19 +1,19 @@
-import copy
 from enum import Enum
 from functools import partial
 from typing import Callable
 
-import numpy as np
 from loguru import logger
 from shapely.geometry import LineString
 
-from gefest.core.geometry import Structure
+from gefest.core.geometry import Polygon, Structure
 from gefest.core.geometry.domain import Domain
 from gefest.core.geometry.utils import (
     get_convex_safe_area,
     get_random_poly,
     get_selfintersection_safe_point,
 )
+from gefest.core.utils.history import add_lineage
+from gefest.core.utils.rng import get_rng
 
 
 def mutate_structure(
@@ -22,6 +22,7 @@ def mutate_structure(
     operations: list[Callable],
     operation_chance: float,
     operations_probs: list[float],
+    record_lineage: bool = False,
     **kwargs,
 ) -> Structure:
     """Applys random mutation from given list for each polygon in structure.
@@ -32,28 +33,37 @@ def mutate_structure(
         mutations (list[Callable]): List of mutation operations to choose.
         mutation_chance (float): Chance to mutate polygon.
         mutations_probs (list[int]): Probablilites of each mutation operation.
+        record_lineage (bool): If True, mutations which changed structure
+            are recorded into its lineage. Defaults to False.
 
     Returns:
         Structure: Mutated structure. It is not guaranteed
             that the resulting structure will be valid or changed.
     """
-    new_structure = copy.deepcopy(structure)
+    new_structure = structure.clone()
 
     for _ in enumerate(range(len(new_structure))):
-        idx_ = np.random.randint(0, len(new_structure))
-        if np.random.random() < operation_chance:
-            chosen_mutation = np.random.choice(
-                a=operations,
-                size=1,
-                p=operations_probs,
-            )
-            new_structure = chosen_mutation[0](new_structure, domain, idx_)
-            if not new_structure:
-                logger.warning(f'None out: {chosen_mutation[0].__name__}')
+        if new_structure is None or len(new_structure) == 0:
+            break
+
+        idx_ = int(get_rng().integers(0, len(new_structure)))
+        if get_rng().random() < operation_chance:
+            chosen_mutation = operations[get_rng().choice(len(operations), p=operations_probs)]
+            polygons = new_structure.polygons if new_structure is not None else ()
+            new_structure = chosen_mutation(new_structure, domain, idx_)
+            if new_structure is None:
+                logger.warning(f'None out: {chosen_mutation.__name__}')
+            elif record_lineage and _polygons_replaced(polygons, new_structure.polygons):
+                add_lineage(new_structure, chosen_mutation, (structure,))
 
     return new_structure
 
 
+def _polygons_replaced(old: tuple[Polygon, ...], new: tuple[Polygon, ...]) -> bool:
+    """Checks if any polygon was replaced, changed polygons are always new objects."""
+    return len(old) != len(new) or any(a is not b for a, b in zip(old, new))
+
+
 @logger.catch
 def rotate_poly_mutation(
     new_structure: Structure,
@@ -62,7 +72,7 @@ def rotate_poly_mutation(
     **kwargs,
 ) -> Structure:
     """Rotares polygon for random angle."""
-    angle = float(np.random.randint(-120, 120))
+    angle = float(get_rng().integers(-120, 120))
     new_structure[idx_] = domain.geometry.rotate_poly(
         new_structure[idx_],
         angle,
@@ -79,7 +89,7 @@ def drop_poly_mutation(
 ) -> Structure:
     """Drops random polygon from structure."""
     if len(new_structure.polygons) > (domain.min_poly_num + 1):
-        idx_ = idx_ if idx_ else int(np.random.randint(0, len(new_structure)))
+        idx_ = idx_ if idx_ else int(get_rng().integers(0, len(new_structure)))
         polygon_to_remove = new_structure.polygons[idx_]
         if not any(p in polygon_to_remove for p in domain.fixed_points):
             new_structure.remove(polygon_to_remove)
@@ -113,8 +123,8 @@ def resize_poly_mutation(
     """Randomly resizes polygon."""
     new_structure[idx_] = domain.geometry.resize_poly(
         new_structure[idx_],
-        x_scale=np.random.uniform(0.25, 3, 1)[0],
-        y_scale=np.random.uniform(0.25, 3, 1)[0],
+        x_scale=get_rng().uniform(0.25, 3),
+        y_scale=get_rng().uniform(0.25, 3),
     )
     return new_structure
 
@@ -128,11 +138,11 @@ def pos_change_point_mutation(
 ) -> Structure:
     """Moves a random point without violating the geometry type specified in the domain."""
     geom = domain.geometry
-    poly = copy.deepcopy(new_structure[idx_])
+    poly = new_structure[idx_].copy()
     if poly[0] == poly[-1]:
         poly = poly[:-1]
 
-    mutate_point_idx = int(np.random.randint(0, len(poly)))
+    mutate_point_idx = int(get_rng().integers(0, len(poly)))
     new_point = None
     if not geom.is_convex or (len(poly) in (2, 3)):
         new_point, _ = get_selfintersection_safe_point(
@@ -181,12 +191,12 @@ def add_point_mutation(
 ):
     """Adds a random point without violating the geometry type specified in the domain."""
     geom = domain.geometry
-    poly = copy.deepcopy(new_structure[idx_])
+    poly = new_structure[idx_].copy()
 
     if poly[0] == poly[-1]:
         poly = poly[:-1]
 
-    mutate_point_idx = int(np.random.randint(0, len(poly)))
+    mutate_point_idx = int(get_rng().integers(0, len(poly)))
     new_point = None
     if not geom.is_convex or len(poly) == 3:
         new_point, _ = get_selfintersection_safe_point(
@@ -237,12 +247,12 @@ def drop_point_mutation(
     **kwargs,
 ):
     """Drops random point from polygon."""
-    polygon_to_mutate = new_structure[idx_]
+    polygon_to_mutate = new_structure[idx_].copy()
     if domain.geometry.is_closed:
         if polygon_to_mutate[0] == polygon_to_mutate[-1]:
             polygon_to_mutate = polygon_to_mutate[:-1]
 
-    mutate_point_idx = int(np.random.randint(0, len(polygon_to_mutate)))
+    mutate_point_idx = int(get_rng().integers(0, len(polygon_to_mutate)))
     point_to_mutate = polygon_to_mutate[mutate_point_idx]
 
     if len(polygon_to_mutate) > domain.min_points_num:
@@ -1,18 +1,18 @@
 import math
 from enum import Enum
 from functools import partial
-from random import randint
 
 import numpy as np
 
-from gefest.core.geometry import Structure
+from gefest.core.geometry import Population, Structure
+from gefest.core.utils.rng import get_rng
 
 
 def roulette_selection(
     pop: list[Structure],
     pop_size: int,
     **kwargs,
-) -> list[Structure]:
+) -> Population:
     """Selects the best ones from provided population.
 
     Args:
@@ -20,55 +20,74 @@ def roulette_selection(
         pop_size (int): population size limit
 
     Returns:
-        list[Structure]: best individuals from pop
+        Population: best individuals from pop
     """
-    _fitness = [i.fitness[0] for i in pop]
-    probability = [(i / (sum(_fitness))) for i in _fitness]
-    probability = [(max(probability) / i) for i in probability]
-    probability = [i / sum(probability) for i in probability]
+    pop = Population.wrap(pop)
+    _fitness = pop.fitness[:, 0]
+    probability = _fitness / _fitness.sum()
+    probability = probability.max() / probability
+    probability = probability / probability.sum()
 
-    chosen = []
-
-    while len(chosen) < pop_size:
-        chosen.append(pop[np.random.choice(a=range(len(pop)), p=probability)])
-
-    return chosen
+    chosen = get_rng().choice(len(pop), size=pop_size, p=probability)
+    return pop.take(chosen)
 
 
 def tournament_selection(
     pop: list[Structure],
     pop_size: int,
     fraction: float = 0.1,
+    n_rounds: int = 10,
     **kwargs,
-) -> list[Structure]:
+) -> Population:
     """Selects the best ones from provided population.
 
+    Each round holds all remaining tournaments at once as matrix of random indices
+    of not chosen yet individuals, repeated winners of the round are dropped.
+    Remaining places are filled with random not chosen individuals,
+    or with any individuals if there are no such.
+
     Args:
         pop (list[Structure]): population
         pop_size (int): population size limit
         fraction (float, optional): best part size. Defaults to 0.1.
+        n_rounds (int, optional): Max number of tournament rounds. Defaults to 10.
 
     Returns:
-        list[Structure]: The best individuals from given population.
+        Population: The best individuals from given population.
             Their number is equal to ``'initial_number' * fraction``
     """
+    pop = Population.wrap(pop)
     group_size = math.ceil(len(pop) * fraction)
     min_group_size = 2 if len(pop) > 1 else 1
     group_size = max(group_size, min_group_size)
+    ranks = np.empty(len(pop), dtype=int)
+    ranks[pop.argsort()] = np.arange(len(pop))
+
+    is_chosen = np.zeros(len(pop), dtype=bool)
     chosen = []
-    n_iter = 0
-    while len(chosen) < pop_size:
-        n_iter += 1
-        group = [pop[randint(0, len(pop) - 1)] for _ in range(group_size)]
-        best = min(group, key=lambda ind: ind.fitness)
-        if best not in chosen:
-            chosen.append(best)
-        elif n_iter > pop_size + 100:
-            n_iter = 0
-            rnd = pop[randint(0, len(pop) - 1)]
-            chosen.append(rnd)
-
-    return chosen
+    for _ in range(n_rounds):
+        n_left = pop_size - len(chosen)
+        candidates = np.flatnonzero(~is_chosen)
+        if n_left <= 0 or len(candidates) == 0:
+            break
+
+        groups = candidates[get_rng().integers(0, len(candidates), size=(n_left, group_size))]
+        winners = groups[np.arange(n_left), np.argmin(ranks[groups], axis=1)]
+        _, first = np.unique(winners, return_index=True)
+        winners = winners[np.sort(first)]
+        is_chosen[winners] = True
+        chosen.extend(winners.tolist())
+
+    n_left = pop_size - len(chosen)
+    if n_left > 0:
+        not_chosen = np.flatnonzero(~is_chosen)
+        if len(not_chosen) >= n_left:
+            chosen.extend(get_rng().choice(not_chosen, n_left, replace=False).tolist())
+        else:
+            chosen.extend(not_chosen.tolist())
+            chosen.extend(get_rng().integers(0, len(pop), n_left - len(not_chosen)).tolist())
+
+    return pop.take(chosen)
 
 
 class SelectionTypes(Enum):
@@ -1,13 +1,12 @@
-from copy import deepcopy
 from typing import Union
 
-from golem.utilities.data_structures import ensure_wrapped_in_sequence
 from loguru import logger
 
 from gefest.core.geometry import Structure
 from gefest.core.geometry.domain import Domain
 from gefest.core.opt.postproc.rules_base import PolygonRule, StructureRule
 from gefest.core.opt.postproc.validation import validate
+from gefest.core.utils.functions import ensure_wrapped_in_sequence
 
 
 class Postrocessor:
@@ -20,9 +19,18 @@ class Postrocessor:
         domain: Domain,
         attempts: int = 3,
     ) -> list[Union[Structure, None]]:
-        """Applys postprocessing rules over all provided structures."""
-        structures = ensure_wrapped_in_sequence(structures)
+        """Applys postprocessing rules over all provided structures.
+
+        Args:
+            structures (Union[Structure, list[Structure]]): Structures for postprocessing.
+            rules (list[Union[StructureRule, PolygonRule]]): Postprocessing rules.
+            domain (Domain): domain
+            attempts (int, optional): Number of attempths to fix errors. Defaults to 3.
 
+        Returns:
+            list[Union[Structure, None]]: Postprocessed structures, None for invalid ones.
+        """
+        structures = ensure_wrapped_in_sequence(structures)
         post_processed = [
             Postrocessor.postprocess_structure(struct, rules, domain, attempts)
             for struct in structures
@@ -91,7 +99,7 @@ class Postrocessor:
             logger.error('Wrong structure - problems with points')
             return None
 
-        corrected_structure = deepcopy(structure)
+        corrected_structure = structure.clone()
 
         for rule in (rule for rule in rules if isinstance(rule, PolygonRule)):
             corrected_structure = Postrocessor._apply_polygon_rule(
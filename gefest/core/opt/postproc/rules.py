@@ -1,4 +1,3 @@
-import copy
 from enum import Enum
 from itertools import combinations
 
@@ -12,6 +11,7 @@ from shapely.validation import explain_validity
 from gefest.core.geometry import Point, Polygon, Structure
 from gefest.core.geometry.domain import Domain
 from gefest.core.opt.postproc.rules_base import PolygonRule, StructureRule
+from gefest.core.utils.rng import get_rng
 
 
 class PolygonsNotTooClose(StructureRule):
@@ -83,7 +83,7 @@ class PointsNotTooClose(PolygonRule):
             ``True`` if any side of poly have incorrect lenght, otherwise - ``False``
 
         """
-        poly = copy.deepcopy(structure[idx_poly_with_error])
+        poly = structure[idx_poly_with_error].copy()
         if poly[0] != poly[-1] and domain.geometry.is_closed:
             poly.points = poly.points.append(poly[0])
 
@@ -108,7 +108,7 @@ class PointsNotTooClose(PolygonRule):
         domain: Domain,
     ) -> Polygon:
         """Corrects polygon."""
-        poly = copy.deepcopy(structure[idx_poly_with_error])
+        poly = structure[idx_poly_with_error].copy()
         poly = domain.geometry.simplify(poly, domain.dist_between_points * 1.05)
 
         if poly[0] != poly[-1] and domain.geometry.is_closed:
@@ -169,7 +169,7 @@ class PolygonNotOverlapsProhibited(PolygonRule):
 
                 parts = res.geoms
                 parts = [g for g in parts if not g.intersects(prohib)]
-                poly = np.random.choice(parts)
+                poly = parts[get_rng().integers(len(parts))]
                 return Polygon([Point(p[0], p[1]) for p in poly.coords])
             else:
                 return Polygon([Point(p[0], p[1]) for p in poly.coords])
@@ -204,7 +204,7 @@ class PolygonGeometryIsValid(PolygonRule):
         domain: Domain,
     ) -> Polygon:
         """Corrects polygon geometry."""
-        poly = structure[idx_poly_with_error]
+        poly = structure[idx_poly_with_error].copy()
         if domain.geometry.is_closed and (poly[0] != poly[-1]):
             poly.points.append(poly.points[0])
 
@@ -245,7 +245,7 @@ class PolygonNotOutOfBounds(PolygonRule):
     ) -> Polygon:
         """Corrects out of bound polygon."""
         point_moved = False
-        poly = structure[idx_poly_with_error]
+        poly = structure[idx_poly_with_error].copy()
         for p_id, point in enumerate(poly):
             if point in domain.fixed_points:
                 continue
@@ -297,7 +297,7 @@ class PolygonNotSelfIntersects(PolygonRule):
         domain: Domain,
     ) -> Polygon:
         """Corrects selfintersection in polygon."""
-        poly = structure[idx_poly_with_error]
+        poly = structure[idx_poly_with_error].copy()
         poly = domain.geometry.get_convex(poly)
         if not domain.geometry.is_closed:
             poly.points = poly.points[:-1]
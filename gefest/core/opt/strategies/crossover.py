@@ -2,19 +2,17 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-import numpy as np
-
 if TYPE_CHECKING:
     from gefest.core.configs.optimization_params import OptimizationParams
 
-import copy
 from functools import partial
 from typing import Callable
 
 from gefest.core.geometry import Structure
 from gefest.core.opt.operators.crossovers import crossover_structures
 from gefest.core.utils import where
-from gefest.core.utils.parallel_manager import BaseParallelDispatcher
+from gefest.core.utils.rng import get_rng
+from gefest.core.utils.telemetry import Telemetry
 
 from .strategy import Strategy
 
@@ -33,7 +31,10 @@ class CrossoverStrategy(Strategy):
         self.sampler: Callable = opt_params.sampler
         self.domain = opt_params.domain
         self.postprocess_attempts = opt_params.postprocess_attempts
-        self._pm = BaseParallelDispatcher(opt_params.n_jobs)
+        self._pm = opt_params.parallel_dispatcher
+        log_format = getattr(opt_params.log_format, 'value', opt_params.log_format)
+        self.record_lineage = log_format == 'history'
+        self.telemetry = Telemetry()
 
     def __call__(self, pop: list[Structure]) -> list[Structure]:
         """Calls crossover method."""
@@ -47,33 +48,40 @@ class CrossoverStrategy(Strategy):
             operations=self.crossovers,
             operation_chance=self.crossover_chacne,
             operations_probs=self.crossovers_probs,
+            record_lineage=self.record_lineage,
         )
 
-        pairs = copy.deepcopy(self.parent_pairs_selector(pop))
+        pairs = self.parent_pairs_selector(pop)
 
-        crossover_mask = np.random.choice(
+        crossover_mask = get_rng().choice(
             [True, False],
             size=len(pairs),
             p=[self.crossover_chacne, 1 - self.crossover_chacne],
         )
         pairs = [pair for idx, pair in enumerate(pairs) if crossover_mask[idx]]
 
-        new_generation = self._pm.exec_parallel(
-            func=crossover,
-            arguments=pairs,
-            use=True,
-        )
-
-        new_generation = self._pm.exec_parallel(
-            func=self.postprocess,
-            arguments=[(ind,) for ind in new_generation],
-            use=True,
-            flatten=True,
-        )
+        with self.telemetry.stage('crossover'):
+            new_generation = self._pm.exec_parallel(
+                func=crossover,
+                arguments=pairs,
+                use=True,
+            )
+
+        self.telemetry.count('offspring', len(new_generation))
+        with self.telemetry.stage('postprocessing'):
+            new_generation = self._pm.exec_parallel(
+                func=self.postprocess,
+                arguments=[(ind,) for ind in new_generation],
+                use=True,
+                flatten=True,
+            )
 
         idx_failed = where(new_generation, lambda ind: ind is None)
+        self.telemetry.count('invalid_offspring', len(idx_failed))
         if len(idx_failed) > 0:
-            generated = self.sampler(len(idx_failed))
+            with self.telemetry.stage('resampling'):
+                generated = self.sampler(len(idx_failed))
+
             for enum_id, idx in enumerate(idx_failed):
                 new_generation[idx] = generated[enum_id]
 
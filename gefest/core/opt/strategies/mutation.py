@@ -5,14 +5,13 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from gefest.core.configs.optimization_params import OptimizationParams
 
-import copy
 from functools import partial
 from typing import Callable
 
 from gefest.core.geometry import Structure
 from gefest.core.opt.operators.mutations import mutate_structure
 from gefest.core.utils import where
-from gefest.core.utils.parallel_manager import BaseParallelDispatcher
+from gefest.core.utils.telemetry import Telemetry
 
 from .strategy import Strategy
 
@@ -29,7 +28,10 @@ class MutationStrategy(Strategy):
         self.postprocess: Callable = opt_params.postprocessor
         self.sampler = opt_params.sampler
         self.postprocess_attempts = opt_params.postprocess_attempts
-        self._pm = BaseParallelDispatcher(opt_params.n_jobs)
+        self._pm = opt_params.parallel_dispatcher
+        log_format = getattr(opt_params.log_format, 'value', opt_params.log_format)
+        self.record_lineage = log_format == 'history'
+        self.telemetry = Telemetry()
 
     def __call__(self, pop: list[Structure]) -> list[Structure]:
         """Calls mutate method."""
@@ -50,26 +52,31 @@ class MutationStrategy(Strategy):
             operations=self.mutations,
             operation_chance=self.mutation_chance,
             operations_probs=self.mutations_probs,
+            record_lineage=self.record_lineage,
         )
-        pop_ = copy.deepcopy(pop)
-
-        mutated_pop = self._pm.exec_parallel(
-            func=mutator,
-            arguments=[(ind,) for ind in pop_],
-            use=True,
-            flatten=False,
-        )
-
-        mutated_pop = self._pm.exec_parallel(
-            func=partial(self.postprocess, attempts=3),
-            arguments=[(ind,) for ind in mutated_pop],
-            use=True,
-            flatten=True,
-        )
+        with self.telemetry.stage('mutation'):
+            mutated_pop = self._pm.exec_parallel(
+                func=mutator,
+                arguments=[(ind,) for ind in pop],
+                use=True,
+                flatten=False,
+            )
+
+        self.telemetry.count('offspring', len(mutated_pop))
+        with self.telemetry.stage('postprocessing'):
+            mutated_pop = self._pm.exec_parallel(
+                func=partial(self.postprocess, attempts=3),
+                arguments=[(ind,) for ind in mutated_pop],
+                use=True,
+                flatten=True,
+            )
 
         idx_failed = where(mutated_pop, lambda ind: ind is None)
+        self.telemetry.count('invalid_offspring', len(idx_failed))
         if len(idx_failed) > 0:
-            generated = self.sampler(len(idx_failed))
+            with self.telemetry.stage('resampling'):
+                generated = self.sampler(len(idx_failed))
+
             for enum_id, idx in enumerate(idx_failed):
                 mutated_pop[idx] = generated[enum_id]
 
@@ -0,0 +1,83 @@
+"""Warm start of optimization from results of previous runs.
+
+Best structures of logged population are loaded with their fitness,
+structures invalid in the current domain are dropped. Fitness is kept
+only if previous run had the same objectives, see ``objectives_identity``,
+so structures are not evaluated again.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import TYPE_CHECKING, Optional
+
+from loguru import logger
+
+from gefest.core.geometry import Structure
+from gefest.core.geometry.domain import Domain
+from gefest.core.opt.objective.objective import objectives_identity
+from gefest.core.opt.postproc.validation import validate
+from gefest.core.utils.history import strip_lineage
+from gefest.core.utils.loaders import load_generation, logged_steps
+
+if TYPE_CHECKING:
+    from gefest.core.configs.optimization_params import OptimizationParams
+
+
+def _is_valid(structure: Structure, rules: list, domain: Domain) -> bool:
+    """Checks polygons number and postprocessing rules without correction."""
+    return domain.min_poly_num <= len(structure) <= domain.max_poly_num and validate(
+        structure,
+        rules,
+        domain,
+    )
+
+
+def _logged_objectives(run_dir: str) -> Optional[list[str]]:
+    if not os.path.isfile(f'{run_dir}/meta.json'):
+        return None
+
+    with open(f'{run_dir}/meta.json') as file:
+        return json.load(file).get('objectives')
+
+
+def warm_start(
+    run_dir: str,
+    opt_params: OptimizationParams,
+    top_k: Optional[int] = None,
+    step: Optional[str] = None,
+) -> list[Structure]:
+    """Loads best structures of previous run to start optimization from.
+
+    Args:
+        run_dir (str): Directory of previous run logs in any log format.
+        opt_params (OptimizationParams): Configuration of new run.
+        top_k (Optional[int]): Number of structures to load. Defaults to None,
+            means ``opt_params.pop_size``.
+        step (Optional[str]): Name of logged population. Defaults to None,
+            means the last population of optimization.
+
+    Returns:
+        list[Structure]: Valid structures, with fitness if objectives are the same.
+
+    """
+    step = step or logged_steps(run_dir)[-1]
+    pop = load_generation(run_dir, step, top_k or opt_params.pop_size)
+    strip_lineage(pop)
+
+    valid = opt_params.parallel_dispatcher.exec_parallel(
+        _is_valid,
+        [(ind, opt_params.postprocess_rules, opt_params.domain) for ind in pop],
+        flatten=False,
+    )
+    if not all(valid):
+        logger.info(f'{len(valid) - sum(valid)} of {len(pop)} loaded structures are invalid.')
+
+    pop = [ind for ind, is_valid in zip(pop, valid) if is_valid]
+    if _logged_objectives(run_dir) != objectives_identity(opt_params.objectives):
+        logger.info('Objectives of runs differ, loaded structures will be evaluated.')
+        for ind in pop:
+            ind.fitness = []
+
+    return pop
@@ -1,2 +1,2 @@
 from .functions import project_root, where
-from .parallel_manager import BaseParallelDispatcher
+from .parallel_manager import BaseParallelDispatcher, ParallelBackends
@@ -0,0 +1,34 @@
+"""Checkpoints of optimizer state.
+
+Checkpoint is a pickled dict with everything optimizer needs to continue run:
+population with its fitness, selector, random generator and seed sequences states.
+It is written into temporary file first, which then replaces previous checkpoint,
+so run interrupted during saving keeps the last complete checkpoint.
+"""
+
+import os
+import pickle
+
+
+def save_checkpoint(state: dict, path: str) -> None:
+    """Atomically saves optimizer state.
+
+    Args:
+        state (dict): Optimizer state.
+        path (str): Checkpoint file path.
+
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'wb') as file:
+        pickle.dump(state, file, protocol=pickle.HIGHEST_PROTOCOL)
+        file.flush()
+        os.fsync(file.fileno())
+
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: str) -> dict:
+    """Loads optimizer state saved by ``save_checkpoint``."""
+    with open(path, 'rb') as file:
+        return pickle.load(file)
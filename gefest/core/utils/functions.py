@@ -1,10 +1,11 @@
-import json
+from collections.abc import Iterable, Sized
 from pathlib import Path
 from typing import Any, Callable
 
 from loguru import logger
 
 from gefest.core.geometry import Structure
+from gefest.core.utils.loaders import iter_structs
 
 
 def project_root() -> Path:
@@ -23,15 +24,7 @@ def parse_structs(path: str) -> list[Structure]:
         list[Structure]: Serialized population.
 
     """
-    with open(path, 'r') as file:
-        dict_strings = file.readlines()
-
-    pop = []
-    for dict_string in dict_strings:
-        ind = Structure(**json.loads(dict_string))
-        pop.append(ind)
-
-    return pop
+    return list(iter_structs(path))
 
 
 @logger.catch
@@ -51,3 +44,27 @@ def where(
 
     """
     return [idx for idx, ind in enumerate(sequence) if mask_rule(ind)]
+
+
+def ensure_wrapped_in_sequence(obj: Any) -> Any:
+    """Wraps single object into list, sequences and None are returned as is.
+
+    Strings and structures are considered single objects.
+
+    Args:
+        obj (Any): Object or sequence of objects.
+
+    Returns:
+        Any: Provided sequence, None or list with provided object.
+
+    """
+    if obj is None:
+        return obj
+
+    if isinstance(obj, str) or not isinstance(obj, Iterable):
+        return [obj]
+
+    if not isinstance(obj, Sized):
+        return list(obj)
+
+    return obj
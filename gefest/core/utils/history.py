@@ -0,0 +1,257 @@
+"""Deduplicated storage of optimization run history.
+
+Each unique structure is written once, structures are identified
+by hash of their geometry. Generations are stored as lists of structures indices.
+Reproduction operators record lineage of new structures into
+``extra_characteristics['lineage']``: geometry hashes of parents
+and names of applied operators. The store moves lineage into its records,
+optimizer removes it from population after logging.
+
+Files of ``history`` directory:
+    ``coords.bin``: float64 points coordinates of all structures,
+    ``poly_sizes.bin``: int64 number of points of each polygon,
+    ``struct_sizes.bin``: int64 number of polygons of each structure,
+    ``structures.jsonl``: hash, ids, fitness, extra characteristics and lineage of each structure,
+    ``generations.jsonl``: step name and structures indices of each logged population.
+"""
+
+import json
+import os
+from collections import deque
+from typing import Any, Callable, Optional, Sequence, Union
+
+import numpy as np
+
+from gefest.core.geometry import Structure
+from gefest.core.geometry.datastructs.packed import PackedPopulation, encode_id, restore
+from gefest.core.utils.log_writers import PopulationWriter
+
+LINEAGE_KEY = 'lineage'
+
+_ARRAYS = {'coords': np.float64, 'poly_sizes': np.int64, 'struct_sizes': np.int64}
+
+
+def add_lineage(child: Structure, operator: Callable, parents: Sequence[Structure] = ()) -> None:
+    """Records operator applied to structure.
+
+    If structure already has lineage, e.g. it is a child of crossover
+    in current generation, operator is appended to it.
+    Otherwise new lineage is started from provided parents.
+
+    Args:
+        child (Structure): Structure produced by operator.
+        operator (Callable): Applied operator.
+        parents (Sequence[Structure]): Parents of structure, used if it has no lineage.
+
+    """
+    lineage = child.extra_characteristics.get(LINEAGE_KEY)
+    if lineage is None:
+        lineage = {'parents': [parent.geometry_hash() for parent in parents], 'operators': []}
+    else:
+        lineage = {'parents': list(lineage['parents']), 'operators': list(lineage['operators'])}
+
+    lineage['operators'].append(getattr(operator, '__name__', str(operator)))
+    child.extra_characteristics[LINEAGE_KEY] = lineage
+
+
+def strip_lineage(pop: Sequence[Structure]) -> None:
+    """Removes recorded lineage from structures, so next operators start new one."""
+    for ind in pop:
+        ind.extra_characteristics.pop(LINEAGE_KEY, None)
+
+
+class HistoryWriter(PopulationWriter):
+    """Writes populations into deduplicated run history.
+
+    Files are opened once per run and appended with new structures only.
+    History of previous run in the same directory is overwritten,
+    unless writer resumes interrupted run.
+
+    Args:
+        run_dir (str): Directory of run logs, history is saved into its ``history`` subdirectory.
+        resume (bool): If True, structures index is restored from existing history
+            and new records are appended to it. Defaults to False.
+
+    """
+
+    extension = 'history'
+
+    def __init__(self, run_dir: str, resume: bool = False) -> None:
+        super().__init__(run_dir, resume)
+        self.history_dir = f'{run_dir}/history'
+        os.makedirs(self.history_dir, exist_ok=True)
+        self._index: dict[str, int] = {}
+        if resume and os.path.exists(f'{self.history_dir}/structures.jsonl'):
+            self._restore_index()
+            mode = 'a'
+        else:
+            mode = 'w'
+
+        self._arrays = {
+            name: open(f'{self.history_dir}/{name}.bin', f'{mode}b') for name in _ARRAYS
+        }
+        self._structures = open(f'{self.history_dir}/structures.jsonl', mode)
+        self._generations = open(f'{self.history_dir}/generations.jsonl', mode)
+
+    def _restore_index(self) -> None:
+        """Loads index of saved structures and drops arrays data not covered by records."""
+        history = RunHistory(self.history_dir)
+        self._index = dict(history.index)
+        packed = history.packed
+        lengths = {
+            'coords': packed.coords.size,
+            'poly_sizes': len(packed.poly_offsets) - 1,
+            'struct_sizes': len(history),
+        }
+        for name, length in lengths.items():
+            os.truncate(f'{self.history_dir}/{name}.bin', length * np.dtype(_ARRAYS[name]).itemsize)
+
+    def write(self, pop: list[Structure], step: str) -> None:
+        """Appends unseen structures and population members."""
+        members, new = [], []
+        for ind in pop:
+            geometry_hash = ind.geometry_hash()
+            if geometry_hash not in self._index:
+                self._index[geometry_hash] = len(self._index)
+                new.append((geometry_hash, ind))
+
+            members.append(self._index[geometry_hash])
+
+        if new:
+            self._append([ind for _, ind in new])
+            self._structures.writelines(
+                json.dumps(self._record(geometry_hash, ind), default=str) + '\n'
+                for geometry_hash, ind in new
+            )
+
+        self._generations.write(json.dumps({'step': step, 'members': members}) + '\n')
+
+    def _append(self, structures: list[Structure]) -> None:
+        polygons = [poly for ind in structures for poly in ind.polygons]
+        arrays = {
+            'coords': [(pt.x, pt.y) for poly in polygons for pt in poly.points],
+            'poly_sizes': [len(poly.points) for poly in polygons],
+            'struct_sizes': [len(ind.polygons) for ind in structures],
+        }
+        for name, values in arrays.items():
+            self._arrays[name].write(np.asarray(values, dtype=_ARRAYS[name]).tobytes())
+
+    def _record(self, geometry_hash: str, ind: Structure) -> dict:
+        extra = dict(ind.extra_characteristics)
+        lineage = extra.pop(LINEAGE_KEY, None)
+        if lineage is not None:
+            lineage = {
+                'parents': [self._index.get(parent, parent) for parent in lineage['parents']],
+                'operators': lineage['operators'],
+            }
+
+        return {
+            'hash': geometry_hash,
+            'id': encode_id(ind.id_),
+            'poly_ids': [encode_id(poly.id_) for poly in ind.polygons],
+            'fitness': list(ind.fitness),
+            'extra_characteristics': extra,
+            'lineage': lineage,
+        }
+
+    def flush(self) -> None:
+        """Flushes files buffers."""
+        for file in (*self._arrays.values(), self._structures, self._generations):
+            file.flush()
+
+    def close(self) -> None:
+        """Closes history files."""
+        for file in (*self._arrays.values(), self._structures, self._generations):
+            file.close()
+
+
+class RunHistory:
+    """Reader of run history saved by ``HistoryWriter``.
+
+    Args:
+        path (str): Path to run logs directory or its ``history`` subdirectory.
+
+    """
+
+    def __init__(self, path: str) -> None:
+        if os.path.isdir(f'{path}/history'):
+            path = f'{path}/history'
+
+        with open(f'{path}/structures.jsonl') as file:
+            self.records: list[dict] = [json.loads(line) for line in file]
+
+        with open(f'{path}/generations.jsonl') as file:
+            generations = [json.loads(line) for line in file]
+
+        self.generations: dict[str, list[int]] = {
+            gen['step']: gen['members'] for gen in generations
+        }
+        self.index: dict[str, int] = {rec['hash']: idx for idx, rec in enumerate(self.records)}
+        arrays = {
+            name: np.fromfile(f'{path}/{name}.bin', dtype=dtype) for name, dtype in _ARRAYS.items()
+        }
+        self.packed = self._pack(arrays)
+
+    def _pack(self, arrays: dict[str, np.ndarray]) -> PackedPopulation:
+        n_structures = len(self.records)
+        struct_sizes = arrays['struct_sizes'][:n_structures]
+        n_polygons = int(struct_sizes.sum())
+        poly_sizes = arrays['poly_sizes'][:n_polygons]
+        fitness_len = np.array([len(rec['fitness']) for rec in self.records], dtype=np.int64)
+        fitness = np.full((n_structures, fitness_len.max(initial=0)), np.nan)
+        for idx, rec in enumerate(self.records):
+            fitness[idx, : fitness_len[idx]] = rec['fitness']
+
+        return PackedPopulation(
+            coords=arrays['coords'][: 2 * int(poly_sizes.sum())].reshape(-1, 2),
+            poly_offsets=np.concatenate(([0], np.cumsum(poly_sizes))),
+            struct_offsets=np.concatenate(([0], np.cumsum(struct_sizes))),
+            poly_ids=np.array([pid for rec in self.records for pid in rec['poly_ids']], dtype=str),
+            struct_ids=np.array([rec['id'] for rec in self.records], dtype=str),
+            fitness=fitness,
+            fitness_len=fitness_len,
+        )
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def steps(self) -> list[str]:
+        """Names of logged populations in logging order."""
+        return list(self.generations)
+
+    def structure(self, idx: int) -> Structure:
+        """Returns structure by its index in history."""
+        struct = self.packed.structure(idx)
+        return restore(
+            Structure,
+            polygons=struct.polygons,
+            fitness=struct.fitness,
+            extra_characteristics=dict(self.records[idx]['extra_characteristics']),
+            id_=struct.id_,
+        )
+
+    def generation(self, step: Union[str, int]) -> list[Structure]:
+        """Returns logged population by step name or number."""
+        members = self.generations[step if isinstance(step, str) else self.steps[step]]
+        return [self.structure(idx) for idx in members]
+
+    def lineage(self, idx: int) -> Optional[dict[str, Any]]:
+        """Returns parents indices and operators which produced structure.
+
+        Parents unknown to history, e.g. from initial population, are kept as hashes.
+        """
+        return self.records[idx]['lineage']
+
+    def ancestors(self, idx: int) -> list[int]:
+        """Returns indices of all known ancestors of structure in breadth-first order."""
+        result, seen, queue = [], {idx}, deque([idx])
+        while queue:
+            lineage = self.lineage(queue.popleft())
+            for parent in lineage['parents'] if lineage else []:
+                if isinstance(parent, int) and parent not in seen:
+                    seen.add(parent)
+                    result.append(parent)
+                    queue.append(parent)
+
+        return result
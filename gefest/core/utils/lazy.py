@@ -0,0 +1,63 @@
+"""Deferred imports of heavy optional backends.
+
+GOLEM optimizers and tuners, neural networks and simulators estimators
+import large libraries. Packages expose them with module level ``__getattr__``
+and configuration refers to them with ``LazyObject``, so they are imported
+on first use only and parallel workers do not import unused backends.
+"""
+
+import importlib
+import sys
+from typing import Any, Callable
+
+
+def import_object(path: str) -> Any:
+    """Imports object by its full path, e.g. ``'gefest.tools.estimators.estimator.Estimator'``."""
+    module, _, name = path.rpartition('.')
+    return getattr(importlib.import_module(module), name)
+
+
+def lazy_getattr(module_name: str, exports: dict[str, str]) -> Callable[[str], Any]:
+    """Creates module ``__getattr__`` which imports exported objects on first access.
+
+    Args:
+        module_name (str): Name of module, ``__name__``.
+        exports (dict[str, str]): Full paths of exported objects by their names.
+
+    Returns:
+        Callable[[str], Any]: Module ``__getattr__`` function.
+
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in exports:
+            raise AttributeError(f'module {module_name!r} has no attribute {name!r}')
+
+        value = import_object(exports[name])
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    return __getattr__
+
+
+class LazyObject:
+    """Reference to class or function, which is imported on first call.
+
+    Args:
+        path (str): Full path of object.
+
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def load(self) -> Any:
+        """Imports and returns referenced object."""
+        return import_object(self.path)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        """Calls referenced object."""
+        return self.load()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f'LazyObject({self.path!r})'
@@ -0,0 +1,254 @@
+"""Fast loaders of populations saved by population writers.
+
+Json lines logs are read line by line and parsed with orjson, if it is installed.
+Trusted mode restores structures without pydantic validation,
+so it should be used only for files produced by GEFEST itself.
+Top-k selection parses only fitness of each line, other lines are skipped.
+"""
+
+import heapq
+import json
+import os
+from math import inf
+from typing import Iterator, Optional, Union
+from uuid import uuid4
+
+import numpy as np
+
+from gefest.core.geometry import Point, Polygon, Structure
+from gefest.core.geometry.datastructs.packed import (
+    ID_DTYPE,
+    PackedPopulation,
+    decode_id,
+    restore,
+)
+from gefest.core.utils.history import RunHistory
+
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+_FITNESS_KEY = b'"fitness":'
+
+
+def iter_lines(path: str) -> Iterator[bytes]:
+    """Yields non-empty lines of file without reading whole file into memory."""
+    with open(path, 'rb') as file:
+        for line in file:
+            line = line.strip()
+            if line:
+                yield line
+
+
+def fitness_key(line: bytes) -> tuple:
+    """Returns sorting key of structure dump by its fitness, parsing fitness only.
+
+    Structures are ordered lexicographically by fitness, lower is better.
+    Structures without fitness are placed last.
+    """
+    start = line.find(_FITNESS_KEY)
+    if start == -1:
+        fitness = loads(line).get('fitness') or []
+    else:
+        start += len(_FITNESS_KEY)
+        fitness = loads(line[start : line.index(b']', start) + 1])
+
+    return (not fitness, tuple(inf if value is None else value for value in fitness))
+
+
+def select_lines(path: str, top_k: Optional[int] = None) -> Iterator[bytes]:
+    """Yields all lines of file or top_k best of them by fitness."""
+    if top_k is None:
+        yield from iter_lines(path)
+    else:
+        yield from heapq.nsmallest(top_k, iter_lines(path), key=fitness_key)
+
+
+def _restore_points(points: list[dict]) -> list[Point]:
+    """Creates points reusing decoded dicts as their attributes."""
+    restored = []
+    for point in points:
+        obj = Point.__new__(Point)
+        obj.__dict__ = point
+        restored.append(obj)
+
+    return restored
+
+
+def decode_structure(data: dict, trusted: bool = False) -> Structure:
+    """Creates structure from dict of its dump.
+
+    Args:
+        data (dict): Structure fields, consumed in trusted mode.
+        trusted (bool): If True, pydantic validation is skipped. Defaults to False.
+
+    Returns:
+        Structure: Decoded structure.
+
+    """
+    if not trusted:
+        return Structure(**data)
+
+    polygons = tuple(
+        restore(
+            Polygon,
+            points=_restore_points(poly['points']),
+            id_=decode_id(poly['id_']) if 'id_' in poly else uuid4(),
+        )
+        for poly in data.get('polygons', ())
+    )
+    return restore(
+        Structure,
+        polygons=polygons,
+        fitness=[float(value) for value in data.get('fitness', ())],
+        extra_characteristics=dict(data.get('extra_characteristics', {})),
+        id_=decode_id(data['id_']) if 'id_' in data else uuid4(),
+    )
+
+
+def iter_structs(
+    path: str,
+    trusted: bool = False,
+    top_k: Optional[int] = None,
+) -> Iterator[Structure]:
+    """Generates structures from file with json dumps, splitted with new line.
+
+    Args:
+        path (str): Path to file.
+        trusted (bool): If True, pydantic validation is skipped. Defaults to False.
+        top_k (Optional[int]): If provided, only top_k structures with the lowest
+            fitness are decoded, in fitness order. Defaults to None.
+
+    Yields:
+        Structure: Decoded structures.
+
+    """
+    for line in select_lines(path, top_k):
+        yield decode_structure(loads(line), trusted)
+
+
+def load_packed(path: str, top_k: Optional[int] = None) -> PackedPopulation:
+    """Decodes file with structures json dumps directly into ``PackedPopulation``.
+
+    No points, polygons or structures objects are created.
+
+    Args:
+        path (str): Path to file.
+        top_k (Optional[int]): If provided, only top_k structures with the lowest
+            fitness are decoded, in fitness order. Defaults to None.
+
+    Returns:
+        PackedPopulation: Packed structures.
+
+    """
+    coords, poly_sizes, struct_sizes, poly_ids, struct_ids, fitness = [], [], [], [], [], []
+    for line in select_lines(path, top_k):
+        data = loads(line)
+        polygons = data.get('polygons', ())
+        for poly in polygons:
+            coords.extend((pt['x'], pt['y']) for pt in poly['points'])
+            poly_sizes.append(len(poly['points']))
+            poly_ids.append(poly.get('id_') or '')
+
+        struct_sizes.append(len(polygons))
+        struct_ids.append(data.get('id_') or '')
+        fitness.append([inf if value is None else value for value in data.get('fitness', ())])
+
+    fitness_len = np.array([len(fit) for fit in fitness], dtype=np.int64)
+    fitness_matrix = np.full((len(fitness), fitness_len.max(initial=0)), np.nan)
+    for idx, fit in enumerate(fitness):
+        fitness_matrix[idx, : fitness_len[idx]] = fit
+
+    return PackedPopulation(
+        coords=np.array(coords, dtype=float).reshape(-1, 2),
+        poly_offsets=np.concatenate(([0], np.cumsum(poly_sizes, dtype=np.int64))),
+        struct_offsets=np.concatenate(([0], np.cumsum(struct_sizes, dtype=np.int64))),
+        poly_ids=np.array(poly_ids, dtype=ID_DTYPE),
+        struct_ids=np.array(struct_ids, dtype=ID_DTYPE),
+        fitness=fitness_matrix,
+        fitness_len=fitness_len,
+    )
+
+
+def _top_indices(packed: PackedPopulation, indices: list[int], top_k: Optional[int]) -> list[int]:
+    """Returns indices of top_k structures with the lowest fitness, ordered as ``fitness_key``."""
+    if top_k is None:
+        return indices
+
+    def key(idx: int) -> tuple:
+        fitness = packed.fitness[idx, : packed.fitness_len[idx]]
+        return (not len(fitness), tuple(np.nan_to_num(fitness, nan=inf).tolist()))
+
+    return heapq.nsmallest(top_k, indices, key=key)
+
+
+def _load_npz(path: str, top_k: Optional[int]) -> list[Structure]:
+    with np.load(path) as arrays:
+        packed = PackedPopulation(**{name: arrays[name] for name in PackedPopulation.fields})
+        extra = arrays['extra_characteristics']
+
+    pop = []
+    for idx in _top_indices(packed, list(range(len(packed))), top_k):
+        ind = packed.structure(idx)
+        ind.extra_characteristics = json.loads(str(extra[idx]))
+        pop.append(ind)
+
+    return pop
+
+
+def logged_steps(run_dir: str) -> list[str]:
+    """Returns names of populations logged during optimization, in logging order.
+
+    Populations logged by other tools, e.g. tuner, are skipped.
+    """
+    if os.path.isdir(f'{run_dir}/history'):
+        steps = RunHistory(run_dir).steps
+    else:
+        steps = sorted(
+            os.path.splitext(name)[0]
+            for name in os.listdir(run_dir)
+            if name.endswith(('.log', '.npz'))
+        )
+
+    return [step for step in steps if step.split('_')[0].isdigit()]
+
+
+def load_generation(
+    run_dir: str,
+    step: Union[str, int],
+    top_k: Optional[int] = None,
+    trusted: bool = True,
+) -> list[Structure]:
+    """Loads logged population of run in any of ``LogDispatcher`` formats.
+
+    Args:
+        run_dir (str): Directory of run logs.
+        step (Union[str, int]): Name of logged population, e.g. ``'00003'`` or 3.
+        top_k (Optional[int]): If provided, only top_k structures with the lowest
+            fitness are loaded, in fitness order. Defaults to None.
+        trusted (bool): If True, pydantic validation of json logs is skipped. Defaults to True.
+
+    Returns:
+        list[Structure]: Population.
+
+    Raises:
+        FileNotFoundError: If run has no logs of requested population.
+
+    """
+    step = str(step)
+    log_path = f'{run_dir}/{step.zfill(5)}'
+    if os.path.isfile(f'{log_path}.log'):
+        return list(iter_structs(f'{log_path}.log', trusted, top_k))
+
+    if os.path.isfile(f'{log_path}.npz'):
+        return _load_npz(f'{log_path}.npz', top_k)
+
+    if os.path.isdir(f'{run_dir}/history'):
+        history = RunHistory(run_dir)
+        for name, members in history.generations.items():
+            if name.zfill(5) == step.zfill(5):
+                members = _top_indices(history.packed, members, top_k)
+                return [history.structure(idx) for idx in members]
+
+    raise FileNotFoundError(f'No logs of population {step} found in {run_dir}.')
@@ -0,0 +1,168 @@
+"""Writers of populations logs.
+
+Each run has one writer, which creates one file per logged population
+in run directory. ``BackgroundWriter`` moves serialization and disk writes
+of any writer into separate thread, so optimization never waits for I/O.
+"""
+
+import atexit
+import json
+import os
+import queue
+import threading
+from abc import ABCMeta, abstractmethod
+from typing import Optional
+
+import numpy as np
+from pydantic import TypeAdapter
+
+from gefest.core.geometry import Structure
+from gefest.core.geometry.datastructs.packed import PackedPopulation
+
+_STRUCTURE_ADAPTER = TypeAdapter(Structure)
+_EXCLUDE_COORDS = {'polygons': {'__all__': {'points': {'__all__': {'coords'}}}}}
+
+
+class PopulationWriter(metaclass=ABCMeta):
+    """Base class of population log writers.
+
+    Args:
+        run_dir (str): Directory of run logs.
+        resume (bool): If True, logs of interrupted run in ``run_dir`` are continued,
+            otherwise they are overwritten. Defaults to False.
+
+    """
+
+    extension: str
+
+    def __init__(self, run_dir: str, resume: bool = False) -> None:
+        self.run_dir = run_dir
+        self.resume = resume
+        os.makedirs(run_dir, exist_ok=True)
+
+    def path(self, step: str) -> str:
+        """Returns path of population log file."""
+        return f'{self.run_dir}/{step.zfill(5)}.{self.extension}'
+
+    @abstractmethod
+    def write(self, pop: list[Structure], step: str) -> None:
+        """Saves population."""
+        ...
+
+    def flush(self) -> None:
+        """Waits until all populations are written."""
+
+    def close(self) -> None:
+        """Releases writer resources."""
+
+
+class JsonLinesWriter(PopulationWriter):
+    """Writes each structure as json dump in separate line, compatible with ``parse_structs``."""
+
+    extension = 'log'
+
+    def write(self, pop: list[Structure], step: str) -> None:
+        """Saves population into ``.log`` file."""
+        lines = [_STRUCTURE_ADAPTER.dump_json(ind, exclude=_EXCLUDE_COORDS) for ind in pop]
+        with open(self.path(step), 'wb') as file:
+            file.write(b''.join(line + b'\n' for line in lines))
+
+
+class NpzWriter(PopulationWriter):
+    """Writes population as ``PackedPopulation`` arrays into ``.npz`` file.
+
+    Extra characteristics are stored as array of json strings.
+
+    Args:
+        run_dir (str): Directory of run logs.
+        resume (bool): If True, logs of interrupted run in ``run_dir`` are continued.
+            Defaults to False.
+        compressed (bool): If True, arrays are compressed. Defaults to False.
+
+    """
+
+    extension = 'npz'
+
+    def __init__(self, run_dir: str, resume: bool = False, compressed: bool = False) -> None:
+        super().__init__(run_dir, resume)
+        self.compressed = compressed
+
+    def write(self, pop: list[Structure], step: str) -> None:
+        """Saves population into ``.npz`` file."""
+        arrays = PackedPopulation.pack(pop).arrays()
+        arrays['extra_characteristics'] = np.array(
+            [json.dumps(ind.extra_characteristics, default=str) for ind in pop],
+            dtype=str,
+        )
+        save = np.savez_compressed if self.compressed else np.savez
+        save(self.path(step), **arrays)
+
+
+class BackgroundWriter(PopulationWriter):
+    """Writes populations with wrapped writer in background thread.
+
+    Populations are queued as structures clones, so they can be changed
+    right after ``write`` call. Errors of background thread are raised
+    on the next ``write`` or ``flush`` call.
+
+    Args:
+        writer (PopulationWriter): Writer to wrap.
+        max_queued (int): Maximal number of queued populations,
+            ``write`` blocks when queue is full. Defaults to 8.
+
+    """
+
+    def __init__(self, writer: PopulationWriter, max_queued: int = 8) -> None:
+        self.writer = writer
+        self.run_dir = writer.run_dir
+        self.extension = writer.extension
+        self._queue: queue.Queue = queue.Queue(max_queued)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name='gefest-log-writer', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+
+                if self._error is None:
+                    self.writer.write(*item)
+            except Exception as error:
+                self._error = error
+            finally:
+                self._queue.task_done()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def write(self, pop: list[Structure], step: str) -> None:
+        """Queues population for writing."""
+        self._raise_error()
+        if not self._thread.is_alive():
+            raise RuntimeError('Writer is closed.')
+
+        self._queue.put(([ind.clone() for ind in pop], step))
+
+    def flush(self) -> None:
+        """Waits until all queued populations are written."""
+        if self._thread.is_alive():
+            self._queue.join()
+
+        self.writer.flush()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Writes queued populations and stops background thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+        self.writer.close()
+        atexit.unregister(self.close)
+        self._raise_error()
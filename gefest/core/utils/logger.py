@@ -1,31 +1,107 @@
 import datetime
-
-from loguru import logger
-from pydantic import RootModel
+import json
+import os
+from enum import Enum
+from typing import Optional
 
 from gefest.core.geometry import Structure
+from gefest.core.utils.history import HistoryWriter
+from gefest.core.utils.log_writers import (
+    BackgroundWriter,
+    JsonLinesWriter,
+    NpzWriter,
+    PopulationWriter,
+)
+
+
+class PopulationWriters(Enum):
+    """Enumerates population log formats."""
+
+    json = JsonLinesWriter
+    npz = NpzWriter
+    history = HistoryWriter
 
 
 class LogDispatcher:
-    """Makes some logging stuff."""
+    """Makes some logging stuff.
 
-    def __init__(self, log_dir: str = 'logs', run_name='new_run') -> None:
+    Args:
+        log_dir (str): Directory for logs. Defaults to 'logs'.
+        run_name (str): Name of run, run logs are saved into ``{log_dir}/{run_name}_{time}``.
+            Defaults to 'new_run'.
+        log_format (str): Populations log format, name from ``PopulationWriters``:
+            'json' for json lines ``.log`` files, 'npz' for NumPy arrays,
+            'history' for deduplicated run history. Defaults to 'json'.
+        background (bool): If True, populations are written in background thread.
+            Defaults to True.
+
+    """
+
+    def __init__(
+        self,
+        log_dir: str = 'logs',
+        run_name='new_run',
+        log_format: str = 'json',
+        background: bool = True,
+    ) -> None:
         self.timenow = '{date:%Y-%m-%d_%H_%M_%S}'.format(date=datetime.datetime.now())
         self.log_dir = log_dir
         self.run_name = run_name
+        self.log_format = log_format
+        self.background = background
+        self._run_dir: Optional[str] = None
+        self._writer: Optional[PopulationWriter] = None
 
-    def log_pop(self, pop: list[Structure], step: str):
-        """Saves provided population to json."""
-        inividual_log_handler = logger.add(
-            f'{self.log_dir}/{self.run_name}_{self.timenow}/{step.zfill(5)}.log',
-            level=4,
-            format='{message}',
-            filter=lambda record: record['level'].name in ['Level 4'],
-        )
-        for ind in pop:
-            dump = RootModel[Structure](ind).model_dump_json(
-                exclude={'polygons': {'__all__': {'points': {'__all__': {'coords'}}}}},
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state['_writer'] = None
+        return state
+
+    @property
+    def run_dir(self) -> str:
+        """Directory of run logs."""
+        return self._run_dir or f'{self.log_dir}/{self.run_name}_{self.timenow}'
+
+    def resume(self, run_dir: str) -> None:
+        """Continues logging into directory of interrupted run."""
+        self.close()
+        self._run_dir = run_dir
+
+    @property
+    def writer(self) -> PopulationWriter:
+        """Population writer of run, created on first use."""
+        if self._writer is None:
+            writer = PopulationWriters[self.log_format].value(
+                self.run_dir,
+                resume=self._run_dir is not None,
             )
-            logger.log(4, dump)
+            self._writer = BackgroundWriter(writer) if self.background else writer
+
+        return self._writer
+
+    def log_pop(self, pop: list[Structure], step: str):
+        """Saves provided population."""
+        self.writer.write(pop, step)
+
+    def flush(self) -> None:
+        """Waits until all logged populations are saved."""
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self) -> None:
+        """Saves logged populations and releases writer."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def log_stats(self, stats: dict) -> None:
+        """Appends generation telemetry to ``telemetry.jsonl`` as one json line."""
+        os.makedirs(self.run_dir, exist_ok=True)
+        with open(f'{self.run_dir}/telemetry.jsonl', 'a') as file:
+            file.write(json.dumps(stats) + '\n')
 
-        logger.remove(inividual_log_handler)
+    def log_meta(self, meta: dict) -> None:
+        """Saves run description, e.g. objectives, into ``meta.json``."""
+        os.makedirs(self.run_dir, exist_ok=True)
+        with open(f'{self.run_dir}/meta.json', 'w') as file:
+            json.dump(meta, file)
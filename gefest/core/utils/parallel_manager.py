@@ -1,21 +1,225 @@
-from typing import Any, Callable
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from contextlib import nullcontext
+from enum import Enum
+from time import perf_counter
+from typing import Any, Callable, Iterator, Optional, Union
 
+import numpy as np
 from joblib import Parallel, cpu_count, delayed
+from joblib.externals.loky import get_reusable_executor
 from loguru import logger
 
+from gefest.core.geometry import Structure
+from gefest.core.utils.rng import SeededCall
+from gefest.core.utils.shared_population import SharedCall, SharedPopulation
+from gefest.core.utils.telemetry import Telemetry
+
+
+class ParallelBackends(Enum):
+    """Enumerates joblib backends available for parallel execution."""
+
+    loky = 'loky'
+    multiprocessing = 'multiprocessing'
+    threads = 'threading'
+
+
+class _IndexedCall:
+    """Picklable wrapper which returns task index along with function output."""
+
+    def __init__(self, func: Callable, idx: int) -> None:
+        self.func = func
+        self.idx = idx
+
+    def __call__(self, *args) -> tuple[int, Any]:
+        return self.idx, self.func(*args)
+
+
+class _TimedCall:
+    """Picklable wrapper which returns function execution time along with its output."""
+
+    def __init__(self, func: Callable) -> None:
+        self.func = func
+
+    def __call__(self, *args) -> tuple[float, Any]:
+        start = perf_counter()
+        result = self.func(*args)
+        return perf_counter() - start, result
+
+
+class _BatchCall:
+    """Picklable wrapper which executes a batch of tasks in one worker call."""
+
+    def __init__(self, tasks: list[tuple[Callable, tuple[Any]]]) -> None:
+        self.tasks = tasks
+
+    def __call__(self) -> list[Any]:
+        return [call(*args) for call, args in self.tasks]
+
 
 class BaseParallelDispatcher:
-    """Provides api for easy to use parallel execution with joblib backernd."""
+    """Provides api for easy to use parallel execution with joblib backernd.
+
+    Dispatcher is intended to be long-lived: joblib backend and executor of streamed calls
+    are started on the first call and reused by the following ones until ``close``.
+    """
 
-    def __init__(self, n_jobs: int = -1):
+    def __init__(
+        self,
+        n_jobs: int = -1,
+        seed: Optional[Union[int, np.random.SeedSequence]] = None,
+        shared_memory: bool = True,
+        backend: Union[str, ParallelBackends] = 'loky',
+        batch_size: Union[int, str] = 'auto',
+    ):
         """Inits parallel dispatcher.
 
         Args:
             n_jobs (int, optional): Set 0 to debug withou joblib.
                 For other values see joblib docs. Defaults to -1.
+            seed (Optional[Union[int, np.random.SeedSequence]]): Root seed of tasks
+                random generator streams. Each task gets its own stream,
+                so equal seeds give equal results for any ``n_jobs``. Defaults to None.
+            shared_memory (bool): If True, structures are passed to worker processes
+                through shared memory and returned as deltas instead of pickling.
+                Not used with threads backend. Defaults to True.
+            backend (Union[str, ParallelBackends]): Name of backend from ``ParallelBackends``.
+                Threads are suitable for GIL releasing shapely and NumPy operations
+                and need no data transfer. Defaults to 'loky'.
+            batch_size (Union[int, str]): Number of tasks sent to worker at once.
+                'auto' splits each call into about four batches per worker,
+                which reduces overhead for a lot of tiny tasks. Defaults to 'auto'.
 
         """
         self.n_jobs = self._determine_n_jobs(n_jobs)
+        self.shared_memory = shared_memory
+        if not isinstance(backend, ParallelBackends):
+            backend = ParallelBackends[backend]
+
+        self.backend = backend
+        self.batch_size = batch_size
+        self._parallel = None
+        self._executor = None
+        self.telemetry = Telemetry()
+        if isinstance(seed, np.random.SeedSequence):
+            self.seed_sequence = seed
+        else:
+            self.seed_sequence = np.random.SeedSequence(seed)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state['_parallel'] = None
+        state['_executor'] = None
+        return state
+
+    @property
+    def uses_processes(self) -> bool:
+        """True if tasks are executed in separate processes."""
+        return self.n_jobs > 1 and self.backend is not ParallelBackends.threads
+
+    def utilization(self, telemetry: Telemetry) -> Optional[float]:
+        """Returns share of workers time spent in tasks.
+
+        Args:
+            telemetry (Telemetry): Collected telemetry of dispatcher.
+
+        Returns:
+            Optional[float]: Busy time divided by wall time of all workers,
+                None if nothing was executed.
+        """
+        if not telemetry.timings['wall']:
+            return None
+
+        return telemetry.timings['busy'] / (telemetry.timings['wall'] * max(self.n_jobs, 1))
+
+    def close(self) -> None:
+        """Stops joblib backend and workers of streamed calls.
+
+        They will be started again on the next call.
+        """
+        if self._parallel is not None:
+            self._parallel.__exit__(None, None, None)
+            self._parallel = None
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _get_parallel(self) -> Parallel:
+        """Returns joblib executor, which keeps its workers until ``close``.
+
+        Tasks are packed into batches by dispatcher, so joblib sends them one by one.
+        """
+        if self._parallel is None:
+            self._parallel = Parallel(
+                n_jobs=self.n_jobs,
+                backend=self.backend.value,
+                batch_size=1,
+                pre_dispatch='2*n_jobs',
+            )
+            self._parallel.__enter__()
+
+        return self._parallel
+
+    def _get_executor(self) -> Executor:
+        """Returns executor for streamed calls matching dispatcher backend.
+
+        Loky executor is shared by the whole process, others are kept until ``close``.
+        """
+        if self.uses_processes and self.backend is ParallelBackends.loky:
+            return get_reusable_executor(max_workers=self.n_jobs)
+
+        if self._executor is None:
+            if self.uses_processes:
+                self._executor = ProcessPoolExecutor(self.n_jobs)
+            else:
+                self._executor = ThreadPoolExecutor(self.n_jobs)
+
+        return self._executor
+
+    def _batches(self, tasks: list[tuple[Callable, tuple[Any]]]) -> list[_BatchCall]:
+        batch_size = self._batch_size(len(tasks))
+        return [
+            _BatchCall(tasks[start : start + batch_size])
+            for start in range(0, len(tasks), batch_size)
+        ]
+
+    def _batch_size(self, n_tasks: int) -> int:
+        if self.batch_size == 'auto':
+            return max(1, n_tasks // (4 * self.n_jobs))
+
+        return self.batch_size
+
+    def _transport(self, arguments: list[tuple[Any]], use: bool):
+        """Returns shared population context for process based execution."""
+        if not (self.shared_memory and self.uses_processes):
+            return nullcontext()
+
+        structures = []
+        if use:
+            structures = [arg for args in arguments for arg in args if isinstance(arg, Structure)]
+
+        return SharedPopulation(structures)
+
+    def _tasks(
+        self,
+        calls: list[Callable],
+        arguments: list[tuple[Any]],
+        use: bool,
+        shared: Optional[SharedPopulation],
+    ) -> list[tuple[Callable, tuple[Any]]]:
+        if shared is not None:
+            calls = [SharedCall(call, shared.handle) for call in calls]
+            arguments = [shared.ref(args) for args in arguments] if use else arguments
+
+        if use:
+            return list(zip(calls, arguments))
+
+        return [(call, ()) for call in calls]
 
     def _determine_n_jobs(self, n_jobs: int = -1):
         if n_jobs > cpu_count() or n_jobs == -1:
@@ -43,17 +247,27 @@ class BaseParallelDispatcher:
         Returns:
             list[Any]
         """
-        if self.n_jobs == 0:
-            if use:
-                result = [func(*args) for args in arguments]
-            else:
-                result = [func() for _ in arguments]
-        else:
-            parallel = Parallel(n_jobs=self.n_jobs, verbose=0, pre_dispatch='2*n_jobs')
-            if use:
-                result = parallel(delayed(func)(*args) for args in arguments)
+        calls = [
+            _TimedCall(SeededCall(func, seed))
+            for seed in self.seed_sequence.spawn(len(arguments))
+        ]
+        with self.telemetry.stage('wall'):
+            if self.n_jobs == 0:
+                if use:
+                    result = [call(*args) for call, args in zip(calls, arguments)]
+                else:
+                    result = [call() for call in calls]
             else:
-                result = parallel(delayed(func)() for _ in arguments)
+                with self._transport(arguments, use) as shared:
+                    batches = self._batches(self._tasks(calls, arguments, use, shared))
+                    result = self._get_parallel()(delayed(batch)() for batch in batches)
+                    result = [res for batch_result in result for res in batch_result]
+                    if shared is not None:
+                        result = [shared.decode(res) for res in result]
+
+        self.telemetry.timings['busy'] += sum(elapsed for elapsed, _ in result)
+        self.telemetry.count('tasks', len(result))
+        result = [res for _, res in result]
 
         if flatten:
             if not all(isinstance(res, (tuple, list)) for res in result):
@@ -65,3 +279,60 @@ class BaseParallelDispatcher:
             result = [item for separate_output in result for item in separate_output]
 
         return result
+
+    def imap_unordered(
+        self,
+        func: Callable,
+        arguments: list[tuple[Any]],
+        use: bool = True,
+    ) -> Iterator[tuple[int, Any]]:
+        """Executes provided function in parallel and yields results as soon as they are ready.
+
+        Results order is not guaranteed. Tasks are submitted in batches
+        of ``batch_size`` to executor of dispatcher backend, so several streams may be consumed
+        at the same time. Not yet started tasks are cancelled if stream is closed early.
+
+        Args:
+            func (Callable): Function to execute.
+            arguments (list[tuple[Any]]): Each tuple in list is *args for separate func call.
+            use (bool, optional): If True, each arg in args will be used as func argument,
+                otherwise func will be called without arguments len(args) times. Defaults to True.
+
+        Yields:
+            tuple[int, Any]: Task index in ``arguments`` and function output.
+        """
+        calls = [
+            _TimedCall(_IndexedCall(SeededCall(func, seed), idx))
+            for idx, seed in enumerate(self.seed_sequence.spawn(len(arguments)))
+        ]
+        with self.telemetry.stage('wall'):
+            for elapsed, result in self._imap_timed(calls, arguments, use):
+                self.telemetry.timings['busy'] += elapsed
+                self.telemetry.count('tasks')
+                yield result
+
+    def _imap_timed(
+        self,
+        calls: list[Callable],
+        arguments: list[tuple[Any]],
+        use: bool,
+    ) -> Iterator[tuple[float, tuple[int, Any]]]:
+        if self.n_jobs == 0:
+            for call, args in zip(calls, arguments):
+                yield call(*args) if use else call()
+
+            return
+
+        with self._transport(arguments, use) as shared:
+            executor = self._get_executor()
+            futures = [
+                executor.submit(batch)
+                for batch in self._batches(self._tasks(calls, arguments, use, shared))
+            ]
+            try:
+                for future in as_completed(futures):
+                    for result in future.result():
+                        yield shared.decode(result) if shared is not None else result
+            finally:
+                for future in futures:
+                    future.cancel()
@@ -0,0 +1,94 @@
+"""Random numbers generators of GEFEST operations.
+
+All random operations take generator from ``get_rng``.
+By default it is a process wide generator, ``use_rng`` replaces it
+for the current thread or context, e.g. for one parallel task.
+Parallel dispatcher runs each task with own generator stream
+spawned from its ``np.random.SeedSequence``, so results do not depend
+on the number of workers and tasks distribution between them.
+Threads without own context get thread local generators seeded
+from the process wide one, so generators are never shared between threads.
+"""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional, Union
+
+import numpy as np
+
+SeedLike = Optional[Union[int, np.random.SeedSequence, np.random.Generator]]
+
+_default_rng = np.random.default_rng()
+_current_rng: ContextVar[Optional[np.random.Generator]] = ContextVar('gefest_rng', default=None)
+_thread_rngs = threading.local()
+_spawn_lock = threading.Lock()
+
+
+def _thread_rng() -> np.random.Generator:
+    """Returns generator of the current non-main thread, reseeded after ``set_seed``."""
+    if getattr(_thread_rngs, 'parent', None) is not _default_rng:
+        with _spawn_lock:
+            _thread_rngs.parent = _default_rng
+            _thread_rngs.rng = np.random.default_rng(_default_rng.integers(2**63))
+
+    return _thread_rngs.rng
+
+
+def get_rng() -> np.random.Generator:
+    """Returns random generator of the current context."""
+    rng = _current_rng.get()
+    if rng is not None:
+        return rng
+
+    if threading.current_thread() is threading.main_thread():
+        return _default_rng
+
+    return _thread_rng()
+
+
+def set_seed(seed: SeedLike = None) -> None:
+    """Reinitializes process wide random generator.
+
+    Args:
+        seed (SeedLike): Seed, seed sequence or generator. Defaults to None,
+            means fresh entropy from OS.
+    """
+    global _default_rng
+    _default_rng = np.random.default_rng(seed)
+
+
+@contextmanager
+def use_rng(seed: SeedLike) -> Iterator[np.random.Generator]:
+    """Sets random generator for operations called inside context.
+
+    Args:
+        seed (SeedLike): Seed, seed sequence or generator.
+
+    Yields:
+        np.random.Generator: Generator of the context.
+    """
+    token = _current_rng.set(np.random.default_rng(seed))
+    try:
+        yield get_rng()
+    finally:
+        _current_rng.reset(token)
+
+
+class SeededCall:
+    """Picklable wrapper which calls function with its own random generator stream.
+
+    Args:
+        func (Callable): Function to call.
+        seed (np.random.SeedSequence): Seed of generator stream.
+
+    """
+
+    def __init__(self, func: Callable, seed: np.random.SeedSequence) -> None:
+        self.func = func
+        self.seed = seed
+
+    def __call__(self, *args, **kwargs) -> Any:
+        """Calls function inside ``use_rng`` context."""
+        with use_rng(self.seed):
+            return self.func(*args, **kwargs)
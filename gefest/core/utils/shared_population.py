@@ -0,0 +1,243 @@
+"""Transport of structures to parallel workers through shared memory.
+
+Structures passed to workers are packed into one shared memory block,
+workers receive only structure indices and unpack what they need.
+Workers return structures as deltas: unchanged polygons are sent back
+as indices of source polygons, only new polygons are sent as coordinates arrays.
+"""
+
+from __future__ import annotations
+
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+from gefest.core.geometry import Polygon, Structure
+from gefest.core.geometry.datastructs.packed import (
+    PackedPopulation,
+    decode_id,
+    encode_id,
+    points_from_coords,
+    restore,
+)
+
+_attached: dict[str, tuple[SharedMemory, PackedPopulation]] = {}
+
+
+class StructureRef(NamedTuple):
+    """Index of structure in shared population."""
+
+    idx: int
+
+
+class StructureDelta(NamedTuple):
+    """Structure returned from worker.
+
+    Each item of ``polygons`` is a global index of unchanged source polygon
+    or a pair of new polygon coordinates and id.
+    """
+
+    source: int
+    id_: str
+    fitness: list[float]
+    extra_characteristics: dict
+    polygons: list[Union[int, tuple[np.ndarray, str]]]
+
+
+class SharedPopulationHandle:
+    """Picklable description of shared population block."""
+
+    def __init__(self, name: str, layout: tuple[tuple[str, str, tuple, int], ...]) -> None:
+        self.name = name
+        self.layout = layout
+
+    def attach(self) -> PackedPopulation:
+        """Returns packed population with arrays placed in shared memory.
+
+        Attachment is cached, so tasks of one call share it.
+        """
+        if self.name not in _attached:
+            for name in list(_attached):
+                _detach(name)
+
+            shm = SharedMemory(name=self.name)
+            arrays = {
+                field: np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
+                for field, dtype, shape, offset in self.layout
+            }
+            _attached[self.name] = (shm, PackedPopulation(**arrays))
+
+        return _attached[self.name][1]
+
+
+def _detach(name: str) -> None:
+    shm, _ = _attached.pop(name)
+    try:
+        shm.close()
+    except BufferError:
+        pass
+
+
+class SharedPopulation:
+    """Owns shared memory block with packed structures.
+
+    Should be used as context manager, the block is released on exit.
+
+    Args:
+        structures (Sequence[Structure]): Structures to share, duplicates are packed once.
+
+    """
+
+    def __init__(self, structures: Sequence[Structure]) -> None:
+        self.structures = list({id(struct): struct for struct in structures}.values())
+        self._index = {id(struct): idx for idx, struct in enumerate(self.structures)}
+        self._polygons = [poly for struct in self.structures for poly in struct.polygons]
+        self._shm = None
+        self.handle = None
+        if self.structures:
+            self._share(PackedPopulation.pack(self.structures))
+
+    def _share(self, packed: PackedPopulation) -> None:
+        layout, size = [], 0
+        for field, array in packed.arrays().items():
+            size += -size % 8
+            layout.append((field, array.dtype.str, array.shape, size))
+            size += array.nbytes
+
+        self._shm = SharedMemory(create=True, size=max(size, 1))
+        for field, dtype, shape, offset in layout:
+            view = np.ndarray(shape, dtype=dtype, buffer=self._shm.buf, offset=offset)
+            view[...] = getattr(packed, field)
+            del view
+
+        self.handle = SharedPopulationHandle(self._shm.name, tuple(layout))
+
+    def ref(self, args: tuple) -> tuple:
+        """Replaces shared structures in arguments with their indices."""
+        return tuple(
+            StructureRef(self._index[id(arg)]) if isinstance(arg, Structure) else arg
+            for arg in args
+        )
+
+    def decode(self, value: Any) -> Any:
+        """Restores structures in worker output."""
+        if isinstance(value, StructureDelta):
+            polygons = tuple(
+                self._polygons[poly]
+                if isinstance(poly, int)
+                else restore(Polygon, points=points_from_coords(poly[0]), id_=decode_id(poly[1]))
+                for poly in value.polygons
+            )
+            extra = {}
+            if value.source >= 0:
+                extra.update(self.structures[value.source].extra_characteristics)
+
+            extra.update(value.extra_characteristics)
+            return restore(
+                Structure,
+                polygons=polygons,
+                fitness=list(value.fitness),
+                extra_characteristics=extra,
+                id_=decode_id(value.id_),
+            )
+
+        if isinstance(value, (list, tuple)):
+            return type(value)(self.decode(item) for item in value)
+
+        return value
+
+    def close(self) -> None:
+        """Releases shared memory block."""
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self) -> SharedPopulation:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class SharedCall:
+    """Picklable wrapper which runs function in worker over shared population.
+
+    Structure references in arguments are unpacked from shared memory,
+    structures in output are encoded as deltas.
+
+    Args:
+        func (Callable): Function to call.
+        handle (Optional[SharedPopulationHandle]): Shared population, None if
+            arguments have no structures.
+
+    """
+
+    def __init__(self, func: Callable, handle: Optional[SharedPopulationHandle]) -> None:
+        self.func = func
+        self.handle = handle
+
+    def __call__(self, *args) -> Any:
+        """Calls function and encodes its output."""
+        sources: dict[int, tuple[int, Polygon]] = {}
+        struct_sources: dict[str, int] = {}
+        packed = None
+        if any(isinstance(arg, StructureRef) for arg in args):
+            packed = self.handle.attach()
+            unpacked = []
+            for arg in args:
+                if isinstance(arg, StructureRef):
+                    struct = packed.structure(arg.idx)
+                    struct_sources[encode_id(struct.id_)] = arg.idx
+                    for poly_idx, poly in zip(packed.polygon_indices(arg.idx), struct.polygons):
+                        sources[id(poly)] = (poly_idx, poly)
+
+                    unpacked.append(struct)
+                else:
+                    unpacked.append(arg)
+
+            args = unpacked
+
+        return self._encode(self.func(*args), packed, sources, struct_sources)
+
+    def _encode(
+        self,
+        value: Any,
+        packed: Optional[PackedPopulation],
+        sources: dict[int, tuple[int, Polygon]],
+        struct_sources: dict[str, int],
+    ) -> Any:
+        if isinstance(value, Structure):
+            id_ = encode_id(value.id_)
+            return StructureDelta(
+                source=struct_sources.get(id_, -1),
+                id_=id_,
+                fitness=list(value.fitness),
+                extra_characteristics=dict(value.extra_characteristics),
+                polygons=[self._encode_polygon(poly, packed, sources) for poly in value.polygons],
+            )
+
+        if isinstance(value, (list, tuple)):
+            return type(value)(
+                self._encode(item, packed, sources, struct_sources) for item in value
+            )
+
+        return value
+
+    @staticmethod
+    def _encode_polygon(
+        poly: Polygon,
+        packed: Optional[PackedPopulation],
+        sources: dict[int, tuple[int, Polygon]],
+    ) -> Union[int, tuple[np.ndarray, str]]:
+        """Returns source polygon index if polygon was not changed, coordinates otherwise."""
+        coords = np.array([(pt.x, pt.y) for pt in poly.points], dtype=float).reshape(-1, 2)
+        source = sources.get(id(poly))
+        if source is not None and source[1] is poly:
+            poly_idx = source[0]
+            start, end = packed.poly_offsets[poly_idx], packed.poly_offsets[poly_idx + 1]
+            if np.array_equal(coords, packed.coords[start:end]):
+                return poly_idx
+
+        return coords, encode_id(poly.id_)
@@ -0,0 +1,56 @@
+from collections import defaultdict
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Iterator, Optional
+
+
+class Telemetry:
+    """Accumulates wall time of named stages and event counters.
+
+    Components of optimizer keep own instance, optimizer collects
+    and resets them once per generation.
+    """
+
+    def __init__(self) -> None:
+        self.timings: defaultdict[str, float] = defaultdict(float)
+        self.counters: defaultdict[str, int] = defaultdict(int)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Adds wall time of code inside context to stage timing."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] += perf_counter() - start
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Increments counter."""
+        self.counters[name] += value
+
+    def reset(self) -> None:
+        """Clears accumulated values."""
+        self.timings.clear()
+        self.counters.clear()
+
+    @staticmethod
+    def collect(*sources: Optional['Telemetry']) -> 'Telemetry':
+        """Sums values of provided telemetries and resets them.
+
+        Args:
+            sources (Optional[Telemetry]): Telemetries to collect, None values are skipped.
+
+        Returns:
+            Telemetry: Summed values.
+        """
+        total = Telemetry()
+        for source in {id(src): src for src in sources if src is not None}.values():
+            for name, value in source.timings.items():
+                total.timings[name] += value
+
+            for name, value in source.counters.items():
+                total.counters[name] += value
+
+            source.reset()
+
+        return total
@@ -1,11 +1,55 @@
+from typing import Any, Optional
+
 import matplotlib.pyplot as plt
-import moviepy.editor as mp
-from golem.utilities.data_structures import ensure_wrapped_in_sequence
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from matplotlib.lines import Line2D
-from moviepy.video.io.bindings import mplfig_to_npimage
 
 from gefest.core.geometry import Structure
 from gefest.core.geometry.domain import Domain
+from gefest.core.utils.functions import ensure_wrapped_in_sequence
+from gefest.core.utils.parallel_manager import BaseParallelDispatcher
+
+
+def render_frame(
+    structure: Structure,
+    domain: Optional[Domain] = None,
+    info: Any = None,
+    size: tuple[int, int] = (640, 480),
+    dpi: int = 100,
+) -> np.ndarray:
+    """Draws structure on its own Agg canvas, without pyplot state.
+
+    Args:
+        structure (Structure): Structure to draw.
+        domain (Optional[Domain]): Domain to draw boundary and prohibited area of.
+            Defaults to None.
+        info (Any): Data to show in frame legend, e.g. fitness. Defaults to None.
+        size (tuple[int, int]): Image width and height in pixels. Defaults to (640, 480).
+        dpi (int): Image resolution. Defaults to 100.
+
+    Returns:
+        np.ndarray: RGB image of shape ``(height, width, 3)``.
+    """
+    fig = Figure(figsize=(size[0] / dpi, size[1] / dpi), dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    if domain:
+        boundary = domain.bound_poly
+        ax.plot([pt.x for pt in boundary.points], [pt.y for pt in boundary.points], 'k')
+        for poly in domain.prohibited_area or []:
+            ax.plot([pt.x for pt in poly], [pt.y for pt in poly], '-', color='m')
+
+    for poly in structure.polygons:
+        ax.plot([pt.x for pt in poly], [pt.y for pt in poly], linestyle='-')
+
+    if info is not None:
+        line = Line2D([0], [0], color='black', linewidth=3, linestyle='-')
+        ax.legend([line], [str(info)], loc=2)
+
+    canvas.draw()
+    return np.asarray(canvas.buffer_rgba())[..., :3].copy()
 
 
 class StructVizualizer:
@@ -88,22 +132,29 @@ class StructVizualizer:
 
 
 class GIFMaker(StructVizualizer):
-    """Smple API for saving a series of plots in mp4 with moviepy."""
+    """Smple API for saving a series of plots in mp4 with moviepy.
+
+    Args:
+        domain (Domain): Domain to draw on each frame. Defaults to None.
+        n_jobs (int): Number of processes for ``render``, 0 to render sequentially.
+            Defaults to -1, means all cores.
+
+    """
 
-    def __init__(self, domain=None) -> None:
+    def __init__(self, domain=None, n_jobs: int = -1) -> None:
         super().__init__(domain=domain)
         self.frames = []
         self.counter = 0
+        self.n_jobs = n_jobs
 
     def create_frame(self, structure, infos):
-        """Appends new frame from given structure."""
-        fig = self.plot_structure(structure, infos)
-        numpy_fig = mplfig_to_npimage(fig)
-        self.frames.append(numpy_fig)
-        plt.close()
+        """Appends new frame from given structure with infos in legend."""
+        self.frames.append(render_frame(structure, self.domain, infos))
 
     def make_gif(self, gifname, duration=1500, loop=-1):
         """Makes mp4 file from collected plots."""
+        import moviepy.editor as mp
+
         clip = mp.ImageSequenceClip(
             self.frames,
             durations=[duration] * len(self.frames),
@@ -112,3 +163,52 @@ class GIFMaker(StructVizualizer):
         clip.write_videofile(f'./{gifname}.mp4')
         self.frames = []
         self.counter = 0
+
+    def render(
+        self,
+        structures: list[Structure],
+        videoname: str,
+        duration: int = 1500,
+        infos: Optional[list[Any]] = None,
+    ) -> None:
+        """Renders structures in worker processes and streams frames into mp4 file.
+
+        Each frame is written as soon as all previous ones are ready,
+        so only frames rendered ahead of their turn are kept in memory.
+
+        Args:
+            structures (list[Structure]): Structures to render, one per frame.
+            videoname (str): Path of video file without extension.
+            duration (int): Duration of each frame in milliseconds. Defaults to 1500.
+            infos (Optional[list[Any]]): Data to show in legend of each frame.
+                Defaults to None, means frames without legend.
+        """
+        infos = infos or [None] * len(structures)
+        from moviepy.video.io.ffmpeg_writer import FFMPEG_VideoWriter
+
+        dispatcher = BaseParallelDispatcher(self.n_jobs, backend='loky')
+        writer, pending, next_idx = None, {}, 0
+        try:
+            frames = dispatcher.imap_unordered(
+                render_frame,
+                [(structure, self.domain, info) for structure, info in zip(structures, infos)],
+            )
+            for idx, frame in frames:
+                pending[idx] = frame
+                while next_idx in pending:
+                    frame = pending.pop(next_idx)
+                    if writer is None:
+                        height, width = frame.shape[:2]
+                        writer = FFMPEG_VideoWriter(
+                            f'{videoname}.mp4',
+                            (width, height),
+                            fps=1000 / duration,
+                        )
+
+                    writer.write_frame(frame)
+                    next_idx += 1
+        finally:
+            if writer is not None:
+                writer.close()
+
+            dispatcher.close()
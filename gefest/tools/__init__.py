@@ -1 +1,3 @@
-from gefest.tools.estimators.estimator import Estimator
+from gefest.core.utils.lazy import lazy_getattr
+
+__getattr__ = lazy_getattr(__name__, {'Estimator': 'gefest.tools.estimators.estimator.Estimator'})
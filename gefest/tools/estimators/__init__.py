@@ -0,0 +1,15 @@
+from gefest.core.utils.lazy import lazy_getattr
+
+_SIMULATORS = 'gefest.tools.estimators.simulators'
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        'Estimator': 'gefest.tools.estimators.estimator.Estimator',
+        'SoundSimulator': f'{_SIMULATORS}.sound_wave.sound_interface.SoundSimulator',
+        'Swan': f'{_SIMULATORS}.swan.swan_interface.Swan',
+        'Comsol': f'{_SIMULATORS}.comsol.comsol_interface.Comsol',
+        'BWCNN': 'gefest.tools.estimators.DL.bw_surrogate.bw_cnn.BWCNN',
+        'HeatCNN': 'gefest.tools.estimators.DL.heat.heat_cnn.HeatCNN',
+    },
+)
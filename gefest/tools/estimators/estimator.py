@@ -14,6 +14,14 @@ class Estimator(metaclass=ABCMeta):
         """Incapsulates estimate method call for simler estimator usage."""
         return self.estimate(struct)
 
+    def estimate_batch(self, structs: list[Structure]) -> list[Any]:
+        """Estimates several structures at once.
+
+        Override for backends which process batch faster than separate structures.
+        Calls estimate for each structure by default.
+        """
+        return [self.estimate(struct) for struct in structs]
+
     @abstractmethod
     def estimate(self, struct: Structure) -> Any:
         """Must implemet logic of estimation."""
@@ -1,11 +1,19 @@
-from typing import Callable
+from time import perf_counter
+from typing import Callable, Optional
 from venv import logger
 
 from tqdm import tqdm
 
 from gefest.core.geometry import Structure
 from gefest.core.opt import strategies
+from gefest.core.opt.objective.objective import objectives_identity
 from gefest.core.opt.objective.objective_eval import ObjectivesEvaluator
+from gefest.core.opt.warm_start import warm_start
+from gefest.core.utils.checkpoint import load_checkpoint, save_checkpoint
+from gefest.core.utils.history import strip_lineage
+from gefest.core.utils.parallel_manager import BaseParallelDispatcher
+from gefest.core.utils.rng import get_rng, set_seed
+from gefest.core.utils.telemetry import Telemetry
 from gefest.tools.optimizers.optimizer import Optimizer
 
 
@@ -25,23 +33,28 @@ class BaseGA(Optimizer):
         **kwargs,
     ):
         super().__init__(opt_params.log_dispatcher)
+        start = perf_counter()
         self.opt_params = opt_params
+        self.telemetry = Telemetry()
         self.crossover = getattr(strategies, opt_params.crossover_strategy)(opt_params=opt_params)
         self.mutation = getattr(strategies, opt_params.mutation_strategy)(opt_params=opt_params)
         self.sampler: Callable = opt_params.sampler
         self.objectives_evaluator: ObjectivesEvaluator = ObjectivesEvaluator(
             opt_params.objectives,
             opt_params.estimation_n_jobs,
+            opt_params.spawn_seed(),
+            batch_size=opt_params.estimation_batch_size,
+            cache_estimations=opt_params.cache_estimations,
         )
         self.pop_size = opt_params.pop_size
         self.n_steps = opt_params.n_steps
         self.domain = self.opt_params.domain
-        if initial_population:
-            self._pop = initial_population
+        self._step = 0
+        checkpoint = load_checkpoint(opt_params.resume_from) if opt_params.resume_from else None
+        if checkpoint:
+            self._pop = checkpoint['population']
         else:
-            self._pop: list[Structure] = self.sampler(self.opt_params.pop_size)
-
-        self._pop = self.objectives_evaluator(self._pop)
+            self._pop = self.objectives_evaluator(self._initial_population(initial_population))
 
         self.selector: Callable = opt_params.selector.value
         if len(self.opt_params.objectives) > 1:
@@ -56,7 +69,32 @@ class BaseGA(Optimizer):
                 steps=self.n_steps,
             )
 
-        self.log_dispatcher.log_pop(self._pop, '00000_init')
+        if checkpoint:
+            self._restore(checkpoint)
+            return
+
+        with self.telemetry.stage('logging'):
+            self.log_dispatcher.log_meta({'objectives': objectives_identity(opt_params.objectives)})
+            self.log_dispatcher.log_pop(self._pop, '00000_init')
+            strip_lineage(self._pop)
+
+        self._save_checkpoint(0)
+        self._report_generation(0, perf_counter() - start)
+
+    def _initial_population(self, initial_population: Optional[list[Structure]]) -> list[Structure]:
+        """Returns provided or warm started population, completed with sampled structures.
+
+        Structures which already have fitness are not evaluated again.
+        """
+        if not initial_population and self.opt_params.warm_start_from:
+            initial_population = warm_start(self.opt_params.warm_start_from, self.opt_params)
+
+        pop = list(initial_population or [])
+        if len(pop) < self.pop_size:
+            with self.telemetry.stage('sampling'):
+                pop.extend(self.sampler(self.pop_size - len(pop)))
+
+        return pop
 
     def optimize(self) -> list[Structure]:
         """Optimizes population.
@@ -64,16 +102,127 @@ class BaseGA(Optimizer):
         Returns:
             list[Structure]: Optimized population.
         """
-        pbar = tqdm(range(self.n_steps))
+        pbar = tqdm(range(self._step, self.n_steps))
         for step in pbar:
             pbar.set_description(f'Best fitness: {self._pop[0].fitness}')
-            self._pop = self.selector(self._pop, self.pop_size)
+            start = perf_counter()
+            with self.telemetry.stage('selection'):
+                self._pop = self.selector(self._pop, self.pop_size)
+
             child = self.crossover(self._pop)
             mutated_child = self.mutation(child)
             self._pop.extend(mutated_child)
-            self._pop.extend(self.sampler(self.opt_params.extra))
+            with self.telemetry.stage('resampling'):
+                self._pop.extend(self.sampler(self.opt_params.extra))
+
             self._pop = self.objectives_evaluator(self._pop)
-            self.log_dispatcher.log_pop(self._pop, str(step + 1))
+            with self.telemetry.stage('logging'):
+                self.log_dispatcher.log_pop(self._pop, str(step + 1))
+                strip_lineage(self._pop)
+
+            self._save_checkpoint(step + 1)
+            self._report_generation(step + 1, perf_counter() - start)
 
         pbar.set_description(f'Best fitness: {self._pop[0].fitness}')
+        self.log_dispatcher.flush()
+        if self.opt_params.parallel_dispatcher is not None:
+            self.opt_params.parallel_dispatcher.close()
+
+        self.objectives_evaluator.close()
         return self._pop
+
+    def checkpoint_state(self, step: int) -> dict:
+        """Returns optimizer state after step.
+
+        Individuals keep their fitness, so resumed run does not evaluate them again.
+        """
+        return {
+            'step': step,
+            'run_dir': self.log_dispatcher.run_dir,
+            'population': self._pop,
+            'selector': self.selector,
+            'rng': get_rng(),
+            'seed_sequences': {
+                'params': self.opt_params._seed_sequence,
+                'reproduction': self.opt_params.parallel_dispatcher.seed_sequence,
+                'evaluation': getattr(self.objectives_evaluator._pm, 'seed_sequence', None),
+            },
+        }
+
+    def _save_checkpoint(self, step: int) -> None:
+        """Saves checkpoint every ``checkpoint_every`` steps and after the last one.
+
+        Logs are flushed first, so checkpoint is never ahead of logged populations.
+        """
+        every = self.opt_params.checkpoint_every
+        if every and (step % every == 0 or step == self.n_steps):
+            path = self.opt_params.checkpoint_path
+            path = path or f'{self.log_dispatcher.run_dir}/checkpoint.pkl'
+            with self.telemetry.stage('checkpoint'):
+                self.log_dispatcher.flush()
+                save_checkpoint(self.checkpoint_state(step), path)
+
+    def _restore(self, checkpoint: dict) -> None:
+        """Continues run from checkpoint state and its logs in directory of interrupted run."""
+        self._step = checkpoint['step']
+        if checkpoint.get('run_dir'):
+            self.log_dispatcher.resume(checkpoint['run_dir'])
+
+        self.selector = checkpoint['selector']
+        set_seed(checkpoint['rng'])
+        seeds = checkpoint['seed_sequences']
+        self.opt_params._seed_sequence = seeds['params']
+        self.opt_params.parallel_dispatcher.seed_sequence = seeds['reproduction']
+        if self.objectives_evaluator._pm is not None:
+            self.objectives_evaluator._pm.seed_sequence = seeds['evaluation']
+
+    def _report_generation(self, step: int, wall_time: float) -> None:
+        """Logs generation telemetry and passes it to callback if one is set."""
+        stats = self.generation_stats(step, wall_time)
+        self.log_dispatcher.log_stats(stats)
+        if self.opt_params.telemetry_callback is not None:
+            self.opt_params.telemetry_callback(stats)
+
+    def generation_stats(self, step: int, wall_time: float) -> dict:
+        """Collects and resets telemetry of optimizer components.
+
+        Args:
+            step (int): Generation number, 0 for initial population.
+            wall_time (float): Generation wall time in seconds.
+
+        Returns:
+            dict: Stages wall time in seconds, evaluations count and rate,
+                share of individuals with already known fitness,
+                invalid offspring count and parallel workers utilization.
+        """
+        stages = Telemetry.collect(
+            self.telemetry,
+            getattr(self.crossover, 'telemetry', None),
+            getattr(self.mutation, 'telemetry', None),
+            self.objectives_evaluator.telemetry,
+        )
+        evaluated, reused = stages.counters['evaluated'], stages.counters['reused']
+        evaluation_time = stages.timings['evaluation']
+        return {
+            'step': step,
+            'pop_size': len(self._pop),
+            'best_fitness': list(self._pop[0].fitness),
+            'wall_time': wall_time,
+            'timings': dict(stages.timings),
+            'evaluations': evaluated,
+            'evaluations_per_second': evaluated / evaluation_time if evaluation_time else None,
+            'reused_fitness_share': reused / (evaluated + reused) if evaluated + reused else None,
+            'offspring': stages.counters['offspring'],
+            'invalid_offspring': stages.counters['invalid_offspring'],
+            'worker_utilization': {
+                'reproduction': self._utilization(self.opt_params.parallel_dispatcher),
+                'evaluation': self._utilization(self.objectives_evaluator._pm),
+            },
+        }
+
+    @staticmethod
+    def _utilization(dispatcher: Optional[BaseParallelDispatcher]) -> Optional[float]:
+        if dispatcher is None:
+            return None
+
+        return dispatcher.utilization(Telemetry.collect(dispatcher.telemetry))
@@ -1,13 +1,19 @@
 from enum import Enum
 
-from .GA.GA import BaseGA
-from .golem_optimizer.standard import StandardOptimizer
-from .golem_optimizer.surrogate import SurrogateOptimizer
+from gefest.core.utils.lazy import LazyObject, lazy_getattr
+
+_OPTIMIZERS = {
+    'BaseGA': 'gefest.tools.optimizers.GA.GA.BaseGA',
+    'StandardOptimizer': 'gefest.tools.optimizers.golem_optimizer.standard.StandardOptimizer',
+    'SurrogateOptimizer': 'gefest.tools.optimizers.golem_optimizer.surrogate.SurrogateOptimizer',
+}
+
+__getattr__ = lazy_getattr(__name__, _OPTIMIZERS)
 
 
 class OptimizerTypes(Enum):
-    """Enumeration of all optimizers."""
+    """Enumeration of all optimizers, GOLEM is imported only when its optimizer is used."""
 
-    gefest_ga = BaseGA
-    golem_optimizer = StandardOptimizer
-    golem_surrogate = SurrogateOptimizer
+    gefest_ga = LazyObject(_OPTIMIZERS['BaseGA'])
+    golem_optimizer = LazyObject(_OPTIMIZERS['StandardOptimizer'])
+    golem_surrogate = LazyObject(_OPTIMIZERS['SurrogateOptimizer'])
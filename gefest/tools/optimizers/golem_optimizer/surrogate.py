@@ -15,6 +15,7 @@ from gefest.core.opt.adapters.configuration_mapping import (
     map_into_graph_generation_params,
     map_into_graph_requirements,
 )
+from gefest.core.opt.warm_start import warm_start
 from gefest.tools.optimizers.optimizer import Optimizer
 
 
@@ -36,8 +37,11 @@ class SurrogateOptimizer(Optimizer):
         self.ggp = map_into_graph_generation_params(opt_params)
         self.gpa = map_into_gpa(opt_params)
 
+        if not initial_population and opt_params.warm_start_from:
+            initial_population = warm_start(opt_params.warm_start_from, opt_params)
+
         if initial_population:
-            self.initial_pop = initial_population
+            self.initial_pop = list(map(opt_params.golem_adapter.adapt, initial_population))
         else:
             self.initial_pop: list[Structure] = list(
                 map(opt_params.golem_adapter.adapt, opt_params.sampler(opt_params.pop_size)),
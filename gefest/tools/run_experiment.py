@@ -1,34 +1,54 @@
+from typing import Optional
+
 from loguru import logger
-from tqdm import tqdm
 
 from gefest.core.configs.utils import load_config
-from gefest.core.viz.struct_vizualizer import GIFMaker
-from gefest.tools.tuners.tuner import GolemTuner
 
 
-def run_experiment(config_path: str):
-    """Simple experiment runner."""
+def run_experiment(config_path: str, resume_from: Optional[str] = None, render: bool = True):
+    """Simple experiment runner.
+
+    Args:
+        config_path (str): Path to configuration file.
+        resume_from (Optional[str]): Path to checkpoint to continue interrupted run from.
+            Overrides ``resume_from`` of configuration. Defaults to None.
+        render (bool): If True, optimized and tuned structures are rendered
+            into mp4 files. Defaults to True.
+
+    """
     opt_params = load_config(config_path)
+    if resume_from:
+        opt_params.resume_from = resume_from
 
     optimizer = opt_params.optimizer(opt_params)
     optimized_pop = optimizer.optimize()
 
     # Optimized pop visualization
-    logger.info('Collecting plots of optimized structures...')
-    gm = GIFMaker(domain=opt_params.domain)
-    for st in tqdm(optimized_pop):
-        gm.create_frame(st, {'Optimized': st.fitness})
-
-    gm.make_gif('Optimized population', 500)
+    if render:
+        from gefest.core.viz.struct_vizualizer import GIFMaker
+
+        logger.info('Rendering optimized structures...')
+        gm = GIFMaker(domain=opt_params.domain, n_jobs=opt_params.n_jobs)
+        gm.render(
+            optimized_pop,
+            'Optimized population',
+            500,
+            infos=[{'Optimized': st.fitness} for st in optimized_pop],
+        )
 
     if opt_params.tuner_cfg:
+        from gefest.tools.tuners.tuner import GolemTuner
+
         tuner = GolemTuner(opt_params)
         tuned_individuals = tuner.tune(optimized_pop[: opt_params.tuner_cfg.tune_n_best])
 
         # Tuned structures visualization
-        logger.info('Collecting plots of tuned structures...')
-        gm = GIFMaker(domain=opt_params.domain)
-        for st in tqdm(tuned_individuals):
-            gm.create_frame(st, {'Tuned': st.fitness})
-
-        gm.make_gif('Tuned individuals', 500)
+        if render:
+            logger.info('Rendering tuned structures...')
+            gm = GIFMaker(domain=opt_params.domain, n_jobs=opt_params.n_jobs)
+            gm.render(
+                tuned_individuals,
+                'Tuned individuals',
+                500,
+                infos=[{'Tuned': st.fitness} for st in tuned_individuals],
+            )
@@ -1,11 +1,10 @@
 # import copy
 from typing import List
 
-import numpy as np
-
 from gefest.core.geometry import Point, Polygon, Structure
 from gefest.core.geometry.geometry_2d import Geometry2D
 from gefest.core.opt.postproc.rules import PolygonNotSelfIntersects
+from gefest.core.utils.rng import get_rng
 
 
 class NoisedPoly:
@@ -74,7 +73,7 @@ class NoisedPoly:
         sigma_min_y = min(p.coords[1] for p in self.init_polygon.points)
         max_x = sigma_max_x - sigma_min_x
         max_y = sigma_max_y - sigma_min_y
-        self.sigma = np.random.uniform(min(max_x, max_y) * scale, max(max_x, max_y) * scale)
+        self.sigma = get_rng().uniform(min(max_x, max_y) * scale, max(max_x, max_y) * scale)
 
     def __call__(
         self,
@@ -93,8 +92,8 @@ class NoisedPoly:
         :param poly:
         :return:
         """
-        x_noise_start = np.random.uniform(-self.sigma, self.sigma)
-        y_noise_start = np.random.uniform(-self.sigma, self.sigma)
+        x_noise_start = get_rng().uniform(-self.sigma, self.sigma)
+        y_noise_start = get_rng().uniform(-self.sigma, self.sigma)
         for i, point in enumerate(self.init_polygon.points):
             if (i == 0 or i == (len(self.init_polygon) - 1)) and self.close:
                 poly.points.append(
@@ -102,12 +101,12 @@ class NoisedPoly:
                 )
                 continue
 
-            if np.random.uniform(0, 1) < (1 - self.proba):
+            if get_rng().uniform(0, 1) < (1 - self.proba):
                 poly.points.append(point)
 
             else:
-                x_noise = np.random.uniform(-self.sigma, self.sigma)
-                y_noise = np.random.uniform(-self.sigma, self.sigma)
+                x_noise = get_rng().uniform(-self.sigma, self.sigma)
+                y_noise = get_rng().uniform(-self.sigma, self.sigma)
                 poly.points.append(Point(point.coords[0] + x_noise, point.coords[1] + y_noise))
 
         return poly
@@ -118,14 +117,14 @@ class NoisedPoly:
         :param poly:
         :return:
         """
-        if np.random.uniform(0, 1) < self.proba:
+        if get_rng().uniform(0, 1) < self.proba:
             if len(poly.points) // 4 >= 1:
                 max_to_del = len(poly.points) // 4
             else:
                 max_to_del = 1
 
             for _ in range(0, max_to_del):  # Choose hwo many points may be deleted
-                pnt_to_del = np.random.randint(1, len(poly.points) - 1)
+                pnt_to_del = get_rng().integers(1, len(poly.points) - 1)
                 poly.points.remove(poly.points[pnt_to_del])
 
         return poly
@@ -136,9 +135,9 @@ class NoisedPoly:
         :param poly:
         :return:
         """
-        x_scale = np.random.uniform(self.resize_scale[0], self.resize_scale[1])
-        y_scale = np.random.uniform(self.resize_scale[0], self.resize_scale[1])
-        if np.random.uniform(0, 1) < self.proba:
+        x_scale = get_rng().uniform(self.resize_scale[0], self.resize_scale[1])
+        y_scale = get_rng().uniform(self.resize_scale[0], self.resize_scale[1])
+        if get_rng().uniform(0, 1) < self.proba:
             poly = self.geometry.resize_poly(poly, x_scale, y_scale)
 
         return poly
@@ -149,8 +148,8 @@ class NoisedPoly:
         :param poly:
         :return:
         """
-        angle = np.random.randint(-self.degrees_to_rotate, self.degrees_to_rotate)
-        if np.random.uniform(0, 1) < self.proba:
+        angle = get_rng().integers(-self.degrees_to_rotate, self.degrees_to_rotate)
+        if get_rng().uniform(0, 1) < self.proba:
             # poly_test = copy.deepcopy(poly)
             poly = self.geometry.rotate_poly(poly, angle)
             if not self.close:
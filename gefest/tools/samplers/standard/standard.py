@@ -11,7 +11,6 @@ from typing import Callable
 from gefest.core.geometry import Structure
 from gefest.core.geometry.domain import Domain
 from gefest.core.geometry.utils import get_random_structure
-from gefest.core.utils.parallel_manager import BaseParallelDispatcher
 from gefest.tools.samplers.sampler import Sampler
 
 
@@ -30,7 +29,7 @@ class StandardSampler(Sampler):
         self.domain: Domain = opt_params.domain
         self.postprocessor: Callable = opt_params.postprocessor
         self.postprocess_attempts: int = opt_params.postprocess_attempts
-        self._pm = BaseParallelDispatcher(opt_params.n_jobs)
+        self._pm = opt_params.parallel_dispatcher
 
     def __call__(self, n_samples: int) -> list[Structure]:
         """Calls sample method."""
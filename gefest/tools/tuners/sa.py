@@ -18,6 +18,8 @@ class SensitivityAnalysis:
         self.cost = ObjectivesEvaluator(
             opt_params.objectives,
             opt_params.estimation_n_jobs,
+            batch_size=opt_params.estimation_batch_size,
+            cache_estimations=opt_params.cache_estimations,
         )
         self.domain = opt_params.domain
         self.sa_time_history = [0]
@@ -140,4 +140,5 @@ class GolemTuner:
         tuned_objects.extend(tuned_structures)
         tuned_objects = sorted(tuned_objects, key=lambda x: x.fitness)
         self.log_dispatcher.log_pop(tuned_objects, 'tuned')
+        self.log_dispatcher.flush()
         return tuned_objects
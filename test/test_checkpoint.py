@@ -0,0 +1,70 @@
+import pytest
+from pydantic import ValidationError
+
+from gefest.tools.optimizers.GA.GA import BaseGA
+from test.test_config import Area, domain_cfg, make_params
+
+
+class _Crash(Exception):
+    pass
+
+
+def _params(log_dir, callback, selector, **kwargs):
+    return make_params(
+        log_dir,
+        n_steps=4,
+        objectives=[Area(domain_cfg), Area(domain_cfg)],
+        multiobjective_selector=selector,
+        rng=7,
+        telemetry_callback=callback,
+        **kwargs,
+    )
+
+
+def _crash_after(step, stats):
+    def callback(gen_stats):
+        stats.append(gen_stats)
+        if gen_stats['step'] == step:
+            raise _Crash
+
+    return callback
+
+
+def _snapshot(pop):
+    return [([[(p.x, p.y) for p in poly] for poly in ind], ind.fitness) for ind in pop]
+
+
+@pytest.mark.parametrize('selector', ['spea2', 'moead'])
+def test_resumed_run_continues_interrupted_one(tmp_path, selector):
+    """Run resumed from checkpoint gives the same result without reevaluation of individuals."""
+    stats = []
+    expected = _snapshot(BaseGA(_params(tmp_path, stats.append, selector)).optimize())
+
+    checkpoint = str(tmp_path / 'checkpoint.pkl')
+    interrupted = BaseGA(
+        _params(
+            tmp_path,
+            _crash_after(2, []),
+            selector,
+            checkpoint_every=1,
+            checkpoint_path=checkpoint,
+        ),
+    )
+    with pytest.raises(_Crash):
+        interrupted.optimize()
+
+    resumed_stats = []
+    optimizer = BaseGA(_params(tmp_path, resumed_stats.append, selector, resume_from=checkpoint))
+    assert _snapshot(optimizer.optimize()) == expected
+    assert optimizer.log_dispatcher.run_dir == interrupted.log_dispatcher.run_dir
+    assert [gen['step'] for gen in resumed_stats] == [3, 4]
+    assert [gen['evaluations'] for gen in resumed_stats] == [
+        gen['evaluations'] for gen in stats[3:]
+    ]
+
+
+@pytest.mark.parametrize('kwargs', [{'resume_from': 'checkpoint.pkl'}, {'checkpoint_every': 1}])
+def test_checkpoints_rejected_for_golem(tmp_path, kwargs):
+    """Configuration of GOLEM optimizer with checkpoints is invalid."""
+    with pytest.raises(ValidationError, match='gefest_ga'):
+        _params(tmp_path, None, 'moead', optimizer='golem_optimizer', **kwargs)
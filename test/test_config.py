@@ -118,3 +118,24 @@ opt_params = OptimizationParams(
         Perimeter(domain_cfg),
     ],
 )
+
+
+def make_params(log_dir, **overrides) -> OptimizationParams:
+    """Creates small GEFEST GA configuration for end-to-end tests, fields may be overridden."""
+    params = {
+        'domain': domain_cfg,
+        'n_steps': 2,
+        'pop_size': 10,
+        'mutations': ['rotate_poly', 'resize_poly', 'add_point', 'drop_point'],
+        'crossovers': ['polygon_level', 'structure_level'],
+        'selector': 'tournament_selection',
+        'postprocess_rules': ['not_out_of_bounds', 'valid_polygon_geom', 'not_self_intersects'],
+        'objectives': [Area(domain_cfg)],
+        'extra': 2,
+        'n_jobs': 0,
+        'estimation_n_jobs': 0,
+        'log_dir': str(log_dir),
+        'golem_genetic_scheme_type': 'steady_state',
+    }
+    params.update(overrides)
+    return OptimizationParams(**params)
@@ -504,3 +504,17 @@ def test_get_random_point_in_shapey_geom(shapely_geom, expectation):
     with expectation:
         point = geometry.get_random_point_in_shapey_geom(shapely_geom)
         assert shapely_geom.contains(ShapelyPoint(point.coords))
+
+
+def test_get_random_points_in_shapely_geom_uniform():
+    """Points must be inside non-convex geometry with hole and distributed uniformly."""
+    l_shape = ShapelyPolygon(
+        [(0, 0), (100, 0), (100, 10), (10, 10), (10, 100), (0, 100)],
+        holes=[[(2, 2), (8, 2), (8, 8), (2, 8)]],
+    )
+    points = geometry.get_random_points_in_shapely_geom(l_shape, 5000)
+    assert points.shape == (5000, 2)
+    assert all(l_shape.contains(ShapelyPoint(p)) for p in points)
+
+    in_horizontal_part = np.mean((points[:, 0] > 10) & (points[:, 1] < 10))
+    assert abs(in_horizontal_part - 900 / l_shape.area) < 0.05
@@ -1,12 +1,23 @@
 from contextlib import nullcontext as no_exception
 
+import numpy as np
 import pytest
+from shapely.geometry import LineString
+from shapely.geometry import Point as ShapelyPoint
+from shapely.geometry import Polygon as ShapelyPolygon
 from shapely.ops import unary_union
 
 from gefest.core.geometry import Polygon, Structure
 from gefest.core.geometry.datastructs.point import Point
 from gefest.core.geometry.domain import Domain
-from gefest.core.geometry.utils import get_convex_safe_area
+from gefest.core.geometry.free_area import FreeArea
+from gefest.core.geometry.generators import PolygonGeneratorTypes
+from gefest.core.geometry.utils import (
+    _create_area,
+    get_convex_safe_area,
+    get_selfintersection_safe_point,
+)
+from gefest.core.utils.rng import set_seed
 
 
 class TestConvexSafeArea:
@@ -85,3 +96,73 @@ class TestConvexSafeArea:
             assert round(union.area, 6) == round(union.convex_hull.area, 6)
             if abs(point_right_idx - point_left_idx) == 1:
                 assert s_poly.intersection(movment_area).area == 0.0
+
+
+@pytest.mark.parametrize('generator', list(PolygonGeneratorTypes))
+@pytest.mark.parametrize('num_points', [3, 4, 15, 50])
+def test_polygon_generators_produce_valid_polygons(generator, num_points):
+    """Generated polygons must be simple, counterclockwise and fit unit box.
+
+    Convex polygons must be convex, star-shaped ones must be visible from points centroid.
+    """
+    batch = generator.value(20, num_points)
+    assert batch.shape == (20, num_points, 2)
+    assert np.all(batch >= 0) and np.all(batch <= 1)
+    for coords in batch:
+        poly = ShapelyPolygon(coords)
+        assert poly.is_valid
+        assert poly.exterior.is_ccw
+        if generator is PolygonGeneratorTypes.convex:
+            assert round(poly.area, 6) == round(poly.convex_hull.area, 6)
+        elif generator is PolygonGeneratorTypes.star_shaped:
+            center = coords.mean(axis=0)
+            assert all(poly.buffer(1e-9).contains(LineString([center, pt])) for pt in coords)
+
+
+def test_free_area_finds_empty_circle():
+    """Circle found in free area must not overlap added polygons and domain borders."""
+    domain = TestConvexSafeArea.domain
+    free_area = FreeArea(domain)
+    assert abs(free_area.max_empty_radius() - 50) < 100 / free_area.resolution
+
+    free_area.add(TestConvexSafeArea.test_poly1)
+    radius = free_area.max_empty_radius() * 0.95
+    center = free_area.get_random_center(radius)
+    circle = ShapelyPoint(center.x, center.y).buffer(radius)
+    assert free_area.area.buffer(1e-6).contains(circle)
+    poly = domain.geometry._poly_to_shapely_poly(TestConvexSafeArea.test_poly1)
+    assert not circle.intersects(poly)
+    assert free_area.get_random_center(100) is None
+
+
+@pytest.mark.parametrize('point_idx', range(6))
+def test_selfintersection_safe_point_keeps_polygon_simple(point_idx):
+    """Inserting found point between neighbours must not produce self intersections."""
+    domain = Domain(
+        allowed_area=[[0, 0], [0, 100], [100, 100], [100, 0], [0, 0]],
+        geometry_is_convex=False,
+        geometry_is_closed=True,
+    )
+    u_shape = Polygon(
+        [Point(*p) for p in [(20, 20), (80, 20), (80, 80), (60, 80), (60, 40), (40, 40)]],
+    )
+    set_seed(point_idx)
+    for _ in range(10):
+        point, _ = get_selfintersection_safe_point(u_shape, domain, point_idx, point_idx + 1)
+        if point is not None:
+            coords = [(p.x, p.y) for p in u_shape]
+            coords.insert(point_idx + 1, (point.x, point.y))
+            assert ShapelyPolygon(coords).is_valid
+
+
+def test_create_area_in_crowded_structure():
+    """Free radius less than min polygon size does not break area search."""
+    domain = TestConvexSafeArea.domain
+    crowded = Structure(
+        [Polygon([Point(x, y) for x, y in [(1, 1), (1, 99), (99, 99), (99, 1), (1, 1)]])],
+    )
+    free_area = FreeArea(domain, crowded)
+    set_seed(0)
+    for _ in range(20):
+        area = _create_area(domain, crowded, domain.geometry, free_area)
+        assert area is None or area[1] <= free_area.max_empty_radius()
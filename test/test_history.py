@@ -0,0 +1,73 @@
+from gefest.core.configs.optimization_params import OptimizationParams
+from gefest.core.geometry import Point, Polygon, Structure
+from gefest.core.utils.history import HistoryWriter, RunHistory
+from gefest.tools.optimizers.GA.GA import BaseGA
+from test.test_config import Area, domain_cfg
+
+
+def test_history_restores_generations(tmp_path):
+    """History stores each unique structure once and restores logged populations."""
+    opt_params = OptimizationParams(
+        domain=domain_cfg,
+        n_steps=3,
+        pop_size=10,
+        mutations=['rotate_poly', 'resize_poly', 'add_point', 'drop_point'],
+        crossovers=['polygon_level', 'structure_level'],
+        selector='tournament_selection',
+        postprocess_rules=['not_out_of_bounds', 'valid_polygon_geom', 'not_self_intersects'],
+        objectives=[Area(domain_cfg)],
+        extra=2,
+        n_jobs=0,
+        estimation_n_jobs=0,
+        log_dir=str(tmp_path),
+        log_format='history',
+        golem_genetic_scheme_type='steady_state',
+        rng=0,
+    )
+    optimizer = BaseGA(opt_params)
+    pop = optimizer.optimize()
+    history = RunHistory(optimizer.log_dispatcher.run_dir)
+
+    assert history.steps == ['00000_init', '1', '2', '3']
+    assert len(history) < sum(len(members) for members in history.generations.values())
+    restored = history.generation('3')
+    assert [ind.polygons for ind in restored] == [ind.polygons for ind in pop]
+    assert [ind.fitness for ind in restored] == [ind.fitness for ind in pop]
+    assert all('lineage' not in ind.extra_characteristics for ind in pop)
+
+    born = [idx for idx in history.generations['3'] if history.lineage(idx) is not None]
+    assert born
+    for idx in born:
+        lineage = history.lineage(idx)
+        assert lineage['operators']
+        assert all(isinstance(parent, int) and parent < idx for parent in lineage['parents'])
+        assert set(lineage['parents']) <= set(history.ancestors(idx))
+
+
+def _structures(*xs):
+    return [
+        Structure([Polygon([Point(x, y) for y in (0, 5, 10)] + [Point(x + 5, 5)])]) for x in xs
+    ]
+
+
+def test_history_is_overwritten_unless_resumed(tmp_path):
+    """New run in the same directory starts new history, resumed run continues it."""
+    for _ in range(2):
+        writer = HistoryWriter(str(tmp_path))
+        writer.write(_structures(0, 10), '1')
+        writer.close()
+
+    history = RunHistory(str(tmp_path))
+    assert len(history) == 2
+    assert history.steps == ['1']
+
+    writer = HistoryWriter(str(tmp_path), resume=True)
+    writer.write(_structures(10, 20), '2')
+    writer.close()
+
+    history = RunHistory(str(tmp_path))
+    assert len(history) == 3
+    assert history.generations == {'1': [0, 1], '2': [1, 2]}
+    assert [ind[0].points for ind in history.generation('2')] == [
+        ind[0].points for ind in _structures(10, 20)
+    ]
@@ -0,0 +1,77 @@
+import subprocess
+import sys
+
+import pytest
+
+from gefest.core.configs.optimization_params import OptimizationParams
+from gefest.tools.optimizers import OptimizerTypes
+from gefest.tools.optimizers.GA.GA import BaseGA
+from test.test_config import Area, domain_cfg
+
+HEAVY_MODULES = ['golem', 'hyperopt', 'moviepy', 'torch', 'tensorflow']
+
+
+def _imported_modules(code: str) -> list[str]:
+    check = f'{code}\nimport sys\nprint(*[m for m in {HEAVY_MODULES} if m in sys.modules])'
+    result = subprocess.run([sys.executable, '-c', check], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    return result.stdout.split()
+
+
+@pytest.mark.parametrize(
+    'module',
+    [
+        'gefest.core.configs.optimization_params',
+        'gefest.tools.run_experiment',
+        'gefest.tools.estimators',
+        'gefest.tools.optimizers',
+        'gefest.core.viz.struct_vizualizer',
+    ],
+)
+def test_import_does_not_load_backends(module):
+    """GOLEM, tuner, video and neural networks backends are not imported with GEFEST modules."""
+    assert _imported_modules(f'import {module}') == []
+
+
+def test_gefest_ga_run_does_not_load_golem():
+    """Configuration of GEFEST GA without tuner does not import GOLEM."""
+    code = (
+        'from gefest.core.configs.optimization_params import OptimizationParams\n'
+        'from gefest.core.geometry.domain import Domain\n'
+        'opt_params = OptimizationParams(\n'
+        '    domain=Domain(allowed_area=[[0, 0], [0, 100], [100, 100], [100, 0], [0, 0]]),\n'
+        '    n_steps=1,\n'
+        '    pop_size=5,\n'
+        "    mutations=['rotate_poly'],\n"
+        "    crossovers=['structure_level'],\n"
+        "    selector='tournament_selection',\n"
+        "    postprocess_rules=['not_out_of_bounds'],\n"
+        '    objectives=[],\n'
+        '    n_jobs=0,\n'
+        ')\n'
+        "assert opt_params.optimizer.__name__ == 'BaseGA'"
+    )
+    assert _imported_modules(code) == []
+
+
+def test_lazy_optimizers():
+    """Optimizers are resolved on configuration and package attribute access."""
+    opt_params = OptimizationParams(
+        domain=domain_cfg,
+        n_steps=1,
+        pop_size=5,
+        mutations=['rotate_poly'],
+        crossovers=['structure_level'],
+        selector='tournament_selection',
+        postprocess_rules=['not_out_of_bounds'],
+        objectives=[Area(domain_cfg)],
+        optimizer='golem_optimizer',
+        n_jobs=0,
+    )
+    from gefest.tools.optimizers import StandardOptimizer
+
+    assert opt_params.optimizer is StandardOptimizer
+    assert opt_params.golem_adapter.domain is domain_cfg
+    assert OptimizerTypes.gefest_ga.value.load() is BaseGA
+    with pytest.raises(AttributeError):
+        getattr(sys.modules['gefest.tools.optimizers'], 'UnknownOptimizer')
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from gefest.core.geometry.datastructs.packed import PackedPopulation
+from gefest.core.utils.loaders import iter_structs, load_generation, load_packed
+from gefest.core.utils.logger import LogDispatcher
+from test.test_parallel import _random_pop
+
+
+def _best(pop, top_k):
+    return sorted(pop, key=lambda ind: (not ind.fitness, tuple(ind.fitness)))[:top_k]
+
+
+def _log(tmp_path, pop, log_format='json'):
+    dispatcher = LogDispatcher(str(tmp_path), 'run', log_format=log_format)
+    dispatcher.log_pop(pop, '3')
+    dispatcher.close()
+    return dispatcher.run_dir
+
+
+@pytest.mark.parametrize('trusted', [True, False])
+def test_iter_structs(tmp_path, trusted):
+    """Streamed structures are equal with and without validation, top-k are ordered by fitness."""
+    pop = _random_pop(20)
+    path = f'{_log(tmp_path, pop)}/00003.log'
+
+    assert list(iter_structs(path, trusted)) == pop
+    assert list(iter_structs(path, trusted, top_k=5)) == _best(pop, 5)
+
+
+def test_load_packed(tmp_path):
+    """Json lines logs are decoded into the same arrays as packed population."""
+    pop = _random_pop(20)
+    path = f'{_log(tmp_path, pop)}/00003.log'
+    expected = PackedPopulation.pack(_best(pop, 7)).arrays()
+
+    for name, values in load_packed(path, top_k=7).arrays().items():
+        np.testing.assert_array_equal(values, expected[name])
+
+
+@pytest.mark.parametrize('log_format', ['json', 'npz', 'history'])
+def test_load_generation(tmp_path, log_format):
+    """Populations are loaded from logs of any format."""
+    pop = _random_pop(20)
+    run_dir = _log(tmp_path, pop, log_format)
+
+    assert load_generation(run_dir, 3) == pop
+    assert load_generation(run_dir, '00003', top_k=4) == _best(pop, 4)
+    with pytest.raises(FileNotFoundError):
+        load_generation(run_dir, 4)
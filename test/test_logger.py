@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from gefest.core.geometry.datastructs.packed import PackedPopulation
+from gefest.core.utils.functions import parse_structs
+from gefest.core.utils.logger import LogDispatcher
+from test.test_parallel import _random_pop
+
+
+@pytest.mark.parametrize('background', [True, False])
+def test_json_log_is_readable(tmp_path, background):
+    """Json lines logs are restored by ``parse_structs``."""
+    pop = _random_pop()
+    dispatcher = LogDispatcher(str(tmp_path), 'run', background=background)
+    dispatcher.log_pop(pop, '1')
+    dispatcher.close()
+    assert parse_structs(f'{dispatcher.run_dir}/00001.log') == pop
+
+
+def test_npz_log_keeps_arrays(tmp_path):
+    """Npz logs contain packed population arrays."""
+    pop = _random_pop()
+    dispatcher = LogDispatcher(str(tmp_path), 'run', log_format='npz')
+    dispatcher.log_pop(pop, '1')
+    pop[0].fitness = [-1.0]
+    dispatcher.flush()
+
+    with np.load(f'{dispatcher.run_dir}/00001.npz') as arrays:
+        fields = {name: arrays[name] for name in PackedPopulation.fields}
+        assert len(arrays['extra_characteristics']) == len(pop)
+
+    pop[0].fitness = []
+    assert PackedPopulation(**fields).unpack() == pop
+    dispatcher.close()
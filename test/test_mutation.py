@@ -2,9 +2,15 @@ import pytest
 
 from gefest.core.geometry import Point, Polygon, Structure
 from gefest.core.geometry.domain import Domain
-from gefest.core.opt.operators.mutations import add_poly_mutation, drop_poly_mutation
+from gefest.core.opt.operators.mutations import (
+    add_point_mutation,
+    add_poly_mutation,
+    drop_point_mutation,
+    drop_poly_mutation,
+)
 from gefest.core.opt.operators.mutations import mutate_structure as mutation
 from gefest.core.opt.operators.mutations import (
+    pos_change_point_mutation,
     resize_poly_mutation,
     rotate_poly_mutation,
 )
@@ -129,3 +135,91 @@ def test_mutation_rotate_resize_poly(mut_oper, operat_prob, expected_result):
 
     if mut_oper == [resize_poly_mutation]:
         assert count_resize_poly > expected_result
+
+
+def test_structure_clone_shares_polygons():
+    """Tests that clone shares polygons but not polygons tuple and fitness."""
+    original = Structure([create_rectangle(5, 5), create_rectangle(15, 15)], fitness=[1.0])
+    cloned = original.clone()
+    cloned.fitness.append(2.0)
+    cloned[0] = create_rectangle(50, 50)
+
+    assert cloned.polygons[1] is original.polygons[1]
+    assert original.polygons[0].points == create_rectangle(5, 5).points
+    assert original.fitness == [1.0]
+
+
+@pytest.mark.parametrize(
+    'mut_oper',
+    [
+        [drop_point_mutation],
+        [add_point_mutation],
+        [pos_change_point_mutation],
+    ],
+)
+def test_mutation_keeps_parent_unchanged(mut_oper):
+    """Tests that copy-on-write mutations do not modify parent structure."""
+    parent = Structure([create_rectangle(5, 5), create_rectangle(5, 15), create_rectangle(15, 5)])
+    parent_points = [[(p.x, p.y) for p in poly] for poly in parent]
+    for _ in range(10):
+        mutation(
+            parent,
+            domain,
+            operations=mut_oper,
+            operation_chance=0.9999,
+            operations_probs=[1],
+        )
+
+    assert [[(p.x, p.y) for p in poly] for poly in parent] == parent_points
+
+
+def test_lineage_records_changing_mutations_only():
+    """Mutation which leaves structure unchanged is not recorded into lineage."""
+    unchanged = mutation(
+        structure,
+        domain,
+        operations=[add_poly_mutation],
+        operation_chance=0.9999,
+        operations_probs=[1],
+        record_lineage=True,
+    )
+    resized = mutation(
+        structure,
+        domain,
+        operations=[resize_poly_mutation],
+        operation_chance=0.9999,
+        operations_probs=[1],
+        record_lineage=True,
+    )
+    not_recorded = mutation(
+        structure,
+        domain,
+        operations=[resize_poly_mutation],
+        operation_chance=0.9999,
+        operations_probs=[1],
+    )
+
+    assert unchanged.polygons == structure.polygons
+    assert 'lineage' not in unchanged.extra_characteristics
+    assert set(resized.extra_characteristics['lineage']['operators']) == {'resize_poly_mutation'}
+    assert 'lineage' not in not_recorded.extra_characteristics
+
+
+def _drop_all_polygons(new_structure, domain, idx_=None, **kwargs):
+    new_structure.polygons = ()
+    return new_structure
+
+
+def test_mutation_to_empty_structure():
+    """Empty structure is a valid mutation result and is recorded into lineage."""
+    emptied = mutation(
+        structure,
+        domain,
+        operations=[_drop_all_polygons],
+        operation_chance=0.9999,
+        operations_probs=[1],
+        record_lineage=True,
+    )
+
+    assert len(emptied) == 0
+    assert emptied.extra_characteristics['lineage']['operators'][0] == '_drop_all_polygons'
@@ -0,0 +1,139 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from gefest.core.opt.objective.objective import Objective
+from gefest.core.opt.objective.objective_eval import EstimatorCache, ObjectivesEvaluator
+from gefest.tools.estimators.estimator import Estimator
+from test.test_config import Area, domain_cfg
+from test.test_parallel import _random_pop
+
+
+class BatchArea(Area):
+    """Area objective which records sizes of evaluated batches."""
+
+    def __init__(self, domain):
+        super().__init__(domain)
+        self.batches = []
+
+    def evaluate_batch(self, inds):
+        self.batches.append(len(inds))
+        return super().evaluate_batch(inds)
+
+
+class PointsNumber(Estimator):
+    def estimate(self, struct):
+        return sum(len(poly) for poly in struct)
+
+
+class EstimatedPoints(Objective):
+    def _evaluate(self, ind):
+        return self.estimator(ind)
+
+    def evaluate_batch(self, inds):
+        return np.array(self.estimator.estimate_batch(inds))
+
+
+def _expected(pop):
+    area = Area(domain_cfg)
+    return [[area(ind), sum(len(poly) for poly in ind), area(ind)] for ind in pop]
+
+
+@pytest.mark.parametrize(
+    ('n_jobs', 'batch_size', 'batches'),
+    [(0, None, [10]), (0, 4, [4, 4, 2]), (2, 3, None)],
+)
+def test_batch_evaluation(n_jobs, batch_size, batches):
+    """Batch objectives get chunks of population, plain callables are called per structure."""
+    pop = _random_pop(10)
+    for ind in pop:
+        ind.fitness = []
+
+    expected = _expected(pop)
+    batch_area = BatchArea(domain_cfg)
+    evaluator = ObjectivesEvaluator(
+        [batch_area, EstimatedPoints(domain_cfg, PointsNumber()), Area(domain_cfg).__call__],
+        n_jobs,
+        0,
+        batch_size=batch_size,
+    )
+    evaluated = evaluator(pop)
+
+    if batches is not None:
+        assert batch_area.batches == batches
+
+    assert sorted(ind.fitness for ind in evaluated) == sorted(expected)
+    assert all(isinstance(value, float) for value in evaluated[0].fitness[::2])
+
+
+def test_batch_size_mismatch():
+    """Objective must return value for each structure of batch."""
+
+    class Broken(Area):
+        def evaluate_batch(self, inds):
+            return np.zeros(len(inds) - 1)
+
+    with pytest.raises(ValueError):
+        ObjectivesEvaluator([Broken(domain_cfg)], 0)(_random_pop(3))
+
+
+class PointsObjective(Objective):
+    def _evaluate(self, ind):
+        return self.estimator(ind)
+
+
+class CountingEstimator(PointsNumber):
+    def __init__(self):
+        self.calls = 0
+
+    def estimate(self, struct):
+        self.calls += 1
+        return super().estimate(struct)
+
+
+@pytest.mark.parametrize('cache_estimations', [True, False])
+def test_shared_estimations(cache_estimations):
+    """Objectives sharing estimator run it once for each unique structure."""
+    pop = _random_pop(4)
+    pop.append(pop[0].clone())
+    for ind in pop:
+        ind.fitness = []
+
+    estimator = CountingEstimator()
+    objectives = [
+        EstimatedPoints(domain_cfg, estimator),
+        PointsObjective(domain_cfg, estimator),
+        EstimatedPoints(domain_cfg, estimator),
+    ]
+    evaluated = ObjectivesEvaluator(objectives, 0, cache_estimations=cache_estimations)(pop)
+
+    assert estimator.calls == (4 if cache_estimations else 15)
+    assert all(len(set(ind.fitness)) == 1 for ind in evaluated)
+
+
+class CheckedObjective(PointsObjective):
+    """Objective which checks that shared original objectives are not modified."""
+
+    def __init__(self, domain, estimator, original):
+        super().__init__(domain, estimator)
+        self.original = original
+
+    def _evaluate(self, ind):
+        assert isinstance(self.estimator, EstimatorCache)
+        assert not isinstance(self.original.estimator, EstimatorCache)
+        return super()._evaluate(ind)
+
+
+def test_shared_estimations_in_threads():
+    """Evaluations sharing objectives concurrently do not modify them."""
+    estimator = CountingEstimator()
+    objectives = [PointsObjective(domain_cfg, estimator)]
+    objectives.append(CheckedObjective(domain_cfg, estimator, objectives[0]))
+    evaluator = ObjectivesEvaluator(objectives, 0, cache_estimations=True)
+    pops = [_random_pop(5, seed) for seed in range(8)]
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(lambda pop: evaluator.eval_batch(pop, objectives), pops))
+
+    assert all(obj.estimator is estimator for obj in objectives)
+    assert estimator.calls <= 5 * len(pops)
@@ -0,0 +1,132 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import numpy as np
+import pytest
+
+from gefest.core.geometry import Point, Polygon, PolyID, Structure
+from gefest.core.geometry.datastructs.packed import PackedPopulation
+from gefest.core.geometry.utils import get_random_structure
+from gefest.core.opt.postproc.resolve_errors import Postrocessor
+from gefest.core.opt.postproc.rules import Rules
+from gefest.core.utils.parallel_manager import BaseParallelDispatcher
+from gefest.core.utils.rng import get_rng
+from gefest.core.utils.shared_population import SharedCall, SharedPopulation, StructureDelta
+from test.test_config import domain_cfg
+
+
+def _random_pop(n_structures=10, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        Structure(
+            polygons=tuple(
+                Polygon([Point(*p) for p in rng.random((rng.integers(3, 8), 2))])
+                for _ in range(rng.integers(1, 4))
+            ),
+            fitness=list(rng.random(idx % 3)),
+        )
+        for idx in range(n_structures)
+    ]
+
+
+def _move_first_point(structure):
+    poly = structure[0].copy()
+    poly.points[0] = Point(-1.0, -1.0)
+    structure[0] = poly
+    return structure
+
+
+def test_packed_population_roundtrip():
+    """Unpacked structures are equal to packed ones, including ids and fitness."""
+    pop = _random_pop()
+    pop[0][0].id_ = PolyID.FIXED_POLY
+    unpacked = PackedPopulation.pack(pop).unpack()
+    assert unpacked == pop
+
+
+def test_shared_call_returns_deltas():
+    """Workers send back only changed polygons, unchanged ones stay shared."""
+    pop = _random_pop()
+    pop[3].extra_characteristics['tag'] = 1
+    with SharedPopulation(pop + pop[:2]) as shared:
+        call = SharedCall(_move_first_point, shared.handle)
+        deltas = [call(*shared.ref((ind,))) for ind in pop]
+        assert all(isinstance(delta, StructureDelta) for delta in deltas)
+        assert all(isinstance(poly, int) for delta in deltas for poly in delta.polygons[1:])
+        assert all(isinstance(delta.polygons[0], tuple) for delta in deltas)
+
+        result = [shared.decode(delta) for delta in deltas]
+
+    for ind, new in zip(pop, result):
+        assert new.id_ == ind.id_
+        assert new.fitness == []
+        assert new[0].points[0] == Point(-1.0, -1.0)
+        assert new[0].points[1:] == ind[0].points[1:]
+        assert all(a is b for a, b in zip(new.polygons[1:], ind.polygons[1:]))
+
+    assert result[3].extra_characteristics == {'tag': 1}
+
+
+def _square(x):
+    return x * x
+
+
+@pytest.mark.parametrize('backend', ['loky', 'threads'])
+def test_dispatcher_keeps_order_and_reuses_backend(backend):
+    """Results follow arguments order, one backend serves all calls of dispatcher."""
+    for batch_size in ['auto', 3]:
+        dispatcher = BaseParallelDispatcher(2, seed=0, backend=backend, batch_size=batch_size)
+        assert dispatcher.exec_parallel(_square, [(i,) for i in range(20)], flatten=False) == [
+            i * i for i in range(20)
+        ]
+        parallel = dispatcher._parallel
+        dispatcher.exec_parallel(_square, [(i,) for i in range(3)], flatten=False)
+        assert dispatcher._parallel is parallel
+        dispatcher.close()
+        assert dispatcher._parallel is None
+
+
+@pytest.mark.parametrize('n_jobs', [0, 2])
+def test_imap_unordered_yields_all_tasks(n_jobs):
+    """Streamed results carry their task indices."""
+    dispatcher = BaseParallelDispatcher(n_jobs, seed=0, backend='threads')
+    results = dict(dispatcher.imap_unordered(_square, [(i,) for i in range(10)]))
+    assert results == {i: i * i for i in range(10)}
+    assert dispatcher.telemetry.counters['tasks'] == 10
+    assert dispatcher.utilization(dispatcher.telemetry) is not None
+
+
+@pytest.mark.parametrize('backend', ['threads', 'loky', 'multiprocessing'])
+def test_imap_unordered_is_reentrant(backend):
+    """Streams and list calls of one dispatcher may be interleaved."""
+    dispatcher = BaseParallelDispatcher(2, seed=0, backend=backend, batch_size=2)
+    first = dispatcher.imap_unordered(_square, [(i,) for i in range(4)])
+    second = dispatcher.imap_unordered(_square, [(i,) for i in range(3)])
+    results = [next(first)]
+    assert dispatcher.exec_parallel(_square, [(i,) for i in range(3)], flatten=False) == [0, 1, 4]
+    assert dict(second) == {0: 0, 1: 1, 2: 4}
+    assert dict(results + list(first)) == {i: i * i for i in range(4)}
+    dispatcher.close()
+
+
+def test_threads_get_own_generators():
+    """Threads without seeded context never share generator."""
+    with ThreadPoolExecutor(4) as pool:
+        rngs = list(pool.map(lambda _: id(get_rng()), range(4)))
+
+    assert id(get_rng()) not in rngs
+
+
+def test_postprocess_in_threads():
+    """Postprocessing on threads backend of run dispatcher returns result for each structure."""
+    pop = [get_random_structure(domain_cfg) for _ in range(6)]
+    rules = [Rules.not_out_of_bounds.value, Rules.not_self_intersects.value]
+    dispatcher = BaseParallelDispatcher(2, 0, backend='threads')
+    result = dispatcher.exec_parallel(
+        partial(Postrocessor.apply_postprocess, rules=rules, domain=domain_cfg),
+        [(ind,) for ind in pop],
+        flatten=True,
+    )
+    dispatcher.close()
+    assert len(result) == len(pop)
+    assert all(isinstance(ind, Structure) for ind in result if ind is not None)
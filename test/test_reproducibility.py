@@ -0,0 +1,36 @@
+import pytest
+
+from gefest.tools.optimizers.GA.GA import BaseGA
+from test.test_config import make_params
+
+
+def _run(seed, log_dir, n_jobs=0, backend='loky'):
+    opt_params = make_params(
+        log_dir,
+        mutations=['rotate_poly', 'resize_poly', 'add_point', 'drop_point', 'pos_change_point'],
+        n_jobs=n_jobs,
+        rng=seed,
+        parallel_backend=backend,
+    )
+    pop = BaseGA(opt_params).optimize()
+    return [([[(p.x, p.y) for p in poly] for poly in ind], ind.fitness) for ind in pop]
+
+
+@pytest.mark.parametrize('seed', [0, 42])
+def test_equal_seeds_give_equal_populations(seed, tmp_path):
+    """Runs with equal seed produce identical populations, different seeds do not."""
+    first = _run(seed, tmp_path)
+    second = _run(seed, tmp_path)
+    other = _run(seed + 1, tmp_path)
+    assert first == second
+    assert first != other
+
+
+def test_results_do_not_depend_on_n_jobs(tmp_path):
+    """Each parallel task has its own generator stream, so workers number does not matter."""
+    assert _run(3, tmp_path, n_jobs=0) == _run(3, tmp_path, n_jobs=2)
+
+
+def test_threads_backend_gives_equal_results(tmp_path):
+    """Thread workers use the same generator streams as process ones."""
+    assert _run(5, tmp_path, n_jobs=2, backend='threads') == _run(5, tmp_path, n_jobs=0)
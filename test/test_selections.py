@@ -0,0 +1,207 @@
+import numpy as np
+import pytest
+
+from gefest.core.geometry import Population, Structure
+from gefest.core.opt.operators.multiobjective_selections import (
+    MOEAD,
+    NSGA2,
+    NSGA3,
+    SPEA2,
+    crowding_distance,
+    das_dennis_directions,
+    non_dominated_sort,
+    reference_directions,
+)
+from gefest.core.opt.operators.selections import roulette_selection, tournament_selection
+from gefest.core.utils.rng import set_seed
+
+
+def _reference_spea2(fitness):
+    """Straightforward SPEA2 strength, raw and density implementation."""
+    n = len(fitness)
+    dominate = [[i != j and all(fitness[i] <= fitness[j]) for j in range(n)] for i in range(n)]
+    strength = [sum(dominate[i]) for i in range(n)]
+    raw = [sum(strength[j] for j in range(n) if dominate[j][i]) for i in range(n)]
+    density = [
+        1 / (min(np.linalg.norm(fitness[i] - fitness[j]) for j in range(n) if j != i) + 2)
+        for i in range(n)
+    ]
+    return strength, raw, density
+
+
+@pytest.mark.parametrize('n_objectives', [2, 3])
+@pytest.mark.parametrize('fast_path_size', [1, 512])
+def test_spea2_fitness_matches_reference(n_objectives, fast_path_size):
+    """Vectorized and sweep based SPEA2 components must match pairwise definitions."""
+    rng = np.random.default_rng(0)
+    fitness = rng.integers(0, 6, size=(60, n_objectives)).astype(float)
+    pop = [Structure(fitness=list(f)) for f in fitness]
+    spea2 = SPEA2(single_demention_selection=None, init_pop=pop, steps=1)
+    spea2.fast_path_size = fast_path_size
+
+    strength, raw, density = _reference_spea2(fitness)
+    assert list(spea2.strength(pop)) == strength
+    assert list(spea2.raw(pop)) == raw
+    assert np.allclose(spea2.density(pop), density)
+
+
+def test_non_dominated_sort_matches_pairwise_definition():
+    """Individual of front k must be dominated only by individuals of previous fronts."""
+    rng = np.random.default_rng(1)
+    fitness = rng.integers(0, 8, size=(80, 3)).astype(float)
+    ranks = non_dominated_sort(fitness)
+
+    for i, f_i in enumerate(fitness):
+        dominators = [
+            ranks[j]
+            for j, f_j in enumerate(fitness)
+            if all(f_j <= f_i) and any(f_j < f_i)
+        ]
+        assert all(rank < ranks[i] for rank in dominators)
+        if ranks[i] > 0:
+            assert max(dominators) == ranks[i] - 1
+
+
+def test_crowding_distance_boundaries():
+    """Extreme points of front are infinitely crowded, inner points are finite."""
+    front = np.array([[0.0, 4.0], [1.0, 3.0], [2.0, 1.0], [4.0, 0.0]])
+    distances = crowding_distance(front)
+    assert np.isinf(distances[[0, 3]]).all()
+    assert np.allclose(distances[1:3], [(2 / 4 + 3 / 4), (3 / 4 + 3 / 4)])
+
+
+def test_das_dennis_directions():
+    """Directions lie on unit simplex and count is C(H + M - 1, M - 1)."""
+    directions = das_dennis_directions(4, 3)
+    assert directions.shape == (15, 3)
+    assert np.allclose(directions.sum(axis=1), 1)
+    assert len(np.unique(directions, axis=0)) == 15
+
+
+@pytest.mark.parametrize('selector_cls', [NSGA2, NSGA3])
+@pytest.mark.parametrize('n_objectives', [2, 3, 4])
+def test_nsga_selection_keeps_best_fronts(selector_cls, n_objectives):
+    """Selection takes whole better fronts first and does not change fitness."""
+    rng = np.random.default_rng(n_objectives)
+    fitness = rng.random((40, n_objectives))
+    pop = [Structure(fitness=list(f)) for f in fitness]
+    selector = selector_cls(single_demention_selection=None, init_pop=pop[:20], steps=1)
+
+    selected = selector(pop, 20)
+    assert len(selected) == 20
+    assert isinstance(selected, Population)
+    assert np.array_equal(selected.fitness, [ind.fitness for ind in selected])
+    assert len({id(ind) for ind in selected}) == 20
+    assert all(list(ind.fitness) == list(f) for ind, f in zip(pop, fitness))
+
+    ranks = non_dominated_sort(fitness)
+    selected_ranks = [ind.extra_characteristics['nsga_rank'] for ind in selected]
+    last_rank = max(selected_ranks)
+    assert sum(ranks < last_rank) == sum(r < last_rank for r in selected_ranks)
+
+
+@pytest.mark.parametrize('n_directions, n_obj', [(10, 2), (15, 3), (20, 3), (30, 4)])
+def test_reference_directions(n_directions, n_obj):
+    """Directions lie on unit simplex, are unique and include simplex vertices."""
+    directions = reference_directions(n_directions, n_obj)
+    assert directions.shape == (n_directions, n_obj)
+    assert np.allclose(directions.sum(axis=1), 1)
+    assert len(np.unique(directions, axis=0)) == n_directions
+    assert np.sum(directions.max(axis=1) == 1) == n_obj
+    if n_obj == 2:
+        assert np.allclose(np.sort(directions[:, 0]), np.linspace(0, 1, n_directions))
+
+
+def test_moead_scalarization_keeps_fitness():
+    """Tchebycheff values match per individual definition, fitness is unchanged."""
+    rng = np.random.default_rng(3)
+    init_pop = [Structure(fitness=list(f)) for f in rng.random((10, 3)) + 1]
+    moead = MOEAD(tournament_selection, init_pop, moead_n_neighbors=2)
+
+    fitness = rng.random((25, 3))
+    pop = [Structure(fitness=list(f)) for f in fitness]
+    selected = moead(pop, 10)
+
+    assert len(selected) == 10
+    assert all(any(ind is orig for orig in pop) for ind in selected)
+    assert all(list(ind.fitness) == list(f) for ind, f in zip(pop, fitness))
+    assert np.allclose(moead.ideal, fitness.min(axis=0))
+
+    weights = reference_directions(len(pop), 3)
+    for ind, f, w in zip(pop, fitness, weights):
+        expected = max(
+            abs(f[n] - moead.ideal[n]) * (0.0001 if w[n] == 0 else w[n]) for n in range(3)
+        )
+        assert np.isclose(ind.extra_characteristics['moead_fitness'], expected + 2)
+
+
+def test_population_fitness_matrix_in_sync():
+    """Fitness matrix follows list changes and fitness updates."""
+    rng = np.random.default_rng(4)
+    fitness = rng.integers(0, 5, size=(30, 2)).astype(float)
+    pop = Population(Structure(fitness=list(f)) for f in fitness)
+    assert np.array_equal(pop.fitness, fitness)
+
+    pop.set_fitness(3, [-1.0, 0.0])
+    assert list(pop[3].fitness) == [-1.0, 0.0]
+    assert np.array_equal(pop.fitness[3], [-1.0, 0.0])
+
+    pop.extend([Structure(fitness=[7.0, 7.0]), Structure()])
+    assert pop.fitness.shape == (32, 2)
+    assert np.isnan(pop.fitness[-1]).all()
+
+    del pop[-1]
+    expected = sorted(pop, key=lambda x: x.fitness)
+    assert [id(ind) for ind in pop.sorted()] == [id(ind) for ind in expected]
+    assert np.array_equal(pop.sorted().fitness, [ind.fitness for ind in expected])
+
+
+def test_population_fitness_written_through_container():
+    """Fitness matrix is updated by set_fitness, selected populations get own matrices."""
+    pop = Population(Structure(fitness=[float(f)]) for f in range(5))
+    top = pop.take([0, 1])
+    assert np.array_equal(pop.fitness[:, 0], range(5))
+
+    pop.set_fitness(2, [-1.0])
+    pop.set_fitness(0, [10.0])
+    assert np.array_equal(pop.fitness[:, 0], [10, 1, -1, 3, 4])
+    assert list(pop.argsort()) == [2, 1, 3, 4, 0]
+    assert np.array_equal(top.fitness[:, 0], [0, 1])
+
+    pop.set_fitness(1, [])
+    assert np.isnan(pop.fitness[1]).all()
+    pop[1] = Structure(fitness=[5.0])
+    assert pop.fitness[1, 0] == 5.0
+
+
+def test_population_top_k():
+    """Top-k by argpartition matches full sort for single objective."""
+    rng = np.random.default_rng(5)
+    pop = Population(Structure(fitness=[f]) for f in rng.random(50))
+    assert list(pop.top_k(7)) == list(pop.argsort()[:7])
+    assert list(pop.top_k(100)) == list(pop.argsort())
+
+
+@pytest.mark.parametrize('pop_size', [10, 50, 80])
+def test_tournament_selection_unique_individuals(pop_size):
+    """Tournament selection chooses individuals without repeats while possible."""
+    set_seed(6)
+    pop = [Structure(fitness=[f]) for f in np.random.default_rng(6).random(50)]
+    selected = tournament_selection(pop, pop_size, fraction=0.2)
+    ids = [id(ind) for ind in selected]
+    assert len(selected) == pop_size
+    assert isinstance(selected, Population)
+    assert np.array_equal(selected.fitness[:, 0], [ind.fitness[0] for ind in selected])
+    assert len(set(ids)) == min(pop_size, len(pop))
+    if pop_size == 50:
+        best = min(pop, key=lambda ind: ind.fitness)
+        assert id(best) in ids
+
+
+def test_roulette_selection_prefers_lower_fitness():
+    """Roulette draws the whole selection with probabilities inverse to fitness."""
+    set_seed(7)
+    pop = [Structure(fitness=[1.0]), Structure(fitness=[9.0])]
+    selected = roulette_selection(pop, 1000)
+    assert len(selected) == 1000
+    assert 850 < sum(ind is pop[0] for ind in selected) < 950
@@ -0,0 +1,24 @@
+import json
+
+from gefest.tools.optimizers.GA.GA import BaseGA
+from test.test_config import make_params
+
+
+def test_generation_telemetry(tmp_path):
+    """Telemetry of each generation is passed to callback and written as json lines."""
+    received = []
+    opt_params = make_params(tmp_path, telemetry_callback=received.append)
+    BaseGA(opt_params).optimize()
+
+    assert [stats['step'] for stats in received] == [0, 1, 2]
+    assert received[0]['evaluations'] == 10
+    for stats in received[1:]:
+        assert {'selection', 'crossover', 'mutation', 'postprocessing', 'evaluation'} <= set(
+            stats['timings'],
+        )
+        assert 0 < stats['reused_fitness_share'] < 1
+        assert stats['invalid_offspring'] <= stats['offspring']
+        assert 0 < stats['worker_utilization']['reproduction'] <= 1
+
+    [log_file] = tmp_path.glob('*/telemetry.jsonl')
+    assert [json.loads(line) for line in log_file.read_text().splitlines()] == received
@@ -0,0 +1,31 @@
+import imageio
+import pytest
+
+from gefest.core.viz.struct_vizualizer import GIFMaker, render_frame
+from test.test_config import domain_cfg
+from test.test_parallel import _random_pop
+
+
+def test_render_frame():
+    """Frame is RGB image of requested size."""
+    frame = render_frame(_random_pop(1)[0], domain_cfg, size=(320, 240))
+    assert frame.shape == (240, 320, 3)
+    assert frame.min() < frame.max()
+    with_legend = render_frame(_random_pop(1)[0], domain_cfg, {'fitness': [1.0]}, (320, 240))
+    assert (with_legend != frame).any()
+
+
+@pytest.mark.parametrize('n_jobs', [0, 2])
+def test_render_streams_frames_in_order(tmp_path, n_jobs):
+    """Rendered video has one frame per structure in structures order."""
+    pop = _random_pop(5)
+    GIFMaker(domain_cfg, n_jobs=n_jobs).render(pop, str(tmp_path / 'pop'), duration=500)
+
+    with imageio.get_reader(str(tmp_path / 'pop.mp4')) as reader:
+        frames = [reader.get_data(idx) for idx in range(reader.count_frames())]
+
+    assert len(frames) == len(pop)
+    expected = [render_frame(ind, domain_cfg) for ind in pop]
+    for idx, frame in enumerate(frames):
+        errors = [abs(frame.astype(int) - other).mean() for other in expected]
+        assert min(range(len(errors)), key=errors.__getitem__) == idx
@@ -0,0 +1,47 @@
+import pytest
+
+from gefest.core.geometry.domain import Domain
+from gefest.core.opt.warm_start import warm_start
+from gefest.tools.optimizers.GA.GA import BaseGA
+from test.test_config import Area, Perimeter, domain_cfg, make_params
+
+
+def _params(log_dir, objective=Area, domain=domain_cfg, **kwargs):
+    return make_params(log_dir, domain=domain, objectives=[objective(domain)], rng=1, **kwargs)
+
+
+@pytest.fixture
+def previous_run(tmp_path):
+    optimizer = BaseGA(_params(tmp_path))
+    pop = optimizer.optimize()
+    return optimizer.log_dispatcher.run_dir, pop
+
+
+@pytest.mark.parametrize('log_format', ['json', 'history'])
+def test_warm_start_reuses_fitness(tmp_path, log_format):
+    """Best structures of previous run are not evaluated again with the same objectives."""
+    optimizer = BaseGA(_params(tmp_path, log_format=log_format))
+    expected = optimizer.optimize()[:5]
+    run_dir = optimizer.log_dispatcher.run_dir
+
+    stats = []
+    BaseGA(_params(tmp_path, warm_start_from=run_dir, pop_size=5, telemetry_callback=stats.append))
+    assert stats[0]['evaluations'] == 0
+    assert warm_start(run_dir, _params(tmp_path), top_k=5) == expected
+
+
+def test_warm_start_validates_structures(tmp_path, previous_run):
+    """Fitness of other objectives is dropped, structures invalid in new domain are skipped."""
+    run_dir, pop = previous_run
+    loaded = warm_start(run_dir, _params(tmp_path, Perimeter))
+    assert [ind.polygons for ind in loaded] == [ind.polygons for ind in pop[:10]]
+    assert all(not ind.fitness for ind in loaded)
+
+    two_polygons = Domain(
+        allowed_area=[[0, 0], [0, 100], [100, 100], [100, 0], [0, 0]],
+        min_poly_num=2,
+        max_poly_num=2,
+        geometry_is_convex=True,
+        geometry_is_closed=True,
+    )
+    assert warm_start(run_dir, _params(tmp_path, domain=two_polygons)) == []